@@ -1,35 +1,8 @@
 """superqt is a collection of Qt components for python."""
 
-from importlib.metadata import PackageNotFoundError, version
+from importlib import import_module
 from typing import TYPE_CHECKING, Any
 
-try:
-    __version__ = version("superqt")
-except PackageNotFoundError:
-    __version__ = "unknown"
-
-from .collapsible import QCollapsible
-from .combobox import QColorComboBox, QEnumComboBox, QSearchableComboBox
-from .elidable import QElidingLabel, QElidingLineEdit
-from .selection import QSearchableListWidget, QSearchableTreeWidget
-from .sliders import (
-    QDoubleRangeSlider,
-    QDoubleSlider,
-    QLabeledDoubleRangeSlider,
-    QLabeledDoubleSlider,
-    QLabeledRangeSlider,
-    QLabeledSlider,
-    QRangeSlider,
-)
-from .spinbox import QLargeIntSpinBox
-from .switch import QToggleSwitch
-from .utils import (
-    QFlowLayout,
-    QMessageHandler,
-    ensure_main_thread,
-    ensure_object_thread,
-)
-
 __all__ = [
     "QCollapsible",
     "QColorComboBox",
@@ -49,31 +22,93 @@ __all__ = [
     "QMessageHandler",
     "QQuantity",
     "QRangeSlider",
+    "QRangeSliderItemDelegate",
     "QSearchableComboBox",
     "QSearchableListWidget",
     "QSearchableTreeWidget",
+    "QSliderItemDelegate",
     "QToggleSwitch",
     "ensure_main_thread",
     "ensure_object_thread",
 ]
 
 if TYPE_CHECKING:
-    from .combobox import QColormapComboBox
+    from .cmap import QColormapComboBox
+    from .collapsible import QCollapsible
+    from .combobox import QColorComboBox, QEnumComboBox, QSearchableComboBox
+    from .elidable import QElidingLabel, QElidingLineEdit
     from .iconify import QIconifyIcon
+    from .selection import QSearchableListWidget, QSearchableTreeWidget
+    from .sliders import (
+        QDoubleRangeSlider,
+        QDoubleSlider,
+        QLabeledDoubleRangeSlider,
+        QLabeledDoubleSlider,
+        QLabeledRangeSlider,
+        QLabeledSlider,
+        QRangeSlider,
+        QRangeSliderItemDelegate,
+        QSliderItemDelegate,
+    )
+    from .spinbox import QLargeIntSpinBox
     from .spinbox._quantity import QQuantity
+    from .switch import QToggleSwitch
+    from .utils import (
+        QFlowLayout,
+        QMessageHandler,
+        ensure_main_thread,
+        ensure_object_thread,
+    )
+
+# public name -> module providing it.  Modules are only imported (along with Qt)
+# when one of their names is first accessed, to keep `import superqt` cheap.
+_LAZY_IMPORTS = {
+    "QCollapsible": ".collapsible",
+    "QColorComboBox": ".combobox",
+    "QColormapComboBox": ".cmap",
+    "QDoubleRangeSlider": ".sliders",
+    "QDoubleSlider": ".sliders",
+    "QElidingLabel": ".elidable",
+    "QElidingLineEdit": ".elidable",
+    "QEnumComboBox": ".combobox",
+    "QFlowLayout": ".utils",
+    "QIconifyIcon": ".iconify",
+    "QLabeledDoubleRangeSlider": ".sliders",
+    "QLabeledDoubleSlider": ".sliders",
+    "QLabeledRangeSlider": ".sliders",
+    "QLabeledSlider": ".sliders",
+    "QLargeIntSpinBox": ".spinbox",
+    "QMessageHandler": ".utils",
+    "QQuantity": ".spinbox._quantity",
+    "QRangeSlider": ".sliders",
+    "QRangeSliderItemDelegate": ".sliders",
+    "QSearchableComboBox": ".combobox",
+    "QSearchableListWidget": ".selection",
+    "QSearchableTreeWidget": ".selection",
+    "QSliderItemDelegate": ".sliders",
+    "QToggleSwitch": ".switch",
+    "ensure_main_thread": ".utils",
+    "ensure_object_thread": ".utils",
+}
 
 
 def __getattr__(name: str) -> Any:
-    if name == "QColormapComboBox":
-        from .cmap import QColormapComboBox
+    if name == "__version__":
+        # importlib.metadata is slow to import, so the version is looked up on demand
+        from importlib.metadata import PackageNotFoundError, version
 
-        return QColormapComboBox
-    if name == "QIconifyIcon":
-        from .iconify import QIconifyIcon
+        try:
+            value = version("superqt")
+        except PackageNotFoundError:
+            value = "unknown"
+        globals()[name] = value
+        return value
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-        return QIconifyIcon
-    if name == "QQuantity":
-        from .spinbox._quantity import QQuantity
 
-        return QQuantity
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__, "__version__"})
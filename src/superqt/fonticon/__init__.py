@@ -3,6 +3,7 @@ from __future__ import annotations
 __all__ = [
     "ENTRY_POINT",
     "Animation",
+    "GlyphAtlas",
     "IconFont",
     "IconFontMeta",
     "IconOpts",
@@ -10,20 +11,31 @@ __all__ = [
     "addFont",
     "font",
     "icon",
+    "iconCacheInfo",
+    "icons",
     "pulse",
+    "setAnimationFrameCache",
     "setTextIcon",
     "spin",
 ]
 
 from typing import TYPE_CHECKING
 
-from ._animations import Animation, pulse, spin
+from ._animations import Animation, pulse, setAnimationFrameCache, spin
+from ._atlas import GlyphAtlas
 from ._iconfont import IconFont, IconFontMeta
 from ._plugins import FontIconManager as _FIM
-from ._qfont_icon import DEFAULT_SCALING_FACTOR, IconOptionDict, IconOpts
+from ._qfont_icon import (
+    DEFAULT_SCALING_FACTOR,
+    IconCacheInfo,
+    IconOptionDict,
+    IconOpts,
+)
 from ._qfont_icon import QFontIconStore as _QFIS
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from qtpy.QtGui import QFont, QTransform
     from qtpy.QtWidgets import QWidget
 
@@ -96,7 +108,10 @@ def icon(
     -------
     QFontIcon
         A subclass of QIcon.  Can be used wherever QIcons are used, such as
-        `widget.setIcon()`
+        `widget.setIcon()`.  Each call returns a new icon, but icons without
+        animations share their engine: while an icon is alive, equivalent calls
+        reuse it (see [`iconCacheInfo`][superqt.fonticon.iconCacheInfo]).  Adding
+        a state to an icon doesn't modify the others.
 
     Examples
     --------
@@ -150,6 +165,66 @@ def icon(
     )
 
 
+def icons(
+    glyph_keys: Iterable[str],
+    scale_factor: float = DEFAULT_SCALING_FACTOR,
+    color: ValidColor | None = None,
+    opacity: float = 1,
+    animation: Animation | None = None,
+    transform: QTransform | None = None,
+    states: dict[str, IconOptionDict | IconOpts] | None = None,
+    sizes: Iterable[int] = (),
+) -> list[QFontIcon]:
+    """Create a QIcon for each of `glyph_keys`, all with the same settings.
+
+    This is faster than calling [`icon`][superqt.fonticon.icon] for each key: all keys
+    are checked (and their fonts loaded) in one pass, and the options are only
+    processed once.
+
+    Parameters
+    ----------
+    glyph_keys : Iterable[str]
+        Strings encapsulating a font-family, style, and glyph. e.g. 'fa5s.smile'.
+    scale_factor, color, opacity, animation, transform, states
+        Options applied to all icons, see [`icon`][superqt.fonticon.icon].
+    sizes : Iterable[int], optional
+        Sizes (in pixels) at which to render the pixmaps of all icons in advance,
+        so that they are already cached when first shown.  By default, none.
+
+    Returns
+    -------
+    list[QFontIcon]
+        The icons, in the order of `glyph_keys`.
+
+    Examples
+    --------
+    >>> open_icon, save_icon = icons(["fa5s.folder-open", "fa5s.save"], color="gray")
+    """
+    return _QFIS.instance().icons(
+        glyph_keys,
+        scale_factor=scale_factor,
+        color=color,
+        opacity=opacity,
+        animation=animation,
+        transform=transform,
+        states=states,
+        sizes=sizes,
+    )
+
+
+def iconCacheInfo() -> IconCacheInfo:
+    """Return statistics of the cache of icon engines shared by `icon()`.
+
+    Returns
+    -------
+    IconCacheInfo
+        Named tuple with the number of `hits` (calls that reused an existing engine),
+        `misses` (calls that created a shareable engine), and the `currsize` of the
+        cache (number of shared engines currently alive).
+    """
+    return _QFIS.iconCacheInfo()
+
+
 def setTextIcon(widget: QWidget, glyph_key: str, size: float | None = None) -> None:
     """Set text on a widget to a specific font & glyph.
 
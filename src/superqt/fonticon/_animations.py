@@ -1,25 +1,261 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import suppress
+from typing import TYPE_CHECKING, ClassVar
+from weakref import WeakKeyDictionary
 
-from qtpy.QtCore import QRectF, QTimer
-from qtpy.QtGui import QPainter
+from qtpy.QtCore import QObject, QRect, QRectF, QTimer
 from qtpy.QtWidgets import QWidget
 
+if TYPE_CHECKING:
+    from qtpy.QtGui import QPainter, QPixmap
+
+# number of steps an animation keeps running without being painted (e.g. because
+# its icon is hidden) before it pauses.  It resumes when the icon is painted again.
+_MAX_IDLE_STEPS = 3
+# fraction of the icon size by which a square grows when rotated: (sqrt(2) - 1) / 2
+_ROTATION_PAD = 0.21
+
+# LRU cache of pre-rendered frames of animated icons (key -> pixmap)
+_FRAMES: OrderedDict[str, QPixmap] = OrderedDict()
+_MAX_FRAMES = 720
+# angles of rotating animations are rounded to multiples of this (degrees)
+_ANGLE_STEP = 1.0
+
+
+def setAnimationFrameCache(
+    max_frames: int | None = None, angle_step: float | None = None
+) -> None:
+    """Configure the cache of pre-rendered frames of animated icons.
+
+    Frames of rotating animations (`spin` and `pulse`) are rendered once for each
+    icon, size and angle, and then reused.
+
+    Parameters
+    ----------
+    max_frames : int, optional
+        Maximum number of cached frames, by default 720.  Use 0 to disable the
+        cache (frames are then rendered from the font on every step).
+    angle_step : float, optional
+        Angles of rotation are rounded to multiples of `angle_step` degrees, by
+        default 1.  Larger steps mean fewer distinct frames (e.g. a `spin` with
+        `angle_step=10` has 36 frames per size), at the cost of smoothness.
+    """
+    global _MAX_FRAMES, _ANGLE_STEP
+    if max_frames is not None:
+        _MAX_FRAMES = max(0, max_frames)
+        while len(_FRAMES) > _MAX_FRAMES:
+            _FRAMES.popitem(last=False)
+    if angle_step is not None:
+        if angle_step <= 0:
+            raise ValueError("angle_step must be positive")
+        _ANGLE_STEP = angle_step
+        _FRAMES.clear()
+
+
+def _cached_frame(key: str) -> QPixmap | None:
+    if (pixmap := _FRAMES.get(key)) is not None:
+        _FRAMES.move_to_end(key)
+    return pixmap
+
+
+def _cache_frame(key: str, pixmap: QPixmap) -> None:
+    if _MAX_FRAMES:
+        _FRAMES[key] = pixmap
+        if len(_FRAMES) > _MAX_FRAMES:
+            _FRAMES.popitem(last=False)
+
+
+def _rotation_pad(width: int, height: int) -> int:
+    """Return the margin around a rect that contains its content at any angle."""
+    return round(max(width, height) * _ROTATION_PAD) + 1
+
+
+class _AnimationClock(QObject):
+    """Single timer driving all running animation timers.
+
+    The clock ticks at the shortest interval of the running timers, and stops when
+    no timer is running.
+    """
+
+    __instance: ClassVar[_AnimationClock | None] = None
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._tick)
+        # timer -> elapsed ms.  Timers are owned by their animations
+        self._running: WeakKeyDictionary[_AnimationTimer, int] = WeakKeyDictionary()
+
+    @classmethod
+    def instance(cls) -> _AnimationClock:
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def isActive(self) -> bool:
+        return self._timer.isActive()
+
+    def add(self, timer: _AnimationTimer, restart: bool = False) -> None:
+        if restart:
+            self._running[timer] = 0
+        else:
+            self._running.setdefault(timer, 0)
+        self._restart()
+
+    def discard(self, timer: _AnimationTimer) -> None:
+        if self._running.pop(timer, None) is not None:
+            self._restart()
+
+    def remainingTime(self, timer: _AnimationTimer) -> int:
+        """Return the number of ms until `timer` times out, or -1 if not running."""
+        if (elapsed := self._running.get(timer)) is None:
+            return -1
+        remaining = max(self._timer.remainingTime(), 0)
+        if tick := self._timer.interval():
+            ticks = max(-(-(timer.interval() - elapsed) // tick), 1)
+            remaining += (ticks - 1) * tick
+        # (coarse timers may be late by a few percent of their interval)
+        return min(remaining, timer.interval())
+
+    def _restart(self) -> None:
+        if not self._running:
+            self._timer.stop()
+            return
+        interval = min(t.interval() for t in self._running)
+        if interval != self._timer.interval() or not self._timer.isActive():
+            self._timer.start(interval)
+
+    def _tick(self) -> None:
+        if not self._running:  # all timers were garbage collected
+            self._timer.stop()
+            return
+        tick = self._timer.interval()
+        due = []
+        for timer, elapsed in list(self._running.items()):
+            elapsed += tick
+            if elapsed >= timer.interval():
+                elapsed -= timer.interval()
+                due.append(timer)
+            self._running[timer] = elapsed
+        for timer in due:
+            if timer in self._running:  # may be stopped by another timeout
+                if timer.isSingleShot():
+                    timer.stop()
+                timer.timeout.emit()
+
+
+class _AnimationTimer(QTimer):
+    """`QTimer` driven by the shared animation clock.
+
+    Starting the timer registers it with the clock instead of starting a system
+    timer of its own.  The rest of the `QTimer` API (interval, single shot,
+    remaining time...) behaves as usual.
+    """
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._active = False
+
+    def setInterval(self, msec: int) -> None:  # type: ignore [override]
+        super().setInterval(msec)
+        if self._active:
+            _AnimationClock.instance().add(self)
+
+    def isActive(self) -> bool:
+        return self._active
+
+    def remainingTime(self) -> int:
+        return _AnimationClock.instance().remainingTime(self)
+
+    def timerId(self) -> int:
+        return _AnimationClock.instance()._timer.timerId() if self._active else -1
+
+    def start(self, msec: int | None = None) -> None:  # type: ignore [override]
+        if msec is not None:
+            super().setInterval(msec)
+        self._active = True
+        _AnimationClock.instance().add(self, restart=True)
+
+    def stop(self) -> None:
+        self._active = False
+        _AnimationClock.instance().discard(self)
+
 
 class Animation(ABC):
-    """Base icon animation class."""
+    """Base icon animation class.
+
+    All animations are advanced by a single shared clock.  An animation pauses when
+    its icon hasn't been painted for a few steps (e.g. because it is hidden), and
+    resumes when the icon is painted again.
+    """
 
     def __init__(self, parent_widget: QWidget, interval: int = 10, step: int = 1):
         self.parent_widget = parent_widget
-        self.timer = QTimer()
+        self.timer: QTimer = _AnimationTimer()
         self.timer.timeout.connect(self._update)  # type: ignore
         self.timer.setInterval(interval)
         self._angle = 0
         self._step = step
+        # widgets painted on since the last step -> icon rects (None for everything)
+        self._dirty: dict[QWidget, list[QRect] | None] = {}
+        self._idle_steps = 0
+        self._paint_rect: QRectF | None = None
 
     def _update(self):
-        if self.timer.isActive():
-            self._angle += self._step
-            self.parent_widget.update()
+        if not self.timer.isActive():
+            return
+        if not self._dirty:
+            self._idle_steps += 1
+            if self._idle_steps > _MAX_IDLE_STEPS:
+                self.timer.stop()
+                return
+        self._angle += self._step
+        self._repaint()
+
+    def _repaint(self) -> None:
+        """Repaint the icons drawn since the last step, or the whole parent widget."""
+        dirty, self._dirty = self._dirty, {}
+        if not dirty and self.parent_widget is not None:
+            dirty = {self.parent_widget: None}
+        for widget, rects in dirty.items():
+            with suppress(RuntimeError):  # widget deleted
+                if rects is None:
+                    widget.update()
+                else:
+                    for rect in rects:
+                        widget.update(rect)
+
+    def _frame(self) -> float | None:
+        """Return the angle of the current frame, or None if frames can't be cached.
+
+        Only animations that just rotate the icon by this angle support cached
+        frames (and only while the frame cache is enabled).
+        """
+        return None
+
+    def _painting(self, painter: QPainter | None, rect: QRect) -> None:
+        """Record that the icon is being painted in `rect` with `painter`.
+
+        `painter` is None if a (cached) pixmap of the icon is being drawn.
+        """
+        if not self.timer.isActive():
+            self.timer.start()
+        self._idle_steps = 0
+        self._paint_rect = QRectF(rect)
+        device = painter.device() if painter is not None else None
+        if isinstance(device, QWidget):
+            mapped = painter.combinedTransform().mapRect(self._paint_rect)
+            rects = self._dirty.setdefault(device, [])
+            if rects is not None:
+                # grow the rect to include the icon at any angle of rotation
+                pad = _rotation_pad(rect.width(), rect.height())
+                rects.append(mapped.toAlignedRect().adjusted(-pad, -pad, pad, pad))
+        elif self.parent_widget is not None:
+            # painted into a pixmap, which is then drawn by the parent widget
+            self._dirty[self.parent_widget] = None
 
     @abstractmethod
     def animate(self, painter: QPainter):
@@ -27,15 +263,27 @@ class Animation(ABC):
 
 
 class spin(Animation):
-    """Animation that smoothly spins an icon."""
+    """Animation that smoothly spins an icon.
+
+    !!! note
+        The icon rotates around the center of the rect it is painted in.  Previous
+        versions rotated it around the center of the painter's viewport, i.e. of the
+        whole widget for icons painted directly on a widget.
+    """
+
+    def _frame(self) -> float | None:
+        return self._rotation() if _MAX_FRAMES else None
+
+    def _rotation(self) -> float:
+        return round((self._angle % 360) / _ANGLE_STEP) * _ANGLE_STEP % 360
 
     def animate(self, painter: QPainter):
         if not self.timer.isActive():
             self.timer.start()
 
-        mid = QRectF(painter.viewport()).center()
+        mid = (self._paint_rect or QRectF(painter.viewport())).center()
         painter.translate(mid)
-        painter.rotate(self._angle % 360)
+        painter.rotate(self._rotation())
         painter.translate(-mid)
 
 
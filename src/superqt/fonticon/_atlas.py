@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from qtpy.QtCore import QPoint, QRect, QRectF, QSize, Qt
+from qtpy.QtGui import QColor, QGuiApplication, QIcon, QIconEngine, QPainter, QPixmap
+from qtpy.QtWidgets import QApplication, QStyleOption
+
+from ._qfont_icon import DEFAULT_SCALING_FACTOR, QFontIconStore, _color_args
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from ._qfont_icon import ValidColor
+
+_ATLAS_VERSION = 1
+# maximum width of an atlas image, in pixels
+_MAX_ATLAS_WIDTH = 2048
+
+
+def _color_name(color: ValidColor) -> str:
+    """Return a normalized name for `color` ("" for the default color)."""
+    args = _color_args(color)
+    return QColor(*args).name(QColor.NameFormat.HexArgb) if args else ""
+
+
+class GlyphAtlas:
+    """Font icon glyphs pre-rendered into a single image.
+
+    An atlas is created from glyph keys with `render`, can be saved to an image plus
+    a JSON index with `save`, and loaded back with `load`.  Icons returned by `icon`
+    are drawn from the atlas image, without loading any font.
+
+    Examples
+    --------
+    >>> atlas = GlyphAtlas.render(["fa5s.smile", "fa5s.cog"], colors=[None, "red"])
+    >>> atlas.save("icons.png")  # writes icons.png and icons.json
+    >>> atlas = GlyphAtlas.load("icons.png")
+    >>> btn.setIcon(atlas.icon("fa5s.cog", color="red"))
+    """
+
+    def __init__(
+        self,
+        pixmap: QPixmap,
+        glyphs: dict[str, dict[str, dict[int, QRect]]],
+        device_pixel_ratio: float = 1,
+    ) -> None:
+        self._pixmap = pixmap
+        # glyph_key -> color name -> size -> rect in `pixmap` (in pixels)
+        self._glyphs = glyphs
+        self._dpr = device_pixel_ratio
+
+    @classmethod
+    def render(
+        cls,
+        glyph_keys: Iterable[str],
+        colors: Sequence[ValidColor] = (None,),
+        sizes: Sequence[int] = (16, 24, 32),
+        *,
+        scale_factor: float = DEFAULT_SCALING_FACTOR,
+        device_pixel_ratio: float = 1,
+    ) -> GlyphAtlas:
+        """Render each of `glyph_keys`, in each of `colors` and `sizes`, into an atlas.
+
+        Parameters
+        ----------
+        glyph_keys : Iterable[str]
+            Keys of the glyphs to render, e.g. `'fa5s.smile'`.
+        colors : Sequence[ValidColor]
+            Colors in which to render each glyph, by default only the default color.
+        sizes : Sequence[int]
+            Sizes (in logical pixels) at which to render each glyph, by default
+            (16, 24, 32).
+        scale_factor : float
+            Scale factor of the glyphs, as in `fonticon.icon`.  By default 0.875.
+        device_pixel_ratio : float
+            Device pixel ratio of the rendered glyphs, by default 1.
+        """
+        store = QFontIconStore.instance()
+        normal = (QIcon.Mode.Normal, QIcon.State.Off)
+        cells: list[tuple[str, str, int, QPixmap]] = []
+        for key in dict.fromkeys(glyph_keys):
+            for color in colors:
+                engine = store.icon(key, color=color, scale_factor=scale_factor)._engine
+                for size in sorted(set(sizes)):
+                    # render with the engine, which (unlike `QIcon.pixmap`) doesn't
+                    # depend on the device pixel ratio of the application
+                    pixmap = engine.scaledPixmap(
+                        QSize(size, size), *normal, device_pixel_ratio
+                    )
+                    # pack the cells in atlas (i.e. device) pixels
+                    pixmap.setDevicePixelRatio(1)
+                    cells.append((key, _color_name(color), size, pixmap))
+
+        # pack the cells in rows of (roughly) decreasing height
+        glyphs: dict[str, dict[str, dict[int, QRect]]] = {}
+        x = y = row_height = width = 0
+        for key, color_name, size, pixmap in sorted(
+            cells, key=lambda c: -c[3].height()
+        ):
+            if x and x + pixmap.width() > _MAX_ATLAS_WIDTH:
+                x, y, row_height = 0, y + row_height, 0
+            rect = QRect(QPoint(x, y), pixmap.size())
+            glyphs.setdefault(key, {}).setdefault(color_name, {})[size] = rect
+            x += pixmap.width()
+            width = max(width, x)
+            row_height = max(row_height, pixmap.height())
+
+        atlas = QPixmap(max(width, 1), max(y + row_height, 1))
+        atlas.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(atlas)
+        for key, color_name, size, pixmap in cells:
+            painter.drawPixmap(glyphs[key][color_name][size].topLeft(), pixmap)
+        painter.end()
+        return cls(atlas, glyphs, device_pixel_ratio)
+
+    def save(self, path: str | Path) -> None:
+        """Save the atlas image to `path`, and its index next to it (as `.json`)."""
+        path = Path(path)
+        if not self._pixmap.save(str(path)):
+            raise OSError(f"Could not save atlas image to {str(path)!r}")
+        index = {
+            "version": _ATLAS_VERSION,
+            "image": path.name,
+            "device_pixel_ratio": self._dpr,
+            "glyphs": {
+                key: {
+                    color_name: {str(size): r.getRect() for size, r in rects.items()}
+                    for color_name, rects in colors.items()
+                }
+                for key, colors in self._glyphs.items()
+            },
+        }
+        path.with_suffix(".json").write_text(json.dumps(index))
+
+    @classmethod
+    def load(cls, path: str | Path) -> GlyphAtlas:
+        """Load an atlas saved with `save`, from its image or index `path`."""
+        index_path = Path(path).with_suffix(".json")
+        index = json.loads(index_path.read_text())
+        if index.get("version") != _ATLAS_VERSION:
+            raise ValueError(f"Unsupported glyph atlas version in {str(index_path)!r}")
+        image = index_path.parent / index["image"]
+        pixmap = QPixmap(str(image))
+        if pixmap.isNull():
+            raise OSError(f"Could not load atlas image {str(image)!r}")
+        glyphs = {
+            key: {
+                color_name: {int(size): QRect(*r) for size, r in rects.items()}
+                for color_name, rects in colors.items()
+            }
+            for key, colors in index["glyphs"].items()
+        }
+        return cls(pixmap, glyphs, index["device_pixel_ratio"])
+
+    def keys(self) -> list[str]:
+        """Return the glyph keys in the atlas."""
+        return list(self._glyphs)
+
+    def pixmap(self) -> QPixmap:
+        """Return the atlas image."""
+        return self._pixmap
+
+    def icon(self, glyph_key: str, color: ValidColor = None) -> QIcon:
+        """Return an icon for `glyph_key` in `color`, drawn from the atlas.
+
+        Raises
+        ------
+        KeyError
+            If the glyph wasn't rendered in this color.
+        """
+        try:
+            rects = self._glyphs[glyph_key][_color_name(color)]
+        except KeyError:
+            raise KeyError(
+                f"Glyph {glyph_key!r} with color {color!r} is not in the atlas"
+            ) from None
+        return QIcon(_AtlasIconEngine(self._pixmap, rects))
+
+
+class _AtlasIconEngine(QIconEngine):
+    def __init__(self, atlas: QPixmap, rects: dict[int, QRect]) -> None:
+        super().__init__()
+        self._atlas = atlas
+        # size -> rect of the glyph in `atlas`, by increasing size
+        self._rects = dict(sorted(rects.items()))
+
+    def clone(self) -> QIconEngine:  # pragma: no cover
+        return _AtlasIconEngine(self._atlas, self._rects)
+
+    def _source(self, pixels: float) -> QRect:
+        """Return the rect of the smallest glyph at least `pixels` high."""
+        for rect in self._rects.values():
+            if rect.height() >= pixels:
+                return rect
+        return rect
+
+    def availableSizes(
+        self, mode: QIcon.Mode = QIcon.Mode.Normal, state: QIcon.State = QIcon.State.Off
+    ) -> list[QSize]:
+        return [QSize(size, size) for size in self._rects]
+
+    def paint(
+        self, painter: QPainter, rect: QRect, mode: QIcon.Mode, state: QIcon.State
+    ) -> None:
+        device = painter.device()
+        dpr = device.devicePixelRatioF() if device else 1.0
+        source = self._source(rect.height() * dpr)
+        painter.drawPixmap(QRectF(rect), self._atlas, QRectF(source))
+
+    def pixmap(self, size: QSize, mode: QIcon.Mode, state: QIcon.State) -> QPixmap:
+        return self.scaledPixmap(size, mode, state, 1.0)
+
+    def scaledPixmap(
+        self, size: QSize, mode: QIcon.Mode, state: QIcon.State, scale: float
+    ) -> QPixmap:
+        """Return a pixmap of `size` (in logical pixels) for a device pixel `scale`.
+
+        The pixmap is drawn from the smallest glyph of the atlas at least as large
+        as `size * scale` device pixels.
+        """
+        pixmap = QPixmap(size * scale)
+        if not size.isValid():
+            return pixmap
+        pixmap.setDevicePixelRatio(scale)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        self.paint(painter, QRect(QPoint(0, 0), size), mode, state)
+        painter.end()
+        if mode != QIcon.Mode.Normal:
+            opt = QStyleOption()
+            opt.palette = QGuiApplication.palette()
+            generated = QApplication.style().generatedIconPixmap(mode, pixmap, opt)
+            if not generated.isNull():
+                pixmap = generated
+        return pixmap
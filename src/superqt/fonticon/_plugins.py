@@ -1,19 +1,71 @@
 import contextlib
+import json
+import os
+import sys
+from collections.abc import Iterator, Mapping
+from pathlib import Path
 from typing import ClassVar
 
-from ._iconfont import IconFontMeta, namespace2font
+from superqt.utils._util import cache_dir
+
+from ._iconfont import FONTFILE_ATTR, IconFontMeta, namespace2font
 
 try:
     from importlib.metadata import EntryPoint, entry_points
 except ImportError:
     from importlib_metadata import EntryPoint, entry_points  # type: ignore
 
+# on-disk index of the font plugins (and their font files), see `_read_index`
+_INDEX_FILE = "fonticon_plugins.json"
+_INDEX_VERSION = 1
+
+
+def _environment_key() -> list[list]:
+    """Return a fingerprint of the installed distributions.
+
+    Installing, upgrading or removing a distribution adds or removes a `.dist-info`
+    directory, which changes the modification time of its `sys.path` entry.
+    """
+    key = []
+    for path in sys.path:
+        with contextlib.suppress(OSError):
+            key.append([path, os.stat(path or ".").st_mtime_ns])
+    return key
+
+
+class _LazyCharmap(Mapping):
+    """Charmap of the font provided by a plugin, only loaded when first used."""
+
+    def __init__(self, key: str) -> None:
+        self._key = key
+
+    def _charmap(self) -> Mapping[str, str]:
+        return vars(_manager._get_font_class(self._key))
+
+    def __getitem__(self, name: str) -> str:
+        return _manager._get_glyph(self._key, name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._charmap())
+
+    def __len__(self) -> int:
+        return len(self._charmap())
+
+    def __bool__(self) -> bool:
+        return True
+
 
 class FontIconManager:
     ENTRY_POINT: ClassVar[str] = "superqt.fonticon"
     _PLUGINS: ClassVar[dict[str, EntryPoint]] = {}
     _LOADED: ClassVar[dict[str, IconFontMeta]] = {}
+    # map of key -> object loaded from the entry point of the plugin
+    _NAMESPACES: ClassVar[dict[str, object]] = {}
     _BLOCKED: ClassVar[set[EntryPoint]] = set()
+    # map of key -> font file of the plugin, as recorded in the index
+    _FONT_FILES: ClassVar[dict[str, str]] = {}
+    # whether the on-disk index was already read
+    _INDEX_READ: ClassVar[bool] = False
 
     def _discover_fonts(self) -> None:
         self._PLUGINS.clear()
@@ -22,6 +74,64 @@ class FontIconManager:
         for ep in _entries:
             if ep not in self._BLOCKED:
                 self._PLUGINS[ep.name] = ep
+        self._write_index()
+
+    def _index_path(self) -> Path | None:
+        directory = cache_dir()
+        return directory / _INDEX_FILE if directory is not None else None
+
+    def _read_index(self) -> None:
+        """Read the plugins from the on-disk index, if it is up to date.
+
+        The index is only valid for the same set of installed distributions, so that
+        cold starts don't have to scan all entry points.
+        """
+        FontIconManager._INDEX_READ = True
+        if (path := self._index_path()) is None:
+            return
+        try:
+            index = json.loads(path.read_text())
+            if index["version"] != _INDEX_VERSION:
+                return
+            if index["environment"] != _environment_key():
+                return
+            plugins = {
+                name: EntryPoint(name, value, self.ENTRY_POINT)
+                for name, value in index["plugins"].items()
+            }
+            font_files = dict(index["font_files"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+        for name, ep in plugins.items():
+            if ep not in self._BLOCKED:
+                self._PLUGINS.setdefault(name, ep)
+        self._FONT_FILES.update(font_files)
+
+    def _write_index(self) -> None:
+        if (path := self._index_path()) is None:
+            return
+        index = {
+            "version": _INDEX_VERSION,
+            "environment": _environment_key(),
+            "plugins": {name: ep.value for name, ep in self._PLUGINS.items()},
+            "font_files": {
+                k: v for k, v in self._FONT_FILES.items() if k in self._PLUGINS
+            },
+        }
+        with contextlib.suppress(OSError):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(index))
+
+    def _get_entry_point(self, key: str) -> EntryPoint:
+        if key not in self._PLUGINS:
+            if not self._INDEX_READ:
+                self._read_index()
+            if key not in self._PLUGINS:
+                self._discover_fonts()
+        ep = self._PLUGINS.get(key)
+        if ep is None:
+            raise KeyError(f"No plugin provides the key {key!r}")
+        return ep
 
     def _get_font_class(self, key: str) -> IconFontMeta:
         """Get IconFont given a key.
@@ -46,33 +156,78 @@ class FontIconManager:
             If the entry point loads, but is not an IconFontMeta
         """
         if key not in self._LOADED:
-            # get the entrypoint
-            if key not in self._PLUGINS:
-                self._discover_fonts()
-            ep = self._PLUGINS.get(key)
-            if ep is None:
-                raise KeyError(f"No plugin provides the key {key!r}")
-
-            # load the entry point
-            try:
-                font = ep.load()
-            except Exception as e:
-                self._PLUGINS.pop(key)
-                self._BLOCKED.add(ep)
-                raise ImportError(f"Failed to load {ep.value}. Plugin blocked") from e
+            namespace = self._load_namespace(key)
 
             # make sure it's a proper IconFont
             try:
-                self._LOADED[key] = namespace2font(font, ep.name.upper())
+                self._LOADED[key] = namespace2font(namespace, key.upper())
             except Exception as e:
-                self._PLUGINS.pop(key)
+                ep = self._PLUGINS.pop(key)
+                self._NAMESPACES.pop(key)
                 self._BLOCKED.add(ep)
                 raise TypeError(
                     f"Failed to create fonticon from {ep.value}: {e}"
                 ) from e
         return self._LOADED[key]
 
+    def _load_namespace(self, key: str) -> object:
+        """Load the entry point of the plugin providing `key`."""
+        if key not in self._NAMESPACES:
+            # get the entrypoint
+            ep = self._get_entry_point(key)
+
+            # load the entry point
+            try:
+                self._NAMESPACES[key] = ep.load()
+            except Exception as e:
+                self._PLUGINS.pop(key)
+                self._BLOCKED.add(ep)
+                raise ImportError(f"Failed to load {ep.value}. Plugin blocked") from e
+        return self._NAMESPACES[key]
+
+    def _get_glyph(self, key: str, name: str) -> str:
+        """Get the glyph `name` of the plugin providing `key`.
+
+        Unlike `_get_font_class`, this doesn't convert the whole namespace of the
+        plugin to an IconFont.
+
+        Raises
+        ------
+        KeyError
+            If the plugin has no glyph `name`
+        """
+        if key in self._LOADED:
+            namespace: object = self._LOADED[key]
+        else:
+            namespace = self._load_namespace(key)
+        value = None if name.startswith("__") else getattr(namespace, name, None)
+        char = chr(value) if isinstance(value, int) else value
+        if not isinstance(char, str):
+            raise KeyError(name)
+        return char
+
+    def _get_font_file(self, key: str) -> str:
+        """Get the font file of the plugin providing `key`.
+
+        The font file is read from the index if possible, to avoid loading the plugin
+        (and its charmap) before it is needed.
+        """
+        self._get_entry_point(key)
+        font_file = self._FONT_FILES.get(key)
+        loaded = key in self._LOADED or key in self._NAMESPACES
+        if loaded or not font_file or not Path(font_file).exists():
+            font_file = getattr(self._load_namespace(key), FONTFILE_ATTR, None)
+            if not isinstance(font_file, str):
+                font_file = self._get_font_class(key).__font_file__
+            if isinstance(font_file, str) and font_file != self._FONT_FILES.get(key):
+                self._FONT_FILES[key] = font_file
+                self._write_index()
+        return font_file
+
     def dict(self) -> dict:
+        for key in list(self._NAMESPACES):
+            with contextlib.suppress(Exception):
+                self._get_font_class(key)
         return {
             key: sorted(filter(lambda x: not x.startswith("_"), cls.__dict__))
             for key, cls in self._LOADED.items()
@@ -81,6 +236,12 @@ class FontIconManager:
 
 _manager = FontIconManager()
 get_font_class = _manager._get_font_class
+get_font_file = _manager._get_font_file
+
+
+def get_charmap(key: str) -> Mapping[str, str]:
+    """Return the charmap of the plugin providing `key`, loaded on first use."""
+    return _LazyCharmap(key)
 
 
 def discover() -> tuple[str]:
@@ -97,7 +258,4 @@ def loaded(load_all=False) -> dict[str, list[str]]:
         for x in available():
             with contextlib.suppress(Exception):
                 _manager._get_font_class(x)
-    return {
-        key: sorted(filter(lambda x: not x.startswith("_"), cls.__dict__))
-        for key, cls in _manager._LOADED.items()
-    }
+    return _manager.dict()
@@ -1,22 +1,27 @@
 from __future__ import annotations
 
+import math
 import warnings
 from collections import abc, defaultdict
-from collections.abc import Sequence
-from dataclasses import dataclass
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import TYPE_CHECKING, ClassVar, TypeAlias, cast
+from typing import TYPE_CHECKING, ClassVar, NamedTuple, TypeAlias, cast
+from weakref import WeakValueDictionary
 
 from qtpy import QT_VERSION
-from qtpy.QtCore import QObject, QPoint, QRect, QSize, Qt
+from qtpy.QtCore import QObject, QPoint, QRect, QRectF, QSize, Qt
 from qtpy.QtGui import (
     QColor,
     QFont,
     QFontDatabase,
+    QFontInfo,
+    QFontMetricsF,
     QGuiApplication,
     QIcon,
     QIconEngine,
     QPainter,
+    QPainterPath,
     QPixmap,
     QPixmapCache,
     QTransform,
@@ -26,6 +31,8 @@ from typing_extensions import TypedDict
 
 from superqt.utils import QMessageHandler
 
+from . import _animations
+
 if TYPE_CHECKING:
     from ._animations import Animation
 
@@ -153,16 +160,69 @@ class _IconOptions:
         # not using asdict due to pickle errors on animation
         return cast("IconOptionDict", vars(self))
 
+    def _key(self) -> tuple:
+        """Return a hashable key of the rendering options (except animation)."""
+        color = _color_args(self.color)
+        return (
+            self.glyph_key,
+            QColor(*color).rgba() if color else None,
+            self.scale_factor,
+            self.opacity,
+            _transform_key(self.transform) if self.transform is not None else None,
+        )
+
+
+class IconCacheInfo(NamedTuple):
+    """Statistics of the cache of shared icon engines (see `QFontIconStore.icon`)."""
+
+    hits: int
+    misses: int
+    currsize: int
+
+
+# pixel size of the font at which glyph outlines are cached, see `_glyph_path`
+_PATH_PIXEL_SIZE = 256
+# largest pixel size that Qt draws from its (pixel aligned) glyph cache, rather than
+# as a path (QT_MAX_CACHED_GLYPH_SIZE of the raster paint engine)
+_MAX_CACHED_GLYPH_SIZE = 64
+
+
+class _GlyphPath(NamedTuple):
+    """Outline of a glyph (on the baseline) at `_PATH_PIXEL_SIZE`, and its font."""
+
+    path: QPainterPath
+    char: str
+    font: QFont
+    # pixel size -> (advance, ascent, height), see `metrics`
+    sizes: dict[int, tuple[float, float, float]]
+
+    def metrics(self, pixel_size: int) -> tuple[float, float, float]:
+        """Return the advance, ascent and line height of the glyph at `pixel_size`.
+
+        Metrics don't scale linearly with the pixel size of a (hinted) font, so they
+        are measured at the size the glyph is drawn at.
+        """
+        try:
+            return self.sizes[pixel_size]
+        except KeyError:
+            pass
+        font = QFont(self.font)
+        font.setPixelSize(pixel_size)
+        fm = QFontMetricsF(font)
+        metrics = (fm.horizontalAdvance(self.char), fm.ascent(), fm.height())
+        self.sizes[pixel_size] = metrics
+        return metrics
 
-class _QFontIconEngine(QIconEngine):
-    _opt_hash: str = ""
 
+class _QFontIconEngine(QIconEngine):
     def __init__(self, options: _IconOptions):
         super().__init__()
         self._opts: defaultdict[QIcon.State, dict[QIcon.Mode, _IconOptions | None]] = (
             defaultdict(dict)
         )
         self._opts[QIcon.State.Off][QIcon.Mode.Normal] = options
+        # (state, mode) -> pixmap cache key prefix, see `_pmcKey`
+        self._opt_keys: dict[tuple[QIcon.State, QIcon.Mode], str] = {}
         self.update_hash()
 
     @property
@@ -173,9 +233,10 @@ class _QFontIconEngine(QIconEngine):
         self._opts[state][mode] = self._default_opts._update(opts)
         self.update_hash()
 
-    def clone(self) -> QIconEngine:  # pragma: no cover
+    def clone(self) -> QIconEngine:
         ico = _QFontIconEngine(self._default_opts)
-        ico._opts = self._opts.copy()
+        ico._opts = defaultdict(dict, {s: m.copy() for s, m in self._opts.items()})
+        ico.update_hash()
         return ico
 
     def _get_opts(self, state: QIcon.State, mode: QIcon.Mode) -> _IconOptions:
@@ -229,48 +290,105 @@ class _QFontIconEngine(QIconEngine):
     ) -> None:
         opts = self._get_opts(state, mode)
 
-        char, family, style = QFontIconStore.key2glyph(opts.glyph_key)
-
-        # font
-        font = QFont()
-        font.setFamily(family)  # set separately for Qt6
-        font.setPixelSize(round(rect.height() * opts.scale_factor))
-        if style:
-            font.setStyleName(style)
-
-        # color
-        if isinstance(opts.color, tuple):
-            color_args = opts.color
-        else:
-            color_args = (opts.color,) if opts.color else ()
-
-        # animation
-        if opts.animation is not None:
-            opts.animation.animate(painter)
-
         # animation
+        if (anim := opts.animation) is not None:
+            anim._painting(painter, rect)
+            # transformed glyphs may be drawn anywhere, outside of the frame
+            if opts.transform is None and (angle := anim._frame()) is not None:
+                device = painter.device()
+                dpr = device.devicePixelRatioF() if device else 1.0
+                frame = self._frame(rect.size(), mode, state, dpr, angle)
+                pad = _animations._rotation_pad(rect.width(), rect.height())
+                painter.drawPixmap(rect.topLeft() - QPoint(pad, pad), frame)
+                return
+            anim.animate(painter)
+        self._draw(painter, rect, opts)
+
+    def _draw(self, painter: QPainter, rect: QRect, opts: _IconOptions) -> None:
+        """Draw the glyph of `opts` in `rect` (ignoring animations)."""
+        # glyph outline, scaled to the pixel size of the font
+        pixel_size = round(rect.height() * opts.scale_factor)
+        glyph = QFontIconStore._glyph_path(opts.glyph_key)
+        scale = pixel_size / _PATH_PIXEL_SIZE
+
+        # transform
         if opts.transform is not None:
             painter.setTransform(opts.transform, True)
 
         painter.save()
-        painter.setPen(QColor(*color_args))
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         painter.setOpacity(opts.opacity)
-        painter.setFont(font)
-        with QMessageHandler():  # avoid "Populating font family aliases" warning
-            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, char)
+        # position the baseline like `painter.drawText(rect, AlignCenter, char)`
+        advance, ascent, height = glyph.metrics(pixel_size)
+        x = rect.x() + (rect.width() - advance) / 2
+        baseline = rect.y() + (rect.height() - height) / 2 + ascent
+        if pixel_size <= _MAX_CACHED_GLYPH_SIZE:
+            baseline = math.floor(baseline + 0.5)
+        painter.translate(x, baseline)
+        painter.scale(scale, scale)
+        painter.fillPath(glyph.path, QColor(*_color_args(opts.color)))
         painter.restore()
 
+    def _frame(
+        self,
+        size: QSize,
+        mode: QIcon.Mode,
+        state: QIcon.State,
+        dpr: float,
+        angle: float,
+    ) -> QPixmap:
+        """Return the (cached) frame of a rotating animation at `angle` degrees.
+
+        Frames are padded by `_animations._rotation_pad` on each side, so that the
+        rotated glyph isn't clipped.
+        """
+        key = f"{self._pmcKey(size, mode, state, dpr)}_frame"
+        if (frame := _animations._cached_frame(key)) is not None:
+            return frame
+        pad = _animations._rotation_pad(size.width(), size.height())
+        frame = QPixmap((size + QSize(2 * pad, 2 * pad)) * dpr)
+        frame.setDevicePixelRatio(dpr)
+        frame.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(frame)
+        rect = QRect(QPoint(pad, pad), size)
+        mid = QRectF(rect).center()
+        painter.translate(mid)
+        painter.rotate(angle)
+        painter.translate(-mid)
+        self._draw(painter, rect, self._get_opts(state, mode))
+        painter.end()
+        _animations._cache_frame(key, frame)
+        return frame
+
     def pixmap(self, size: QSize, mode: QIcon.Mode, state: QIcon.State) -> QPixmap:
+        return self.scaledPixmap(size, mode, state, 1.0)
+
+    def scaledPixmap(
+        self, size: QSize, mode: QIcon.Mode, state: QIcon.State, scale: float
+    ) -> QPixmap:
+        """Return a pixmap of `size` (in logical pixels) for a device pixel `scale`.
+
+        Pixmaps are rendered at the full resolution of the device (and cached for
+        each device pixel ratio), so that icons are sharp on high DPI screens.
+        """
         # first look in cache
-        pmckey = self._pmcKey(size, mode, state)
-        with warnings.catch_warnings():
-            warnings.filterwarnings("ignore", "QPixmapCache.find")
-            pm = QPixmapCache.find(pmckey) if pmckey else None
-        if pm:
-            return pm
-        pixmap = QPixmap(size)
+        pmckey = self._pmcKey(size, mode, state, scale)
+        anim = self._get_opts(state, mode).animation
+        if anim is not None:
+            # pixmaps of animations are cached as frames (see `_frame`)
+            if pmckey and (pm := _animations._cached_frame(pmckey)) is not None:
+                anim._painting(None, QRect(QPoint(0, 0), size))
+                return pm
+        else:
+            with warnings.catch_warnings():
+                warnings.filterwarnings("ignore", "QPixmapCache.find")
+                pm = QPixmapCache.find(pmckey) if pmckey else None
+            if pm:
+                return pm
+        pixmap = QPixmap(size * scale)
         if not size.isValid():
             return pixmap
+        pixmap.setDevicePixelRatio(scale)
         pixmap.fill(Qt.GlobalColor.transparent)
         painter = QPainter(pixmap)
         self.paint(painter, QRect(QPoint(0, 0), size), mode, state)
@@ -288,38 +406,65 @@ class _QFontIconEngine(QIconEngine):
                     pixmap = generated
 
         if pmckey and not pixmap.isNull():
-            QPixmapCache.insert(pmckey, pixmap)
+            if anim is not None:
+                _animations._cache_frame(pmckey, pixmap)
+            else:
+                QPixmapCache.insert(pmckey, pixmap)
 
         return pixmap
 
-    def _pmcKey(self, size: QSize, mode: QIcon.Mode, state: QIcon.State) -> str:
-        # Qt6-style enums
-        if self._get_opts(state, mode).animation:
-            return ""
-        if hasattr(mode, "value"):
-            mode = mode.value
-        if hasattr(state, "value"):
-            state = state.value
-        k = ((((((size.width()) << 11) | size.height()) << 11) | mode) << 4) | state
-        return f"$superqt_{self._opt_hash}_{hex(k)}"
+    def _pmcKey(
+        self, size: QSize, mode: QIcon.Mode, state: QIcon.State, dpr: float = 1.0
+    ) -> str:
+        """Return the `QPixmapCache` key for a pixmap, or "" if it can't be cached.
+
+        The key is derived from the content of the pixmap (all of the options used
+        to render it), so that identical icons share cached pixmaps.  Animated icons
+        are keyed by the angle of their current frame, if it can be cached.
+        """
+        try:
+            opt_key = self._opt_keys[(state, mode)]
+        except KeyError:
+            opt_key = self._opt_keys[(state, mode)] = self._optKey(state, mode)
+        frame = ""
+        if (anim := self._get_opts(state, mode).animation) is not None:
+            if (angle := anim._frame()) is None:
+                return ""
+            frame = f"_{angle:g}deg"
+        return (
+            f"$superqt_{QFontIconStore._GENERATION}_{opt_key}"
+            f"_{size.width()}x{size.height()}@{dpr:g}{frame}"
+        )
+
+    def _optKey(self, state: QIcon.State, mode: QIcon.Mode) -> str:
+        opts_key = self._get_opts(state, mode)._key()
+        # pixmaps of other modes are generated from the palette, unless the
+        # user has specifically set a color for this mode/state (see `pixmap`)
+        own_opts = self._opts[state].get(mode)
+        generated = mode != QIcon.Mode.Normal and not (own_opts and own_opts.color)
+        return repr((*opts_key, _enum_value(mode), _enum_value(state), generated))
 
     def update_hash(self) -> None:
-        hsh = id(self)
-        for state, d in self._opts.items():
-            for mode, opts in d.items():
-                if not opts:
-                    continue
-                hsh += hash(
-                    hash(opts.glyph_key) + hash(opts.color) + hash(state) + hash(mode)
-                )
-        self._opt_hash = hex(hsh)
+        """Clear the cached pixmap cache keys, after options have changed."""
+        self._opt_keys.clear()
 
 
 class QFontIcon(QIcon):
+    # icon of the store's cache that this icon shares its engine with, if any
+    _shared: QFontIcon | None = None
+
     def __init__(self, options: _IconOptions) -> None:
         self._engine = _QFontIconEngine(options)
         super().__init__(self._engine)
 
+    def _share(self) -> QFontIcon:
+        """Return a new icon that shares the engine of this icon."""
+        icon = QFontIcon.__new__(QFontIcon)
+        QIcon.__init__(icon, self)
+        icon._engine = self._engine
+        icon._shared = self
+        return icon
+
     def addState(
         self,
         state: QIcon.State = QIcon.State.Off,
@@ -331,7 +476,13 @@ class QFontIcon(QIcon):
         animation: Animation | Unset | None = _Unset,
         transform: QTransform | Unset | None = _Unset,
     ) -> None:
-        """Set icon options for a specific mode/state."""
+        """Set icon options for a specific mode/state.
+
+        Icons returned by `QFontIconStore.icon` share their engine with equivalent
+        icons.  The engine is copied before the first change, so that other icons
+        are not modified (including copies of this icon made before the change,
+        e.g. by `QAbstractButton.setIcon`).
+        """
         if glyph_key is not _Unset:
             QFontIconStore.key2glyph(glyph_key)  # type: ignore
 
@@ -343,6 +494,10 @@ class QFontIcon(QIcon):
             animation=animation,
             transform=transform,
         )
+        if self._shared is not None:
+            self._engine = cast("_QFontIconEngine", self._engine.clone())
+            self.swap(QIcon(self._engine))
+            self._shared = None
         self._engine._add_opts(state, mode, _opts)
 
 
@@ -351,7 +506,23 @@ class QFontIconStore(QObject):
     _LOADED_KEYS: ClassVar[dict[str, tuple[str, str]]] = {}
 
     # map of (font_family, font_style) -> character (char may include key)
-    _CHARMAPS: ClassVar[dict[tuple[str, str | None], dict[str, str]]] = {}
+    _CHARMAPS: ClassVar[dict[tuple[str, str | None], Mapping[str, str]]] = {}
+
+    # map of glyph_key -> (char, font_family, font_style), see `key2glyph`
+    _GLYPHS: ClassVar[dict[str, tuple[str, str, str | None]]] = {}
+
+    # weak cache of icons whose engine is shared, keyed by their normalized
+    # options, see `icon`
+    _ICONS: ClassVar[WeakValueDictionary[tuple, QFontIcon]] = WeakValueDictionary()
+    _ICON_HITS: ClassVar[int] = 0
+    _ICON_MISSES: ClassVar[int] = 0
+
+    # map of glyph_key -> outline of the glyph, see `_glyph_path`
+    _PATHS: ClassVar[dict[str, _GlyphPath]] = {}
+
+    # incremented whenever fonts are added or cleared, to invalidate the glyph
+    # and font caches of the icon engines.
+    _GENERATION: ClassVar[int] = 0
 
     # singleton instance, use `instance()` to retrieve
     __instance: ClassVar[QFontIconStore | None] = None
@@ -372,8 +543,17 @@ class QFontIconStore(QObject):
     def clear(cls) -> None:
         cls._LOADED_KEYS.clear()
         cls._CHARMAPS.clear()
+        cls._invalidate_glyphs()
+        cls._ICONS.clear()
+        cls._ICON_HITS = cls._ICON_MISSES = 0
         QFontDatabase.removeAllApplicationFonts()
 
+    @classmethod
+    def _invalidate_glyphs(cls) -> None:
+        cls._GLYPHS.clear()
+        cls._PATHS.clear()
+        cls._GENERATION += 1
+
     @classmethod
     def _key2family(cls, key: str) -> tuple[str, str]:
         """Return (family, style) given a font `key`."""
@@ -382,9 +562,9 @@ class QFontIconStore(QObject):
             from . import _plugins
 
             try:
-                font_cls = _plugins.get_font_class(key)
+                # the charmap is only loaded when a glyph is first looked up by name
                 result = cls.addFont(
-                    font_cls.__font_file__, key, charmap=dict(font_cls.__dict__)
+                    _plugins.get_font_file(key), key, charmap=_plugins.get_charmap(key)
                 )
                 if not result:  # pragma: no cover
                     raise Exception("Invalid font file")
@@ -422,16 +602,44 @@ class QFontIconStore(QObject):
     @classmethod
     def key2glyph(cls, glyph_key: str) -> tuple[str, str, str | None]:
         """Return (char, family, style) given a `glyph_key`."""
+        try:
+            return cls._GLYPHS[glyph_key]
+        except KeyError:
+            pass
         if "." not in glyph_key:
             raise ValueError("Glyph key must contain a period")
         font_key, char = glyph_key.split(".", maxsplit=1)
         family, style = cls._key2family(font_key)
         char = cls._ensure_char(char, family, style)
+        cls._GLYPHS[glyph_key] = (char, family, style)
         return char, family, style
 
+    @classmethod
+    def _glyph_path(cls, glyph_key: str) -> _GlyphPath:
+        """Return the outline of the glyph for `glyph_key`.
+
+        Outlines are created once per glyph, so that icons of any size can be drawn
+        by filling the scaled outline, without laying out text.
+        """
+        try:
+            return cls._PATHS[glyph_key]
+        except KeyError:
+            pass
+        char, family, style = cls.key2glyph(glyph_key)
+        font = QFont()
+        font.setFamily(family)  # set separately for Qt6
+        font.setPixelSize(_PATH_PIXEL_SIZE)
+        if style:
+            font.setStyleName(style)
+        path = QPainterPath()
+        path.addText(0, 0, font, char)
+        glyph = _GlyphPath(path, char, font, {})
+        cls._PATHS[glyph_key] = glyph
+        return glyph
+
     @classmethod
     def addFont(
-        cls, filepath: str, prefix: str, charmap: dict[str, str] | None = None
+        cls, filepath: str, prefix: str, charmap: Mapping[str, str] | None = None
     ) -> tuple[str, str] | None:
         r"""Add font at `filepath` to the registry under `key`.
 
@@ -447,7 +655,7 @@ class QFontIconStore(QObject):
         prefix : str
             A key that will represent this font file when used for lookup.  For example,
             'fa5s' for 'Font-Awesome 5 Solid'.
-        charmap : Dict[str, str], optional
+        charmap : Mapping[str, str], optional
             optional mapping for all of the glyph names to their unicode numbers.
             See note above.
 
@@ -496,6 +704,8 @@ class QFontIconStore(QObject):
         cls._LOADED_KEYS[prefix] = (family, style)
         if charmap:
             cls._CHARMAPS[(family, style)] = charmap
+        cls._invalidate_glyphs()
+        _warm_up_font(family, style)
         return (family, style)
 
     def icon(
@@ -509,6 +719,12 @@ class QFontIconStore(QObject):
         transform: QTransform | None = None,
         states: dict[str, IconOptionDict | IconOpts] | None = None,
     ) -> QFontIcon:
+        """Return a `QFontIcon` for `glyph_key`.
+
+        Every call returns a new icon, but icons without animations share their
+        engine (and rendered pixmaps): as long as an icon returned by this method is
+        alive, equivalent options reuse its engine (see `iconCacheInfo`).
+        """
         self.key2glyph(glyph_key)  # make sure it's a valid glyph_key
         default_opts = _IconOptions(
             glyph_key=glyph_key,
@@ -518,12 +734,72 @@ class QFontIconStore(QObject):
             animation=animation,
             transform=transform,
         )
+        return self._icon(default_opts, _norm_states(states))
+
+    def icons(
+        self,
+        glyph_keys: Iterable[str],
+        *,
+        scale_factor: float = DEFAULT_SCALING_FACTOR,
+        color: ValidColor | None = None,
+        opacity: float = 1,
+        animation: Animation | None = None,
+        transform: QTransform | None = None,
+        states: dict[str, IconOptionDict | IconOpts] | None = None,
+        sizes: Iterable[int] = (),
+    ) -> list[QFontIcon]:
+        """Return a `QFontIcon` for each of `glyph_keys`, with the same options.
+
+        All keys are checked (and their fonts loaded) before any icon is created,
+        and the options are only normalized once.  Pixmaps of the icons are rendered
+        in advance for each of `sizes`.
+        """
+        glyph_keys = list(glyph_keys)
+        for glyph_key in dict.fromkeys(glyph_keys):
+            self.key2glyph(glyph_key)  # make sure it's a valid glyph_key
+        template = _IconOptions(
+            glyph_key="",
+            scale_factor=scale_factor,
+            color=color,
+            opacity=opacity,
+            animation=animation,
+            transform=transform,
+        )
+        state_opts = _norm_states(states)
+        icons = [
+            self._icon(replace(template, glyph_key=glyph_key), state_opts)
+            for glyph_key in glyph_keys
+        ]
+        for size in sizes:
+            for icon in {icon.cacheKey(): icon for icon in icons}.values():
+                icon.pixmap(size, size)
+        return icons
+
+    def _icon(
+        self,
+        default_opts: _IconOptions,
+        state_opts: list[tuple[tuple[QIcon.State, QIcon.Mode], IconOptionDict]],
+    ) -> QFontIcon:
+        key = _icon_key(default_opts, state_opts)
+        if key is not None:
+            if (shared := self._ICONS.get(key)) is not None:
+                QFontIconStore._ICON_HITS += 1
+                return shared._share()
+            QFontIconStore._ICON_MISSES += 1
+
         icon = QFontIcon(default_opts)
-        for kw, options in (states or {}).items():
-            if isinstance(options, IconOpts):
-                options = default_opts._update(options).dict()
-            icon.addState(*_norm_state_mode(kw), **options)
-        return icon
+        for state_mode, options in state_opts:
+            icon.addState(*state_mode, **options)
+        if key is None:
+            return icon
+        # the cached icon is kept alive by the icons sharing its engine
+        self._ICONS[key] = icon
+        return icon._share()
+
+    @classmethod
+    def iconCacheInfo(cls) -> IconCacheInfo:
+        """Return the hits, misses and current size of the shared engine cache."""
+        return IconCacheInfo(cls._ICON_HITS, cls._ICON_MISSES, len(cls._ICONS))
 
     def setTextIcon(
         self, widget: QWidget, glyph_key: str, size: float | None = None
@@ -556,6 +832,76 @@ class QFontIconStore(QObject):
         return font
 
 
+def _norm_states(
+    states: dict[str, IconOptionDict | IconOpts] | None,
+) -> list[tuple[tuple[QIcon.State, QIcon.Mode], IconOptionDict]]:
+    """Return a list of ((state, mode), options) for the `states` of an icon."""
+    return [
+        (
+            _norm_state_mode(kw),
+            options.dict() if isinstance(options, IconOpts) else options,
+        )
+        for kw, options in (states or {}).items()
+    ]
+
+
+def _icon_key(
+    default_opts: _IconOptions,
+    state_opts: list[tuple[tuple[QIcon.State, QIcon.Mode], IconOptionDict]],
+) -> tuple | None:
+    """Return the key of an icon in the shared icon cache, None if not shareable."""
+    if default_opts.animation:
+        return None
+    key: list = [default_opts._key()]
+    for (state, mode), options in state_opts:
+        opts = default_opts._update(IconOpts(**options))
+        if opts.animation:
+            return None
+        key.append((_enum_value(state), _enum_value(mode), opts._key()))
+    return tuple(key)
+
+
+def _color_args(color: ValidColor) -> tuple:
+    """Return the arguments to create a QColor for `color`."""
+    if isinstance(color, tuple):
+        return color
+    return (color,) if color else ()
+
+
+def _transform_key(transform: QTransform) -> tuple[float, ...]:
+    return (
+        transform.m11(),
+        transform.m12(),
+        transform.m13(),
+        transform.m21(),
+        transform.m22(),
+        transform.m23(),
+        transform.m31(),
+        transform.m32(),
+        transform.m33(),
+    )
+
+
+def _enum_value(enum: QIcon.Mode | QIcon.State) -> int:
+    # Qt6-style enums
+    return enum.value if hasattr(enum, "value") else int(enum)
+
+
+def _warm_up_font(family: str, style: str) -> None:
+    """Resolve the font for `family` and `style` once, when it is registered.
+
+    The first lookup of a font may make Qt populate its font family aliases, with a
+    "Populating font family aliases" warning.  Doing that lookup here (with the
+    warning silenced) keeps message handlers out of the icon painting.
+    """
+    font = QFont()
+    font.setFamily(family)
+    if style:
+        font.setStyleName(style)
+    with QMessageHandler():
+        QFontInfo(font).family()
+
+
 def _ensure_identifier(name: str) -> str:
     """Normalize string to valid identifier."""
     import keyword
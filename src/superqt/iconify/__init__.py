@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 import warnings
-from typing import TYPE_CHECKING
+from contextlib import suppress
+from itertools import count
+from typing import TYPE_CHECKING, Any
+from weakref import WeakSet, WeakValueDictionary
 
-from qtpy.QtCore import QSize, Qt
-from qtpy.QtGui import QIcon, QPainter, QPixmap
-from qtpy.QtWidgets import QApplication
+from qtpy.QtCore import QSize, Qt, QTimer
+from qtpy.QtGui import QIcon, QIconEngine, QPainter, QPixmap
+from qtpy.QtWidgets import QAbstractButton, QApplication, QWidget
+
+from superqt.utils import create_worker
 
 try:
     from pyconify import svg_path
@@ -17,12 +22,265 @@ except ModuleNotFoundError:  # pragma: no cover
     ) from None
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
     from typing import Literal
 
+    from qtpy.QtCore import QRect
+
     Flip = Literal["horizontal", "vertical", "horizontal,vertical"]
     Rotation = Literal["90", "180", "270", 90, 180, 270, "-90", 1, 2, 3]
 
-__all__ = ["QIconifyIcon"]
+__all__ = ["QIconifyIcon", "prefetch"]
+
+# maximum number of SVGs fetched by each worker thread
+_BATCH_SIZE = 16
+# prefix of the file names that stand for pending requests in `QIcon.addFile`
+_REQUEST_PREFIX = ":superqt-iconify-request:"
+_REQUEST_IDS = count()
+
+
+class _SvgRequest:
+    """Request for the SVG file of an icon, resolved in a worker thread."""
+
+    def __init__(self, key: tuple[str, ...], kwargs: dict[str, Any]) -> None:
+        self.key = key
+        self.kwargs = kwargs
+        self.path: Path | None = None
+        self.error: Exception | None = None
+        self.done = False
+        # file name added to icons, to add the request to their engine
+        self.name = f"{_REQUEST_PREFIX}{next(_REQUEST_IDS)}"
+        _NAMED_REQUESTS[self.name] = self
+        # widgets that painted a placeholder of this request
+        self.widgets: WeakSet[QWidget] = WeakSet()
+        # cache keys of the icons waiting for this request, and whether any of
+        # them drew a placeholder outside of a widget (e.g. in a button's pixmap)
+        self.icon_keys: set[int] = set()
+        self.offscreen = False
+
+    def resolve(self) -> None:
+        try:
+            self.path = svg_path(*self.key, **self.kwargs)
+        except Exception as e:
+            self.error = e
+        self.done = True
+
+
+# arguments of `svg_path` -> request for the SVG (failed requests are removed)
+_REQUESTS: dict[tuple, _SvgRequest] = {}
+# name -> request, see `_SvgRequest.name`
+_NAMED_REQUESTS: WeakValueDictionary[str, _SvgRequest] = WeakValueDictionary()
+# requests not sent to a worker yet.  They are sent together, once control returns
+# to the event loop.
+_QUEUED: list[_SvgRequest] = []
+
+
+def _request_svg(key: tuple[str, ...], **kwargs: Any) -> _SvgRequest:
+    """Return the request for the SVG of `key`, queueing it if it is new."""
+    args = (key, tuple(kwargs.items()))
+    if (request := _REQUESTS.get(args)) is None:
+        request = _REQUESTS[args] = _SvgRequest(key, kwargs)
+        if not _QUEUED:
+            QTimer.singleShot(0, _submit_queued)
+        _QUEUED.append(request)
+    return request
+
+
+def _submit_queued() -> None:
+    batch = _QUEUED[:]
+    _QUEUED.clear()
+    for i in range(0, len(batch), _BATCH_SIZE):
+        create_worker(
+            _resolve_svgs,
+            batch[i : i + _BATCH_SIZE],
+            _start_thread=True,
+            _connect={"returned": _on_resolved},
+        )
+
+
+def _resolve_svgs(requests: list[_SvgRequest]) -> list[_SvgRequest]:
+    for request in requests:
+        request.resolve()
+    return requests
+
+
+def _on_resolved(requests: list[_SvgRequest]) -> None:
+    widgets: set[QWidget] = set()
+    icon_keys: set[int] = set()
+    for request in requests:
+        if request.error is not None:
+            args = (request.key, tuple(request.kwargs.items()))
+            _REQUESTS.pop(args, None)
+            warnings.warn(
+                f"Error fetching icon: {request.error}.\nIcon {request.key} not "
+                "cached. Using fallback.",
+                stacklevel=2,
+            )
+        widgets.update(request.widgets)
+        if request.offscreen:
+            icon_keys.update(request.icon_keys)
+        request.widgets.clear()
+        request.icon_keys.clear()
+        request.offscreen = False
+
+    # repaint the widgets that drew placeholders of the requests
+    if icon_keys:
+        showing = _widgets_showing(icon_keys)
+        # icons drawn in a pixmap by an unknown widget: repaint all windows
+        widgets.update(showing or QApplication.topLevelWidgets())
+    for widget in widgets:
+        with suppress(RuntimeError):  # widget deleted
+            widget.update()
+
+
+def _widgets_showing(icon_keys: set[int]) -> list[QWidget]:
+    """Return the buttons and the widgets with actions showing one of the icons."""
+    widgets = []
+    for widget in QApplication.allWidgets():
+        if isinstance(widget, QAbstractButton):
+            if widget.icon().cacheKey() in icon_keys:
+                widgets.append(widget)
+        elif any(a.icon().cacheKey() in icon_keys for a in widget.actions()):
+            widgets.append(widget)
+    return widgets
+
+
+def prefetch(
+    keys: Iterable[str | tuple[str, ...]],
+    color: str | None = None,
+    flip: Flip | None = None,
+    rotate: Rotation | None = None,
+) -> None:
+    """Fetch (and cache) the SVGs of the icons with `keys` in background threads.
+
+    This may be called at startup to warm the cache, so that icons created later
+    with `QIconifyIcon(..., asynchronous=True)` and the same arguments are drawn
+    immediately.  SVGs are fetched once control returns to the Qt event loop.
+
+    Parameters
+    ----------
+    keys : Iterable[str | tuple[str, ...]]
+        Keys of the icons, in the format `"prefix:name"` or `("prefix", "name")`.
+    color : str, optional
+        Icon color, as in `QIconifyIcon`.
+    flip : str, optional
+        Flip icon, as in `QIconifyIcon`.
+    rotate : str | int, optional
+        Rotate icon, as in `QIconifyIcon`.
+    """
+    for key in keys:
+        key = (key,) if isinstance(key, str) else tuple(key)
+        _request_svg(key, color=color, flip=flip, rotate=rotate, dir=None)
+
+
+def _fallback_pixmap() -> QPixmap:
+    if style := QApplication.style():
+        return style.standardPixmap(style.StandardPixmap.SP_MessageBoxQuestion)
+    pixmap = QPixmap(18, 18)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(pixmap)
+    painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, "?")
+    painter.end()
+    return pixmap
+
+
+def _placeholder(size: QSize, scale: float = 1.0) -> QPixmap:
+    pixmap = QPixmap(size * scale)
+    pixmap.setDevicePixelRatio(scale)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    return pixmap
+
+
+class _IconifyEngine(QIconEngine):
+    """Icon engine for SVGs that may still be fetched in a background thread.
+
+    Icons are drawn from the SVGs that are available, and as an (empty) placeholder
+    until the first one is.
+    """
+
+    def __init__(
+        self,
+        icon: QIcon | None = None,
+        pending: Iterable[tuple[_SvgRequest, QSize, QIcon.Mode, QIcon.State]] = (),
+    ) -> None:
+        super().__init__()
+        self._icon = QIcon(icon) if icon is not None else QIcon()
+        # requested SVGs not added to `_icon` yet: (request, size, mode, state)
+        self._pending = list(pending)
+
+    def clone(self) -> QIconEngine:
+        return _IconifyEngine(self._icon, self._pending)
+
+    def _resolved(self) -> QIcon:
+        """Return the icon, after adding the SVGs that were fetched since last time."""
+        if any(request.done for request, *_ in self._pending):
+            pending = []
+            for request, size, mode, state in self._pending:
+                if not request.done:
+                    pending.append((request, size, mode, state))
+                elif request.path is not None:
+                    self._icon.addFile(str(request.path), size, mode, state)
+                else:
+                    self._icon.addPixmap(_fallback_pixmap(), mode, state)
+            self._pending = pending
+        return self._icon
+
+    def _placeholder_drawn(self, device: object = None) -> None:
+        """Record that a placeholder was drawn on `device`, until SVGs are fetched."""
+        for request, *_ in self._pending:
+            if isinstance(device, QWidget):
+                request.widgets.add(device)
+            else:
+                request.offscreen = True
+
+    def addFile(
+        self, fileName: str, size: QSize, mode: QIcon.Mode, state: QIcon.State
+    ) -> None:
+        if fileName.startswith(_REQUEST_PREFIX):
+            if (request := _NAMED_REQUESTS.get(fileName)) is not None:
+                self._pending.append((request, size, mode, state))
+            return
+        self._icon.addFile(fileName, size, mode, state)
+
+    def addPixmap(self, pixmap: QPixmap, mode: QIcon.Mode, state: QIcon.State) -> None:
+        self._icon.addPixmap(pixmap, mode, state)
+
+    def isNull(self) -> bool:
+        return self._resolved().isNull() and not self._pending
+
+    def availableSizes(
+        self, mode: QIcon.Mode = QIcon.Mode.Normal, state: QIcon.State = QIcon.State.Off
+    ) -> list[QSize]:
+        return self._resolved().availableSizes(mode, state)
+
+    def actualSize(self, size: QSize, mode: QIcon.Mode, state: QIcon.State) -> QSize:
+        icon = self._resolved()
+        return size if icon.isNull() else icon.actualSize(size, mode, state)
+
+    def paint(
+        self, painter: QPainter, rect: QRect, mode: QIcon.Mode, state: QIcon.State
+    ) -> None:
+        icon = self._resolved()
+        if self._pending:
+            self._placeholder_drawn(painter.device())
+        icon.paint(painter, rect, Qt.AlignmentFlag.AlignCenter, mode, state)
+
+    def pixmap(self, size: QSize, mode: QIcon.Mode, state: QIcon.State) -> QPixmap:
+        icon = self._resolved()
+        if self._pending:
+            self._placeholder_drawn()
+        return _placeholder(size) if icon.isNull() else icon.pixmap(size, mode, state)
+
+    def scaledPixmap(
+        self, size: QSize, mode: QIcon.Mode, state: QIcon.State, scale: float
+    ) -> QPixmap:
+        icon = self._resolved()
+        if self._pending:
+            self._placeholder_drawn()
+        if icon.isNull():
+            return _placeholder(size, scale)
+        return icon.pixmap(size, scale, mode, state)
 
 
 class QIconifyIcon(QIcon):
@@ -62,6 +320,11 @@ class QIconifyIcon(QIcon):
         default
         [directory](https://docs.python.org/3/library/tempfile.html#tempfile.mkstemp) is
         used.
+    asynchronous : bool, optional
+        If True, the SVG is fetched in a background thread (with others requested at
+        the same time), rather than blocking until it is downloaded. The icon is
+        empty until then, after which the widgets showing it are repainted.  By
+        default False.
 
     Examples
     --------
@@ -79,10 +342,20 @@ class QIconifyIcon(QIcon):
         flip: Flip | None = None,
         rotate: Rotation | None = None,
         dir: str | None = None,
+        asynchronous: bool = False,
     ):
+        # whether the icon has an engine drawing placeholders for SVGs being fetched
+        self._asynchronous = False
         super().__init__()
         if key:
-            self.addKey(*key, color=color, flip=flip, rotate=rotate, dir=dir)
+            self.addKey(
+                *key,
+                color=color,
+                flip=flip,
+                rotate=rotate,
+                dir=dir,
+                asynchronous=asynchronous,
+            )
 
     def addKey(
         self,
@@ -94,6 +367,7 @@ class QIconifyIcon(QIcon):
         size: QSize | None = None,
         mode: QIcon.Mode = QIcon.Mode.Normal,
         state: QIcon.State = QIcon.State.Off,
+        asynchronous: bool = False,
     ) -> QIconifyIcon:
         """Add an icon to this QIcon.
 
@@ -124,12 +398,31 @@ class QIconifyIcon(QIcon):
             Mode specified for the icon, passed to `QIcon.addFile`.
         state : QIcon.State, optional
             State specified for the icon, passed to `QIcon.addFile`.
+        asynchronous : bool, optional
+            If True, fetch the SVG in a background thread, and draw an empty
+            placeholder until it is available.  By default False.
 
         Returns
         -------
         QIconifyIcon
             This QIconifyIcon instance, for chaining.
         """
+        if asynchronous:
+            request = _request_svg(key, color=color, flip=flip, rotate=rotate, dir=dir)
+            pending = (request, size or QSize(), mode, state)
+            if self._asynchronous:
+                # the engine (which Qt may have copied) adds the request, see
+                # `_IconifyEngine.addFile`
+                self.addFile(request.name, *pending[1:])
+            else:
+                # switch to an engine that can draw the icon before the SVG is
+                # fetched.  It must not be null, or Qt would drop it in `addFile`.
+                self.swap(QIcon(_IconifyEngine(QIcon(self), [pending])))
+                self._asynchronous = True
+            if not request.done:
+                request.icon_keys.add(self.cacheKey())
+            return self
+
         try:
             path = svg_path(*key, color=color, flip=flip, rotate=rotate, dir=dir)
         except OSError as e:
@@ -144,13 +437,4 @@ class QIconifyIcon(QIcon):
         return self
 
     def _draw_text_fallback(self, key: tuple[str, ...]) -> None:
-        if style := QApplication.style():
-            pixmap = style.standardPixmap(style.StandardPixmap.SP_MessageBoxQuestion)
-        else:
-            pixmap = QPixmap(18, 18)
-            pixmap.fill(Qt.GlobalColor.transparent)
-            painter = QPainter(pixmap)
-            painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, "?")
-            painter.end()
-
-        self.addPixmap(pixmap)
+        self.addPixmap(_fallback_pixmap())
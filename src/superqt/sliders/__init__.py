@@ -1,3 +1,4 @@
+from ._delegates import QRangeSliderItemDelegate, QSliderItemDelegate
 from ._labeled import (
     QLabeledDoubleRangeSlider,
     QLabeledDoubleSlider,
@@ -5,10 +6,22 @@ from ._labeled import (
     QLabeledSlider,
 )
 from ._range_style import MONTEREY_SLIDER_STYLES_FIX
+from ._scales import (
+    FunctionScale,
+    LinearScale,
+    LogScale,
+    PowerScale,
+    SliderScale,
+    SymLogScale,
+)
 from ._sliders import QDoubleRangeSlider, QDoubleSlider, QRangeSlider
 
 __all__ = [
     "MONTEREY_SLIDER_STYLES_FIX",
+    "FunctionScale",
+    "LinearScale",
+    "LogScale",
+    "PowerScale",
     "QDoubleRangeSlider",
     "QDoubleSlider",
     "QLabeledDoubleRangeSlider",
@@ -16,4 +29,8 @@ __all__ = [
     "QLabeledRangeSlider",
     "QLabeledSlider",
     "QRangeSlider",
+    "QRangeSliderItemDelegate",
+    "QSliderItemDelegate",
+    "SliderScale",
+    "SymLogScale",
 ]
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from qtpy.QtCore import (
+    QAbstractItemModel,
+    QModelIndex,
+    QPersistentModelIndex,
+    QPoint,
+    QRect,
+    QSize,
+    Qt,
+)
+from qtpy.QtWidgets import (
+    QApplication,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionSlider,
+    QStyleOptionViewItem,
+    QWidget,
+)
+
+from superqt.utils import signals_blocked
+
+from ._sliders import QDoubleRangeSlider, QDoubleSlider
+
+if TYPE_CHECKING:
+    from qtpy.QtCore import QObject
+    from qtpy.QtGui import QPainter
+
+    from ._generic_slider import _GenericSlider
+
+DEFAULT_SIZE = QSize(80, 22)
+
+
+def _cast_like(value: Any, old: Any) -> Any:
+    """Return `value` with the type of `old`, rounding values of int models."""
+    if isinstance(old, int) and not isinstance(old, bool):
+        return type(old)(round(value))
+    if isinstance(old, float):
+        return type(old)(value)
+    return value
+
+
+class QSliderItemDelegate(QStyledItemDelegate):
+    """Delegate that draws and edits model values as sliders.
+
+    Cells are painted with the view's painter by a single hidden slider shared by
+    all items (it is never shown or rendered as a widget), so that memory use and
+    creation cost do not grow with the number of rows.  A real slider widget is
+    only created as editor while a cell is being edited (see
+    `QAbstractItemView.setEditTriggers`), and it commits its value to the model as
+    it changes.
+
+    The value is read from (and written to) the `Qt.ItemDataRole.EditRole` of the
+    index.  Values are written back with the type of the existing model data (e.g.
+    `int` values stay integers, rounded to the nearest integer).
+
+    Parameters
+    ----------
+    parent : QObject, optional
+        The parent object.
+    minimum : float, optional
+        The minimum value of the sliders, by default 0.
+    maximum : float, optional
+        The maximum value of the sliders, by default 100.
+    orientation : Qt.Orientation, optional
+        The orientation of the sliders, by default horizontal.
+    item_size : QSize, optional
+        The minimum size hint for each item, by default QSize(80, 22).
+    """
+
+    _slider_class: type[_GenericSlider] = QDoubleSlider
+
+    def __init__(
+        self,
+        parent: QObject | None = None,
+        *,
+        minimum: float = 0,
+        maximum: float = 100,
+        orientation: Qt.Orientation = Qt.Orientation.Horizontal,
+        item_size: QSize = DEFAULT_SIZE,
+    ) -> None:
+        super().__init__(parent)
+        self._minimum = minimum
+        self._maximum = maximum
+        self._orientation = orientation
+        self._item_size = item_size
+        # hidden slider used to paint every item, created on first paint
+        self._template: _GenericSlider | None = None
+
+    def minimum(self) -> float:
+        """Return the minimum value of the sliders."""
+        return self._minimum
+
+    def maximum(self) -> float:
+        """Return the maximum value of the sliders."""
+        return self._maximum
+
+    def setRange(self, minimum: float, maximum: float) -> None:
+        """Set the range of the sliders (and of the active editor on next edit)."""
+        self._minimum = minimum
+        self._maximum = max(minimum, maximum)
+        if self._template is not None:
+            self._template.setRange(self._minimum, self._maximum)
+
+    def orientation(self) -> Qt.Orientation:
+        """Return the orientation of the sliders."""
+        return self._orientation
+
+    def setOrientation(self, orientation: Qt.Orientation) -> None:
+        """Set the orientation of the sliders."""
+        self._orientation = orientation
+        if self._template is not None:
+            self._template.setOrientation(orientation)
+
+    # ###############  QStyledItemDelegate overrides  #######################
+
+    def sizeHint(
+        self, option: QStyleOptionViewItem, index: QModelIndex | QPersistentModelIndex
+    ) -> QSize:
+        return super().sizeHint(option, index).expandedTo(self._item_size)
+
+    def paint(
+        self,
+        painter: QPainter,
+        option: QStyleOptionViewItem,
+        index: QModelIndex | QPersistentModelIndex,
+    ) -> None:
+        value = index.data(Qt.ItemDataRole.EditRole)
+        if value is None:
+            return super().paint(painter, option, index)
+
+        # draw the item panel (selection, alternating colors...) but not the text
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        widget = opt.widget
+        style = widget.style() if widget is not None else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, opt, painter, widget)
+
+        # draw the slider straight into the view's painter, with a style option
+        # built for this cell (the hidden slider only provides state and helpers)
+        slider = self._templateSlider()
+        with signals_blocked(slider):
+            slider.setValue(self._toSliderValue(value))
+        sopt = QStyleOptionSlider()
+        slider.initStyleOption(sopt)
+        sopt.rect = QRect(QPoint(), opt.rect.size())
+        sopt.palette = opt.palette
+        enabled = QStyle.StateFlag.State_Enabled
+        sopt.state = (sopt.state & ~enabled) | (opt.state & enabled)
+        painter.save()
+        # paint at the origin, so the geometry caches of the slider are shared
+        # by all cells of the same size
+        painter.translate(opt.rect.topLeft())
+        slider._paint(painter, sopt)
+        painter.restore()
+
+    def createEditor(
+        self,
+        parent: QWidget | None,
+        option: QStyleOptionViewItem,
+        index: QModelIndex | QPersistentModelIndex,
+    ) -> QWidget | None:
+        editor = self._createSlider(parent)
+        editor.setAutoFillBackground(True)
+        editor.valueChanged.connect(lambda *_: self.commitData.emit(editor))
+        return editor
+
+    def setEditorData(
+        self, editor: QWidget | None, index: QModelIndex | QPersistentModelIndex
+    ) -> None:
+        value = index.data(Qt.ItemDataRole.EditRole)
+        if value is not None:
+            with signals_blocked(editor):
+                editor.setValue(self._toSliderValue(value))  # type: ignore
+
+    def setModelData(
+        self,
+        editor: QWidget | None,
+        model: QAbstractItemModel | None,
+        index: QModelIndex | QPersistentModelIndex,
+    ) -> None:
+        if editor is None or model is None:  # pragma: no cover
+            return
+        old = index.data(Qt.ItemDataRole.EditRole)
+        value = self._toModelValue(editor.value(), old)  # type: ignore
+        if value != old:
+            model.setData(index, value, Qt.ItemDataRole.EditRole)
+
+    def updateEditorGeometry(
+        self,
+        editor: QWidget | None,
+        option: QStyleOptionViewItem,
+        index: QModelIndex | QPersistentModelIndex,
+    ) -> None:
+        if editor is not None:
+            editor.setGeometry(option.rect)
+
+    # ###############  Implementation Details  #######################
+
+    def _createSlider(self, parent: QWidget | None = None) -> _GenericSlider:
+        slider = self._slider_class(self._orientation, parent)
+        slider.setRange(self._minimum, self._maximum)
+        return slider
+
+    def _templateSlider(self) -> _GenericSlider:
+        if self._template is None:
+            self._template = self._createSlider()
+            self._template.setAttribute(Qt.WidgetAttribute.WA_DontShowOnScreen)
+        return self._template
+
+    def _toSliderValue(self, value: Any) -> Any:
+        return float(value)
+
+    def _toModelValue(self, value: Any, old: Any) -> Any:
+        return _cast_like(value, old)
+
+
+class QRangeSliderItemDelegate(QSliderItemDelegate):
+    """Delegate that draws and edits sequences of model values as range sliders.
+
+    Same as `QSliderItemDelegate`, but the data of each index must be a sequence
+    of values (one per handle), and is written back as a tuple.
+    """
+
+    _slider_class = QDoubleRangeSlider
+
+    def _toSliderValue(self, value: Any) -> Any:
+        return tuple(float(v) for v in value)
+
+    def _toModelValue(self, value: Any, old: Any) -> Any:
+        if old is not None and len(old) == len(value):
+            value = (_cast_like(v, o) for o, v in zip(old, value, strict=True))
+        return tuple(value)
@@ -1,21 +1,32 @@
-from collections.abc import Sequence
-from typing import TypeVar
+import operator
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, TypeVar
 
 from qtpy import QtGui
 from qtpy.QtCore import Property, QEvent, QPoint, QPointF, QRect, QRectF, Qt, Signal
+from qtpy.QtGui import QPainter, QPixmap
 from qtpy.QtWidgets import QSlider, QStyle, QStyleOptionSlider, QStylePainter
 
+from superqt.utils import signals_blocked
+
 from ._generic_slider import CC_SLIDER, SC_GROOVE, SC_HANDLE, SC_NONE, _GenericSlider
 from ._range_style import (
     MONTEREY_SLIDER_STYLES_FIX,
     RangeSliderStyle,
     update_styles_from_stylesheet,
 )
+from ._scales import _is_array
 
 _T = TypeVar("_T")
 
 
 SC_BAR = QStyle.SubControl.SC_ScrollBarSubPage
+# extra pixels around the handle rect captured in the cached handle pixmap,
+# to make room for shadows and focus frames drawn outside of the handle rect.
+_HANDLE_PIXMAP_PAD = 4
 
 
 class _GenericRangeSlider(_GenericSlider):
@@ -39,8 +50,20 @@ class _GenericRangeSlider(_GenericSlider):
     # The value is the positions of *all* handles.
     slidersMoved = Signal(tuple)
 
+    # above this number of handles, handles that are neither pressed nor hovered
+    # are painted from a single cached pixmap instead of by the style.
+    _HANDLE_PIXMAP_THRESHOLD = 8
+
     def __init__(self, *args, **kwargs):
         self._style = RangeSliderStyle()
+        # (key, value) caches for the handle geometry and the handle pixmap.
+        # see `_handleGeometry` and `_handlePixmap`
+        self._handle_geometry_cache: tuple | None = None
+        self._handle_pixmap_cache: tuple | None = None
+        # whether values and positions are stored (and returned) as numpy arrays
+        self._array_mode = False
+        # nesting depth of `batchUpdates` contexts
+        self._batch_depth = 0
 
         super().__init__(*args, **kwargs)
 
@@ -50,6 +73,9 @@ class _GenericRangeSlider(_GenericSlider):
         # list of current positions of each handle. same length as _value
         # If tracking is enabled (the default) this will be identical to _value
         self._position: list[_T] = [20, 80]
+        # whether `_position` is sorted (the usual case), which lets hit-testing
+        # bisect the positions.  Updated whenever positions are set.
+        self._positions_sorted = True
 
         # which handle is being pressed/hovered
         self._pressedIndex = 0
@@ -110,6 +136,65 @@ class _GenericRangeSlider(_GenericSlider):
         """Show the bar between the first and last handle."""
         self.setBarVisible(True)
 
+    def arrayMode(self) -> bool:
+        """Whether values and positions are stored and returned as numpy arrays."""
+        return self._array_mode
+
+    def setArrayMode(self, enabled: bool = True) -> None:
+        """Store and return the values and positions of the handles as numpy arrays.
+
+        In array mode, `value()` and `sliderPosition()` return (copies of) numpy
+        arrays, `setValue` and `setSliderPosition` accept any sequence or array, and
+        the handles are bounded all at once with numpy instead of one by one.  This is
+        much faster for sliders with many handles.  Signals keep emitting tuples.
+
+        Unlike the default mode, `setSliderPosition` with all positions keeps the
+        handles in order (at least `singleStep()` or one allowed value apart)
+        regardless of the order in which they are set, so `reversed` is ignored.
+        """
+        enabled = bool(enabled)
+        if enabled == self._array_mode:
+            return
+        if enabled:
+            import numpy as np
+
+            self._value = self._type_cast_array(np.array(self._value, dtype=float))
+            self._position = self._type_cast_array(
+                np.array(self._position, dtype=float)
+            )
+        else:
+            self._value = self._value.tolist()
+            self._position = self._position.tolist()
+        self._array_mode = enabled
+
+    @contextmanager
+    def batchUpdates(self) -> Iterator[None]:
+        """Context manager coalescing value changes into a single emission.
+
+        `valueChanged` (and `sliderMoved`) are not emitted for changes made inside
+        the context.  Instead, `valueChanged` is emitted once on exit if the value
+        changed, so that programmatic updates of many handles trigger a single
+        update of connected widgets.
+
+        Examples
+        --------
+        >>> with slider.batchUpdates():
+        ...     for i, v in updates:
+        ...         slider.setSliderPosition(v, i)
+        """
+        if self._batch_depth == 0:
+            before = self.value()
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                value = self.value()
+                if not self._valuesEqual(before, value):
+                    self.update()
+                    self.valueChanged.emit(self._signalArg(value))
+
     def applyMacStylePatch(self) -> None:
         """Apply a QSS patch to fix sliders on macos>=12 with QT < 6.
 
@@ -121,14 +206,29 @@ class _GenericRangeSlider(_GenericSlider):
     # ###############  QtOverrides  #######################
 
     def value(self) -> tuple[_T, ...]:
-        """Get current value of the widget as a tuple of integers."""
+        """Get current value of the widget as a tuple of integers.
+
+        In array mode (see `setArrayMode`), a numpy array is returned instead.
+        """
+        if self._array_mode:
+            return self._value.copy()  # type: ignore
         return tuple(self._value)
 
+    def setValue(self, value: Sequence[_T]) -> None:  # type: ignore [override]
+        if self._batch_depth:
+            with signals_blocked(self):
+                super().setValue(value)  # type: ignore [arg-type]
+        else:
+            super().setValue(value)  # type: ignore [arg-type]
+
     def sliderPosition(self):
         """Get current value of the widget as a tuple of integers.
 
         If tracking is enabled (the default) this will be identical to value().
+        In array mode (see `setArrayMode`), a numpy array is returned instead.
         """
+        if self._array_mode:
+            return self._position.astype(float)
         return tuple(float(i) for i in self._position)
 
     def setSliderPosition(  # type: ignore
@@ -153,6 +253,21 @@ class _GenericRangeSlider(_GenericSlider):
             Order in which to set the positions.  Can be useful when setting multiple
             positions, to avoid intermediate overlapping values.
         """
+        if self._array_mode and (isinstance(pos, (list, tuple)) or _is_array(pos)):
+            if len(pos) != len(self._position):
+                msg = "'sliderPosition' must have same length as 'value()' "
+                raise ValueError(msg + f"({len(self._position)})")
+            self._position = self._boundArray(pos, neighbors=True)
+            self._positions_sorted = _is_sorted(self._position)
+            if self._batch_depth:
+                with signals_blocked(self):
+                    self._doSliderMove()
+            else:
+                self._doSliderMove()
+            return
+
+        if _is_array(pos):
+            pos = pos.tolist()
         if isinstance(pos, (list, tuple)):
             val_len = len(self.value())
             if len(pos) != val_len:
@@ -167,8 +282,19 @@ class _GenericRangeSlider(_GenericSlider):
 
         for idx, position in pairs:
             self._position[idx] = self._bound(position, idx)
+        if len(pairs) == 1 and self._positions_sorted:
+            # only the neighbors of the moved handle need to be checked
+            idx = pairs[0][0] % len(self._position)
+            lo, hi = max(idx - 1, 0), idx + 2
+            self._positions_sorted = _is_sorted(self._position[lo:hi])
+        else:
+            self._positions_sorted = _is_sorted(self._position)
 
-        self._doSliderMove()
+        if self._batch_depth:
+            with signals_blocked(self):
+                self._doSliderMove()
+        else:
+            self._doSliderMove()
 
     def setStyleSheet(self, styleSheet: str) -> None:
         return super().setStyleSheet(self._patch_style(styleSheet))
@@ -178,17 +304,12 @@ class _GenericRangeSlider(_GenericSlider):
         # sub-page styles render on top of the lower sliders and don't work here.
         if self._style._macpatch and not style:
             style = MONTEREY_SLIDER_STYLES_FIX
-
-        override = f"""
-            \n{type(self).__name__}::sub-page:horizontal
-                {{background: none; border: none}}
-            \n{type(self).__name__}::add-page:vertical
-                {{background: none; border: none}}
-        """
-        return style + override
+        return style + _style_override(type(self).__name__)
 
     def event(self, ev: QEvent) -> bool:
         if ev.type() == QEvent.Type.StyleChange:
+            self._handle_geometry_cache = None
+            self._handle_pixmap_cache = None
             update_styles_from_stylesheet(self)
         return super().event(ev)
 
@@ -207,19 +328,40 @@ class _GenericRangeSlider(_GenericSlider):
         return event.pos() if hasattr(event, "pos") else event.position()
 
     def paintEvent(self, ev: QtGui.QPaintEvent) -> None:
-        painter = QStylePainter(self)
-        opt = self._styleOption
+        self._paint(QStylePainter(self), self._styleOption)
 
+    # ###############  Implementation Details  #######################
+
+    def _paint(self, painter: QPainter, opt: QStyleOptionSlider) -> None:
+        self._draw_histogram(painter, opt)
         self._draw_groove_and_ticks(painter, opt, handle=False)
         self._draw_handle(painter, opt)
 
-    # ###############  Implementation Details  #######################
-
     def _setPosition(self, val):
-        self._position = list(val)
+        if self._array_mode:
+            import numpy as np
+
+            self._position = np.array(val)
+        else:
+            self._position = list(val)
+        self._positions_sorted = _is_sorted(self._position)
+
+    def _valuesEqual(self, a: Any, b: Any) -> bool:
+        if _is_array(a) or _is_array(b):
+            import numpy as np
+
+            return bool(np.array_equal(a, b))
+        return a == b  # type: ignore [no-any-return]
+
+    def _signalArg(self, value: Any) -> Any:
+        return tuple(value.tolist()) if _is_array(value) else value
 
     def _bound(self, value, index=None):
-        if isinstance(value, (list, tuple)):
+        if _is_array(value) or isinstance(value, (list, tuple)):
+            if self._array_mode:
+                return self._boundArray(value)
+            if _is_array(value):
+                value = value.tolist()
             return type(value)(self._bound(v) for v in value)
         pos = super()._bound(value)
         if index is not None:
@@ -227,9 +369,22 @@ class _GenericRangeSlider(_GenericSlider):
         return self._type_cast(pos)
 
     def _neighbor_bound(self, val, index):
+        _lst = self._position
+        if self._allowed_values is not None:
+            # keep at least one allowed value between neighboring handles
+            values = self._allowed_values
+            if index > 0:
+                idx = bisect_right(values, _lst[index - 1])
+                if idx < len(values):
+                    val = max(values[idx], val)
+            if index < (len(_lst) - 1):
+                idx = bisect_left(values, _lst[index + 1]) - 1
+                if idx >= 0:
+                    val = min(values[idx], val)
+            return val
+
         # make sure we don't go lower than any preceding index:
         min_dist = self.singleStep()
-        _lst = self._position
         if index > 0:
             val = max(_lst[index - 1] + min_dist, val)
         # make sure we don't go higher than any following index:
@@ -237,6 +392,27 @@ class _GenericRangeSlider(_GenericSlider):
             val = min(_lst[index + 1] - min_dist, val)
         return val
 
+    def _boundArray(self, values: Any, neighbors: bool = False) -> Any:
+        """Vectorized `_bound` of the positions of all handles, as a numpy array.
+
+        If `neighbors` is True, the handles are also kept in order and at least
+        `singleStep()` (or one allowed value) apart, like `_neighbor_bound`.
+        """
+        import numpy as np
+
+        arr = np.array(values, dtype=float)
+        allowed = self._allowed_values
+        if allowed is not None:
+            allowed = np.asarray(allowed, dtype=float)
+            indices = _nearest_indices(allowed, arr)
+            if neighbors:
+                indices = _ordered(indices, 1, 0, len(allowed) - 1).astype(int)
+            arr = allowed[indices]
+        elif neighbors:
+            arr = _ordered(arr, self.singleStep(), self._minimum, self._maximum)
+        arr = np.clip(arr, self._minimum, self._maximum)
+        return self._type_cast_array(arr)
+
     def _getBarColor(self):
         return self._style.brush(self._styleOption)
 
@@ -255,24 +431,118 @@ class _GenericRangeSlider(_GenericSlider):
                 offset = self.maximum() - ref[-1]
             elif ref[0] + offset < self.minimum():
                 offset = self.minimum() - ref[0]
-        self.setSliderPosition([i + offset for i in ref], reversed=offset > 0)
+        if self._array_mode:
+            new_pos = ref + offset
+        else:
+            new_pos = [i + offset for i in ref]
+        self.setSliderPosition(new_pos, reversed=offset > 0)
+
+    def _offsetAllIndices(self, steps: int) -> None:
+        """Move all handles by `steps` indices in the allowed values."""
+        values = self._allowed_values
+        indices = [self._allowedIndex(p) for p in self._position]
+        if self._bar_is_rigid:
+            steps = max(-indices[0], min(len(values) - 1 - indices[-1], steps))
+        self.setSliderPosition(
+            [values[max(0, min(len(values) - 1, i + steps))] for i in indices],
+            reversed=steps > 0,
+        )
 
     def _fixStyleOption(self, option):
         pass
 
     @property
     def _optSliderPositions(self):
-        return [self._to_qinteger_space(p - self._minimum) for p in self._position]
+        return self._to_qinteger_positions(self._position)
 
     # SubControl Positions
 
+    def _handleGeometry(self, opt: QStyleOptionSlider) -> tuple[QRect, int]:
+        """Return the handle rect at the start of the groove, and its travel span.
+
+        The style is only queried when the geometry of the slider changes. Every
+        handle rect is then a translation of the returned rect along the groove by
+        `QStyle.sliderPositionFromValue(opt.minimum, opt.maximum, pos, span)`.
+        """
+        key = (
+            opt.rect.getRect(),
+            opt.orientation,
+            opt.upsideDown,
+            opt.tickPosition,
+            opt.minimum,
+            opt.maximum,
+        )
+        if self._handle_geometry_cache is None or self._handle_geometry_cache[0] != key:
+            style = self.style()
+            old_pos = opt.sliderPosition
+            opt.sliderPosition = opt.minimum
+            r_min = style.subControlRect(CC_SLIDER, opt, SC_HANDLE, self)
+            opt.sliderPosition = opt.maximum
+            r_max = style.subControlRect(CC_SLIDER, opt, SC_HANDLE, self)
+            opt.sliderPosition = old_pos
+            if opt.orientation == Qt.Orientation.Horizontal:
+                delta = r_max.x() - r_min.x()
+            else:
+                delta = r_max.y() - r_min.y()
+            base = r_max if delta < 0 else r_min
+            self._handle_geometry_cache = (key, (base, abs(delta)))
+        return self._handle_geometry_cache[1]  # type: ignore [no-any-return]
+
+    def _handleOffset(self, position: float, opt: QStyleOptionSlider, span: int) -> int:
+        """Return the pixel offset of the handle at `position` along the groove."""
+        return QStyle.sliderPositionFromValue(
+            opt.minimum,
+            opt.maximum,
+            self._to_qinteger_position(position),
+            span,
+            opt.upsideDown,
+        )
+
     def _handleRect(
         self, handle_index: int, opt: QStyleOptionSlider | None = None
     ) -> QRect:
-        """Return the QRect for all handles."""
+        """Return the QRect for the handle at `handle_index`."""
         opt = opt or self._styleOption
-        opt.sliderPosition = self._optSliderPositions[handle_index]
-        return self.style().subControlRect(CC_SLIDER, opt, SC_HANDLE, self)
+        base, span = self._handleGeometry(opt)
+        offset = self._handleOffset(self._position[handle_index], opt, span)
+        if opt.orientation == Qt.Orientation.Horizontal:
+            return base.translated(offset, 0)
+        return base.translated(0, offset)
+
+    def _handleIndexAtPos(self, pos: QPoint, opt: QStyleOptionSlider) -> int | None:
+        """Return the lowest index of the handles containing `pos`, if any."""
+        positions = self._position
+        if not self._positions_sorted:
+            for i in range(len(positions)):
+                if self._handleRect(i, opt).contains(pos):
+                    return i
+            return None
+
+        base, span = self._handleGeometry(opt)
+        if opt.orientation == Qt.Orientation.Horizontal:
+            if not base.top() <= pos.y() <= base.bottom():
+                return None
+            rel, length = pos.x() - base.x(), base.width()
+        else:
+            if not base.left() <= pos.x() <= base.right():
+                return None
+            rel, length = pos.y() - base.y(), base.height()
+
+        # a handle contains `pos` if its offset is in [rel - length + 1, rel].
+        # Offsets are monotonic in the (sorted) positions, so the lowest candidate
+        # index can be found with a bisection.
+        def _offset(p: float) -> int:
+            return self._handleOffset(p, opt, span)
+
+        if opt.upsideDown:  # offsets decrease with increasing index
+            idx = bisect_left(positions, -rel, key=lambda p: -_offset(p))
+            if idx < len(positions) and _offset(positions[idx]) > rel - length:
+                return idx
+        else:
+            idx = bisect_left(positions, rel - length + 1, key=_offset)
+            if idx < len(positions) and _offset(positions[idx]) <= rel:
+                return idx
+        return None
 
     def _barRect(self, opt: QStyleOptionSlider) -> QRect:
         """Return the QRect for the bar between the outer handles."""
@@ -298,7 +568,7 @@ class _GenericRangeSlider(_GenericSlider):
 
     # Painting
 
-    def _drawBar(self, painter: QStylePainter, opt: QStyleOptionSlider):
+    def _drawBar(self, painter: QPainter, opt: QStyleOptionSlider):
         brush = self._style.brush(opt)
         r_bar = self._barRect(opt)
         if isinstance(brush, QtGui.QGradient):
@@ -308,22 +578,75 @@ class _GenericRangeSlider(_GenericSlider):
         painter.setBrush(brush)
         painter.drawRect(r_bar)
 
-    def _draw_handle(self, painter: QStylePainter, opt: QStyleOptionSlider):
+    def _draw_handle(self, painter: QPainter, opt: QStyleOptionSlider):
         if self._should_draw_bar:
             self._drawBar(painter, opt)
 
         opt.subControls = SC_HANDLE
         pidx = self._pressedIndex if self._pressedControl == SC_HANDLE else -1
         hidx = self._hoverIndex if self._hoverControl == SC_HANDLE else -1
-        for idx, pos in enumerate(self._optSliderPositions):
+        # keyboard input moves the last pressed handle, only that one shows focus
+        has_focus = bool(opt.state & QStyle.StateFlag.State_HasFocus)
+        fidx = self._pressedIndex if has_focus else -1
+        positions = self._optSliderPositions
+        pixmap = None
+        if len(positions) > self._HANDLE_PIXMAP_THRESHOLD:
+            pixmap, origin, span = self._handlePixmap(opt)
+            horizontal = opt.orientation == Qt.Orientation.Horizontal
+        for idx, pos in enumerate(positions):
+            if pixmap is not None and idx not in (pidx, hidx, fidx):
+                offset = QStyle.sliderPositionFromValue(
+                    opt.minimum, opt.maximum, pos, span, opt.upsideDown
+                )
+                if horizontal:
+                    painter.drawPixmap(origin.x() + offset, origin.y(), pixmap)
+                else:
+                    painter.drawPixmap(origin.x(), origin.y() + offset, pixmap)
+                continue
             opt.sliderPosition = pos
             # make pressed handles appear sunken
             if idx == pidx:
                 opt.state |= QStyle.StateFlag.State_Sunken
             else:
                 opt.state = opt.state & ~QStyle.StateFlag.State_Sunken
+            if idx == fidx:
+                opt.state |= QStyle.StateFlag.State_HasFocus
+            else:
+                opt.state = opt.state & ~QStyle.StateFlag.State_HasFocus
             opt.activeSubControls = SC_HANDLE if idx == hidx else SC_NONE
-            painter.drawComplexControl(CC_SLIDER, opt)
+            self.style().drawComplexControl(CC_SLIDER, opt, painter, self)
+
+    def _handlePixmap(self, opt: QStyleOptionSlider) -> tuple[QPixmap, QPoint, int]:
+        """Return a pixmap of an idle handle at the start of the groove.
+
+        Also returns the top left corner of the pixmap and the travel span of the
+        handle (see `_handleGeometry`).
+        """
+        base, span = self._handleGeometry(opt)
+        # idle handles are neither pressed, hovered nor focused (see `_draw_handle`)
+        state = opt.state & ~(
+            QStyle.StateFlag.State_Sunken | QStyle.StateFlag.State_HasFocus
+        )
+        dpr = self.devicePixelRatioF()
+        key = (self._handle_geometry_cache, state, opt.palette.cacheKey(), dpr)
+        if self._handle_pixmap_cache is None or self._handle_pixmap_cache[0] != key:
+            pad = _HANDLE_PIXMAP_PAD
+            src = base.adjusted(-pad, -pad, pad, pad)
+            pixmap = QPixmap(round(src.width() * dpr), round(src.height() * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
+
+            hopt = QStyleOptionSlider(opt)
+            hopt.subControls = SC_HANDLE
+            hopt.activeSubControls = SC_NONE
+            hopt.state = state
+            hopt.sliderPosition = opt.maximum if opt.upsideDown else opt.minimum
+            painter = QPainter(pixmap)
+            painter.translate(-src.x(), -src.y())
+            self.style().drawComplexControl(CC_SLIDER, hopt, painter, self)
+            painter.end()
+            self._handle_pixmap_cache = (key, (pixmap, src.topLeft(), span))
+        return self._handle_pixmap_cache[1]  # type: ignore [no-any-return]
 
     def _updateHoverControl(self, pos):
         old_hover = self._hoverControl, self._hoverIndex
@@ -338,7 +661,10 @@ class _GenericRangeSlider(_GenericSlider):
     def _setClickOffset(self, pos):
         if self._pressedControl == SC_BAR:
             self._clickOffset = self._pixelPosToRangeValue(self._pick(pos))
-            self._sldPosAtPress = tuple(self._position)
+            if self._array_mode:
+                self._sldPosAtPress = self._position.copy()
+            else:
+                self._sldPosAtPress = tuple(self._position)
         elif self._pressedControl == SC_HANDLE:
             hr = self._handleRect(self._pressedIndex)
             self._clickOffset = self._pick(pos - hr.topLeft())
@@ -353,27 +679,36 @@ class _GenericRangeSlider(_GenericSlider):
         if isinstance(pos, QPointF):
             pos = pos.toPoint()
 
-        for i in range(len(self._position)):
-            if self._handleRect(i, opt).contains(pos):
-                return (SC_HANDLE, i)
+        handle_index = self._handleIndexAtPos(pos, opt)
+        if handle_index is not None:
+            return (SC_HANDLE, handle_index)
 
         click_pos = self._pixelPosToRangeValue(self._pick(pos))
-        for i, p in enumerate(self._position):
-            if p > click_pos:
-                if i > 0:
-                    # the click was in an internal segment
-                    if self._bar_moves_all:
-                        return (SC_BAR, i)
-                    avg = (self._position[i - 1] + self._position[i]) / 2
-                    return (SC_HANDLE, i - 1 if click_pos < avg else i)
-                # the click was below the minimum slider
-                return (SC_HANDLE, 0)
+        positions = self._position
+        # index of the first handle above the click
+        if self._positions_sorted:
+            i = bisect_right(positions, click_pos)
+        else:
+            i = next(
+                (i for i, p in enumerate(positions) if p > click_pos), len(positions)
+            )
+        if i < len(positions):
+            if i > 0:
+                # the click was in an internal segment
+                if self._bar_moves_all:
+                    return (SC_BAR, i)
+                avg = (positions[i - 1] + positions[i]) / 2
+                return (SC_HANDLE, i - 1 if click_pos < avg else i)
+            # the click was below the minimum slider
+            return (SC_HANDLE, 0)
         # the click was above the maximum slider
-        return (SC_HANDLE, len(self._position) - 1)
+        return (SC_HANDLE, len(positions) - 1)
 
     def _execute_scroll(self, steps_to_scroll, modifiers):
         if modifiers & Qt.KeyboardModifier.AltModifier:
             self._spreadAllPositions(shrink=steps_to_scroll < 0)
+        elif self._allowed_values is not None:
+            self._offsetAllIndices(self._indexSteps(steps_to_scroll))
         else:
             self._offsetAllPositions(steps_to_scroll)
         self.triggerAction(QSlider.SliderAction.SliderMove)
@@ -391,4 +726,48 @@ class _GenericRangeSlider(_GenericSlider):
         if shrink:
             gain = 1 / gain
         center = abs(ref[-1] + ref[0]) / 2
-        self.setSliderPosition([((i - center) * gain) + center for i in ref])
+        if self._array_mode:
+            self.setSliderPosition((ref - center) * gain + center)
+        else:
+            self.setSliderPosition([((i - center) * gain) + center for i in ref])
+
+
+@lru_cache(maxsize=32)
+def _style_override(class_name: str) -> str:
+    """Return the stylesheet disabling the sub-/add-page of a range slider class."""
+    return f"""
+            \n{class_name}::sub-page:horizontal
+                {{background: none; border: none}}
+            \n{class_name}::add-page:vertical
+                {{background: none; border: none}}
+        """
+
+
+def _is_sorted(values: Sequence[float]) -> bool:
+    """Return True if `values` is monotonically non-decreasing."""
+    if _is_array(values):
+        return bool((values[1:] >= values[:-1]).all())  # type: ignore
+    return all(map(operator.le, values, values[1:]))
+
+
+def _nearest_indices(allowed: Any, values: Any) -> Any:
+    """Vectorized `_GenericSlider._allowedIndex` (ties go to the lower value)."""
+    import numpy as np
+
+    idx = np.searchsorted(allowed, values)
+    lo = np.maximum(idx - 1, 0)
+    hi = np.minimum(idx, len(allowed) - 1)
+    use_lo = (idx == len(allowed)) | (
+        (idx > 0) & (values - allowed[lo] <= allowed[hi] - values)
+    )
+    return np.where(use_lo, lo, hi)
+
+
+def _ordered(values: Any, step: float, lo: float, hi: float) -> Any:
+    """Make `values` increase by at least `step`, within [lo, hi] where possible."""
+    import numpy as np
+
+    ramp = np.arange(len(values)) * step
+    values = np.clip(values, lo + ramp, hi - ramp[::-1])
+    # `values - ramp` must be non-decreasing
+    return np.maximum.accumulate(values - ramp) + ramp
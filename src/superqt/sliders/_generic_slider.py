@@ -20,12 +20,17 @@ scalar (with one handle per item), and it forms the basis of
 QRangeSlider.
 """
 
+from __future__ import annotations
+
 import os
 import platform
-from typing import Any, TypeVar
+from bisect import bisect_left
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from qtpy import QT_VERSION, QtGui
-from qtpy.QtCore import QEvent, QPoint, QPointF, QRect, Qt, Signal
+from qtpy.QtCore import QEvent, QPoint, QPointF, QRect, QRectF, Qt, Signal
+from qtpy.QtGui import QPainter, QPainterPath, QPalette, QPixmap
 from qtpy.QtWidgets import (
     QApplication,
     QSlider,
@@ -34,7 +39,15 @@ from qtpy.QtWidgets import (
     QStylePainter,
 )
 
+from superqt.utils import QSignalThrottler
+
 from ._range_style import MONTEREY_SLIDER_STYLES_FIX
+from ._scales import LinearScale, SliderScale, _is_array, _resolve_scale
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+    from superqt.utils import FunctionWorker
 
 _T = TypeVar("_T")
 
@@ -89,6 +102,18 @@ class _GenericSlider(QSlider):
         # fraction of total range to scroll when holding Ctrl while scrolling
         self._control_fraction = 0.04
 
+        # histogram drawn behind the groove, as (counts, edges)
+        self._histogram: tuple[tuple[float, ...], tuple[float, ...]] | None = None
+        self._histogram_pixmap_cache: tuple | None = None
+        # incremented on each `setHistogramData` call, to drop stale thread results
+        self._histogram_request = 0
+        # sorted table of the values the slider snaps to, see `setAllowedValues`
+        self._allowed_values: Sequence[float] | None = None
+        # maps values to positions along the groove, see `setScale`
+        self._scale: SliderScale = LinearScale()
+        # coalesces value changes while dragging, see `setDragEmissionInterval`
+        self._drag_throttler: QSignalThrottler | None = None
+
         super().__init__(*args, **kwargs)
         self._rename_signals()
 
@@ -109,6 +134,189 @@ class _GenericSlider(QSlider):
         """
         self.setStyleSheet(MONTEREY_SLIDER_STYLES_FIX)
 
+    # ###############  New Public API  #######################
+
+    def histogram(self) -> tuple[tuple[float, ...], tuple[float, ...]] | None:
+        """Return the `(counts, edges)` of the histogram behind the groove, if any."""
+        return self._histogram
+
+    def setHistogram(self, counts: Sequence[float], edges: Sequence[float]) -> None:
+        """Show a histogram behind the groove of the slider.
+
+        The histogram is rendered once into a cached pixmap, which is only redrawn
+        when the histogram, the size or the range of the slider changes.
+
+        Parameters
+        ----------
+        counts : Sequence[float]
+            Height of each bin (e.g. the first output of `numpy.histogram`).
+        edges : Sequence[float]
+            Bin edges, in slider value space, of length `len(counts) + 1`
+            (e.g. the second output of `numpy.histogram`).
+        """
+        _counts = tuple(float(c) for c in counts)
+        _edges = tuple(float(e) for e in edges)
+        if len(_edges) != len(_counts) + 1:
+            raise ValueError(
+                f"'edges' must have length len(counts) + 1 ({len(_counts) + 1}), "
+                f"got {len(_edges)}"
+            )
+        self._histogram = (_counts, _edges)
+        self._histogram_pixmap_cache = None
+        self.update()
+
+    def clearHistogram(self) -> None:
+        """Remove the histogram shown behind the groove."""
+        self._histogram_request += 1  # drop pending results from `setHistogramData`
+        self._histogram = None
+        self._histogram_pixmap_cache = None
+        self.update()
+
+    def setHistogramData(
+        self,
+        data: Any,
+        bins: int | Sequence[float] = 256,
+        range: tuple[float, float] | None = None,
+        *,
+        threaded: bool = False,
+    ) -> FunctionWorker | None:
+        """Bin `data` with `numpy.histogram` and show it behind the groove.
+
+        Requires numpy.
+
+        Parameters
+        ----------
+        data : array-like
+            Data to bin.  It is flattened before binning.
+        bins : int | Sequence[float]
+            Number of bins, or bin edges.  Passed to `numpy.histogram`.
+            By default 256.
+        range : tuple[float, float], optional
+            Lower and upper range of the bins.  Passed to `numpy.histogram`.
+            By default, the min and max of `data`.
+        threaded : bool
+            If `True`, bin `data` in another thread (see
+            [`create_worker`][superqt.utils.create_worker]) and show the histogram
+            when done.  Useful for large arrays, which would otherwise block the
+            event loop.  By default `False`.
+
+        Returns
+        -------
+        FunctionWorker | None
+            The started worker if `threaded` is `True`, otherwise `None`.
+        """
+        self._histogram_request += 1
+        if not threaded:
+            self.setHistogram(*_compute_histogram(data, bins, range))
+            return None
+
+        from superqt.utils import create_worker
+
+        request = self._histogram_request
+
+        def _on_returned(result: tuple[Any, Any]) -> None:
+            # ignore results that were superseded while binning
+            if request == self._histogram_request:
+                # the slider may have been deleted while binning
+                with suppress(RuntimeError):
+                    self.setHistogram(*result)
+
+        return create_worker(
+            _compute_histogram,
+            data,
+            bins,
+            range,
+            _start_thread=True,
+            _connect={"returned": _on_returned},
+        )
+
+    def allowedValues(self) -> Sequence[float] | None:
+        """Return the sorted sequence of values the slider snaps to, if any."""
+        return self._allowed_values
+
+    def setAllowedValues(self, values: Sequence[float] | None) -> None:
+        """Restrict the slider to a sorted sequence of allowed values.
+
+        Values and positions snap to the nearest allowed value (found by bisection,
+        so dragging stays fast with millions of allowed values), and scrolling moves
+        by whole indices in `values`, one index per `singleStep()`.  The range of the
+        slider is set to the first and last allowed values.
+
+        Parameters
+        ----------
+        values : Sequence[float] | None
+            Allowed values, sorted in ascending order.  Any sequence supporting
+            `len()` and indexing can be used (e.g. a numpy array) and it is not
+            copied.  If `None`, any value in the range is allowed again.
+        """
+        if values is not None:
+            if not len(values):
+                raise ValueError("'values' must not be empty")
+            self._allowed_values = values
+            self.setRange(values[0], values[-1])
+        else:
+            self._allowed_values = None
+        self.setValue(self._value)  # re-bound
+
+    def scale(self) -> SliderScale:
+        """Return the scale mapping slider values to positions along the groove."""
+        return self._scale
+
+    def setScale(
+        self, scale: str | SliderScale | tuple[Callable, Callable] | None
+    ) -> None:
+        """Set the scale mapping slider values to positions along the groove.
+
+        Handle positions, tick marks and the histogram follow the scale, while
+        `value()` and all signals remain in (untransformed) value space.
+
+        Parameters
+        ----------
+        scale : str | SliderScale | tuple[Callable, Callable] | None
+            One of `'linear'` (the default, also used for `None`), `'log'`,
+            `'symlog'` or `'power'`, a `SliderScale` instance (e.g.
+            `LogScale(base=2)` or `PowerScale(0.5)`), or a `(forward, inverse)`
+            pair of monotonically increasing functions.
+        """
+        self._scale = _resolve_scale(scale)
+        self._histogram_pixmap_cache = None
+        self.update()
+
+    def dragEmissionInterval(self) -> int | None:
+        """Return the minimum interval (ms) between value changes while dragging.
+
+        `None` (the default) means that the value changes on every mouse move.
+        """
+        if self._drag_throttler is None:
+            return None
+        return self._drag_throttler.timeout()
+
+    def setDragEmissionInterval(self, msec: int | None) -> None:
+        """Coalesce value changes while the slider is dragged.
+
+        With tracking enabled, the value (and `valueChanged`) normally changes on
+        every mouse move.  With an interval set, the latest position is applied at
+        most once per `msec` milliseconds while dragging, and the final position is
+        always applied when the slider is released.
+
+        Parameters
+        ----------
+        msec : int | None
+            Minimum interval in milliseconds.  `0` applies the latest position at
+            most once per pass of the event loop (i.e. roughly once per repaint).
+            `None` (the default) applies every position immediately.
+        """
+        if msec is None:
+            if self._drag_throttler is not None:
+                self._flushDragEmission()
+                self._drag_throttler.deleteLater()
+                self._drag_throttler = None
+            return
+        if self._drag_throttler is None:
+            self._drag_throttler = QSignalThrottler(parent=self)
+            self._drag_throttler.triggered.connect(self._onDragThrottlerTriggered)
+        self._drag_throttler.setTimeout(max(0, int(msec)))
+
     # ###############  QtOverrides  #######################
 
     def value(self) -> _T:  # type: ignore
@@ -116,22 +324,24 @@ class _GenericSlider(QSlider):
 
     def setValue(self, value: _T) -> None:
         value = self._bound(value)
-        if self._value == value and self._position == value:
+        if self._valuesEqual(self._value, value) and self._valuesEqual(
+            self._position, value
+        ):
             return
         self._value = value
-        if self._position != value:
+        if not self._valuesEqual(self._position, value):
             self._setPosition(value)
             if self.isSliderDown():
-                self.sliderMoved.emit(self.sliderPosition())
+                self.sliderMoved.emit(self._signalArg(self.sliderPosition()))
         self.sliderChange(self.SliderChange.SliderValueChange)
-        self.valueChanged.emit(self.value())
+        self.valueChanged.emit(self._signalArg(self.value()))
 
     def sliderPosition(self) -> _T:  # type: ignore
         return self._position
 
     def setSliderPosition(self, pos: _T) -> None:
         position = self._bound(pos)
-        if position == self._position:
+        if self._valuesEqual(position, self._position):
             return
         self._setPosition(position)
         self._doSliderMove()
@@ -282,6 +492,7 @@ class _GenericSlider(QSlider):
             return
 
         ev.accept()
+        self._flushDragEmission()
         oldPressed = self._pressedControl
         self._pressedControl = SC_NONE
         self.setRepeatAction(QSlider.SliderAction.SliderNoAction)
@@ -301,25 +512,61 @@ class _GenericSlider(QSlider):
             e.accept()
 
     def paintEvent(self, ev: QtGui.QPaintEvent) -> None:
-        painter = QStylePainter(self)
-        opt = self._styleOption
-
-        self._draw_groove_and_ticks(painter, opt, handle=True)
+        self._paint(QStylePainter(self), self._styleOption)
 
     # ###############  Implementation Details  #######################
 
+    def _paint(self, painter: QPainter, opt: QStyleOptionSlider) -> None:
+        """Draw the slider described by `opt` with `painter`.
+
+        `painter` doesn't need to be active on this widget (e.g. item delegates
+        paint a hidden slider into the cells of a view).
+        """
+        self._draw_histogram(painter, opt)
+        self._draw_groove_and_ticks(painter, opt, handle=True)
+
     def _type_cast(self, val):
         return val
 
+    def _type_cast_array(self, values):
+        """Vectorized `_type_cast` for a numpy array."""
+        return values
+
+    def _valuesEqual(self, a: Any, b: Any) -> bool:
+        return a == b  # type: ignore [no-any-return]
+
+    def _signalArg(self, value: Any) -> Any:
+        """Convert a value or position to the type emitted by signals."""
+        return value
+
     def _setPosition(self, val):
         self._position = val
 
     def _bound(self, value: _T) -> _T:
+        if self._allowed_values is not None:
+            value = self._allowed_values[self._allowedIndex(value)]
         return self._type_cast(max(self._minimum, min(self._maximum, value)))
 
+    def _allowedIndex(self, value: float) -> int:
+        """Return the index of the allowed value closest to `value`."""
+        values = self._allowed_values
+        idx = bisect_left(values, value)  # type: ignore [arg-type]
+        if idx == len(values):  # type: ignore [arg-type]
+            return idx - 1
+        if idx > 0 and value - values[idx - 1] <= values[idx] - value:  # type: ignore
+            return idx - 1
+        return idx
+
+    def _indexSteps(self, add: float) -> int:
+        """Convert an offset in value space to a number of allowed value indices."""
+        n = round(add / self._singleStep) if self._singleStep else 0
+        if n == 0 and add:
+            return 1 if add > 0 else -1
+        return n
+
     def _fixStyleOption(self, option):
-        option.sliderPosition = self._to_qinteger_space(self._position - self._minimum)
-        option.sliderValue = self._to_qinteger_space(self._value - self._minimum)
+        option.sliderPosition = self._to_qinteger_position(self._position)
+        option.sliderValue = self._to_qinteger_position(self._value)
 
     def _to_qinteger_space(self, val, _max=None):
         """Converts a value to the internal integer space."""
@@ -329,6 +576,44 @@ class _GenericSlider(QSlider):
             return 0
         return int(min(QOVERFLOW, val / range_ * _max))
 
+    def _to_qinteger_position(self, val) -> int:
+        """Converts a value (rather than a distance) to the internal integer space.
+
+        Unlike `_to_qinteger_space`, this follows the scale of the slider.
+        """
+        if self._scale.linear:
+            return self._to_qinteger_space(val - self._minimum)
+        return self._to_qinteger_positions((val,))[0]
+
+    def _to_qinteger_positions(self, values: Iterable[float]) -> list[int]:
+        """Vectorized `_to_qinteger_position`."""
+        fractions = self._scaleFractions(values)
+        if _is_array(fractions):
+            import numpy as np
+
+            qpos = np.minimum(fractions * self.MAX_DISPLAY, QOVERFLOW)  # type: ignore
+            return qpos.astype(int).tolist()  # type: ignore [no-any-return]
+        return [int(min(QOVERFLOW, f * self.MAX_DISPLAY)) for f in fractions]
+
+    def _scaleFractions(self, values: Iterable[float]) -> Sequence[float]:
+        """Return the fraction of the groove between minimum and each value."""
+        if self._scale.linear:
+            range_ = self._maximum - self._minimum
+            if range_ == 0:
+                return [0.0 for _ in values]
+            if _is_array(values):
+                return (values - self._minimum) / range_  # type: ignore
+            return [(v - self._minimum) / range_ for v in values]
+        forward = self._scale.forward
+        t_min = forward(self._minimum)
+        t_range = forward(self._maximum) - t_min
+        if t_range == 0:
+            return [0.0 for _ in values]
+        transformed = self._scale.forward_many(values)
+        if _is_array(transformed):
+            return (transformed - t_min) / t_range  # type: ignore
+        return [(t - t_min) / t_range for t in transformed]
+
     def _pick(self, pt: QPoint) -> int:
         return pt.x() if self.orientation() == Qt.Orientation.Horizontal else pt.y()
 
@@ -341,10 +626,22 @@ class _GenericSlider(QSlider):
         if not self.hasTracking():
             self.update()
         if self.isSliderDown():
-            self.sliderMoved.emit(self.sliderPosition())
+            self.sliderMoved.emit(self._signalArg(self.sliderPosition()))
         if self.hasTracking() and not self._blocktracking:
+            if self._drag_throttler is not None and self.isSliderDown():
+                self._drag_throttler.throttle()
+            else:
+                self.triggerAction(QSlider.SliderAction.SliderMove)
+
+    def _onDragThrottlerTriggered(self) -> None:
+        if self.hasTracking():
             self.triggerAction(QSlider.SliderAction.SliderMove)
 
+    def _flushDragEmission(self) -> None:
+        """Apply any position still pending in the drag throttler."""
+        if self._drag_throttler is not None:
+            self._drag_throttler.flush(restart_timer=False)
+
     @property
     def _styleOption(self):
         opt = QStyleOptionSlider()
@@ -399,9 +696,16 @@ class _GenericSlider(QSlider):
             # some cases will draw the handle separately with _draw_handle()
             opt.subControls = SC_GROOVE
 
-        if opt.tickPosition != QSlider.TickPosition.NoTicks:
+        # the style can only draw linearly spaced tick marks
+        scale_ticks = (
+            opt.tickPosition != QSlider.TickPosition.NoTicks and not self._scale.linear
+        )
+        if opt.tickPosition != QSlider.TickPosition.NoTicks and not scale_ticks:
             opt.subControls |= SC_TICKMARKS
-        painter.drawComplexControl(CC_SLIDER, opt)
+        self.style().drawComplexControl(CC_SLIDER, opt, painter, self)
+        if scale_ticks:
+            self._draw_scale_ticks(painter, opt)
+            return
 
         if (
             opt.tickPosition != QSlider.TickPosition.NoTicks
@@ -414,16 +718,123 @@ class _GenericSlider(QSlider):
 
             painter.setPen(QtGui.QColor("#C7C7C7"))
             half_height = 3
+            rect = opt.rect
             for i in range(int(nticks)):
                 if self.orientation() == Qt.Orientation.Vertical:
-                    y = int((self.height() - 8) * i / (nticks - 1)) + 1
-                    x = self.rect().center().x()
+                    y = rect.y() + int((rect.height() - 8) * i / (nticks - 1)) + 1
+                    x = rect.center().x()
                     painter.drawRect(x - half_height, y, 6, 1)
                 else:
-                    x = int((self.width() - 3) * i / (nticks - 1)) + 1
-                    y = self.rect().center().y()
+                    x = rect.x() + int((rect.width() - 3) * i / (nticks - 1)) + 1
+                    y = rect.center().y()
                     painter.drawRect(x, y - half_height, 1, 6)
 
+    def _draw_scale_ticks(self, painter: QPainter, opt: QStyleOptionSlider) -> None:
+        """Draw tick marks for non-linear scales."""
+        values = self._scale.ticks(
+            self._minimum, self._maximum, self._tickInterval or self._pageStep
+        )
+        p_min, p_max = self._handleCenterSpan(opt)
+        painter.setPen(opt.palette.color(QPalette.ColorRole.Mid))
+        rect = opt.rect
+        length = 4
+        both = QSlider.TickPosition.TicksBothSides
+        above = opt.tickPosition in (QSlider.TickPosition.TicksAbove, both)
+        below = opt.tickPosition in (QSlider.TickPosition.TicksBelow, both)
+        for f in self._scaleFractions(values):
+            p = round(p_min + f * (p_max - p_min))
+            if opt.orientation == Qt.Orientation.Horizontal:
+                if above:
+                    painter.drawLine(p, rect.top(), p, rect.top() + length)
+                if below:
+                    painter.drawLine(p, rect.bottom() - length, p, rect.bottom())
+            else:
+                if above:  # i.e. TicksLeft
+                    painter.drawLine(rect.left(), p, rect.left() + length, p)
+                if below:  # i.e. TicksRight
+                    painter.drawLine(rect.right() - length, p, rect.right(), p)
+
+    def _handleCenterSpan(self, opt: QStyleOptionSlider) -> tuple[int, int]:
+        """Return the pixel position of the handle center at minimum and maximum."""
+        style = self.style()
+        hopt = QStyleOptionSlider(opt)
+        hopt.sliderPosition = opt.minimum
+        c_min = style.subControlRect(CC_SLIDER, hopt, SC_HANDLE, self).center()
+        hopt.sliderPosition = opt.maximum
+        c_max = style.subControlRect(CC_SLIDER, hopt, SC_HANDLE, self).center()
+        if opt.orientation == Qt.Orientation.Horizontal:
+            return c_min.x(), c_max.x()
+        return c_min.y(), c_max.y()
+
+    def _draw_histogram(self, painter: QPainter, opt: QStyleOptionSlider) -> None:
+        if self._histogram is None:
+            return
+        color = opt.palette.color(QPalette.ColorRole.Highlight)
+        color.setAlpha(80)
+        dpr = self.devicePixelRatioF()
+        key = (
+            opt.rect.getRect(),
+            opt.orientation,
+            opt.upsideDown,
+            self._minimum,
+            self._maximum,
+            self._scale,
+            color.rgba(),
+            dpr,
+        )
+        if (
+            self._histogram_pixmap_cache is None
+            or self._histogram_pixmap_cache[0] != key
+        ):
+            pixmap = QPixmap(
+                round(opt.rect.width() * dpr), round(opt.rect.height() * dpr)
+            )
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            pm_painter = QPainter(pixmap)
+            pm_painter.translate(-opt.rect.x(), -opt.rect.y())
+            self._render_histogram(pm_painter, opt, color)
+            pm_painter.end()
+            self._histogram_pixmap_cache = (key, (pixmap, opt.rect.topLeft()))
+        pixmap, origin = self._histogram_pixmap_cache[1]
+        painter.drawPixmap(origin, pixmap)
+
+    def _render_histogram(
+        self, painter: QPainter, opt: QStyleOptionSlider, color: QtGui.QColor
+    ) -> None:
+        """Render the histogram between the handle centers at minimum and maximum."""
+        counts, edges = self._histogram  # type: ignore [misc]
+        top = max(counts, default=0)
+        if top <= 0 or self._maximum == self._minimum:
+            return
+
+        p_min, p_max = self._handleCenterSpan(opt)
+        horizontal = opt.orientation == Qt.Orientation.Horizontal
+        rect = QRectF(opt.rect)
+        if horizontal:
+            base, height = rect.bottom(), rect.height()
+        else:
+            base, height = rect.left(), rect.width()
+        span = p_max - p_min
+        pixels = [p_min + f * span for f in self._scaleFractions(edges)]
+
+        # outline of the histogram as a series of steps
+        path = QPainterPath()
+        for i, count in enumerate(counts):
+            p0, p1 = pixels[i], pixels[i + 1]
+            h = height * count / top
+            if horizontal:
+                path.addRect(QRectF(p0, base - h, p1 - p0, h).normalized())
+            else:
+                path.addRect(QRectF(base, p0, h, p1 - p0).normalized())
+
+        lo, hi = sorted((p_min, p_max))
+        if horizontal:
+            painter.setClipRect(QRectF(lo, rect.top(), hi - lo, rect.height()))
+        else:
+            painter.setClipRect(QRectF(rect.left(), lo, rect.width(), hi - lo))
+        painter.fillPath(path.simplified(), color)
+
     # from QSliderPrivate.pixelPosToRangeValue
     def _pixelPosToRangeValue(self, pos: int) -> float:
         opt = self._styleOption
@@ -439,13 +850,24 @@ class _GenericSlider(QSlider):
             sliderLength = sr.height()
             sliderMin = gr.y()
             sliderMax = gr.bottom() - sliderLength + 1
-        return _sliderValueFromPosition(
-            self._minimum,
-            self._maximum,
+        if self._scale.linear:
+            return _sliderValueFromPosition(
+                self._minimum,
+                self._maximum,
+                pos - sliderMin,
+                sliderMax - sliderMin,
+                opt.upsideDown,
+            )
+        forward = self._scale.forward
+        t = _sliderValueFromPosition(
+            forward(self._minimum),
+            forward(self._maximum),
             pos - sliderMin,
             sliderMax - sliderMin,
             opt.upsideDown,
         )
+        # clip to guard against round-trip errors of the scale
+        return max(self._minimum, min(self._maximum, self._scale.inverse(t)))
 
     def _scrollByDelta(self, orientation, modifiers, delta: int) -> bool:
         steps_to_scroll = 0.0
@@ -495,7 +917,7 @@ class _GenericSlider(QSlider):
 
         prevValue = self._value
         self._execute_scroll(steps_to_scroll, modifiers)
-        if prevValue == self._value:
+        if self._valuesEqual(prevValue, self._value):
             self._offset_accum = 0
             return False
         return True
@@ -513,6 +935,10 @@ class _GenericSlider(QSlider):
         return self._singleStep * self._repeatMultiplier
 
     def _overflowSafeAdd(self, add: float) -> float:
+        if self._allowed_values is not None:
+            idx = self._allowedIndex(self._value) + self._indexSteps(add)
+            idx = max(0, min(len(self._allowed_values) - 1, idx))
+            return self._allowed_values[idx]
         newValue = self._value + add
         if add > 0 and newValue < self._value:
             newValue = self._maximum
@@ -533,6 +959,17 @@ def _event_position(ev: QEvent) -> QPoint:
     return pos
 
 
+def _compute_histogram(
+    data: Any,
+    bins: int | Sequence[float],
+    range: tuple[float, float] | None = None,
+) -> tuple[Any, Any]:
+    """Return the `(counts, edges)` of `data`, using `numpy.histogram`."""
+    import numpy as np
+
+    return np.histogram(np.ravel(data), bins=bins, range=range)  # type: ignore
+
+
 def _sliderValueFromPosition(
     min: float, max: float, position: int, span: int, upsideDown: bool = False
 ) -> float:
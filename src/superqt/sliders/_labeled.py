@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from enum import IntEnum, IntFlag, auto
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, overload
 
 from qtpy import QtGui
-from qtpy.QtCore import Property, QPoint, QSize, Qt, Signal
-from qtpy.QtGui import QDoubleValidator, QFontMetrics, QValidator
+from qtpy.QtCore import Property, QEvent, QObject, QPoint, QSize, Qt, Signal
+from qtpy.QtGui import QDoubleValidator, QFont, QFontMetrics, QValidator
 from qtpy.QtWidgets import (
     QAbstractSlider,
     QBoxLayout,
@@ -371,6 +372,11 @@ class QLabeledRangeSlider(_SliderProxy, QAbstractSlider):
 
         self.setAttribute(Qt.WidgetAttribute.WA_ShowWithoutActivating)
         self._handle_labels: list[SliderLabel] = []
+        # hidden handle labels, reused when the number of handles grows again
+        self._label_pool: list[SliderLabel] = []
+        # per handle label: (inputs of the position calculation, resulting position)
+        # so that `_reposition_labels` only moves labels whose handles moved.
+        self._label_geometry: dict[int, tuple[tuple, tuple[int, int]]] = {}
         self._handle_label_position: LabelPosition = LabelPosition.LabelsAbove
 
         # for fine tuning label position
@@ -412,9 +418,10 @@ class QLabeledRangeSlider(_SliderProxy, QAbstractSlider):
     def setHandleLabelPosition(self, opt: LabelPosition) -> None:
         """Set where/whether labels are shown adjacent to slider handles."""
         self._handle_label_position = opt
+        trans = opt == LabelPosition.LabelsOnHandle
         for lbl in self._handle_labels:
             lbl.setVisible(bool(opt))
-            trans = opt == LabelPosition.LabelsOnHandle
+        for lbl in self._handle_labels + self._label_pool:
             # TODO: make double clickable to edit
             lbl.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, trans)
         self.setOrientation(self.orientation())
@@ -500,6 +507,16 @@ class QLabeledRangeSlider(_SliderProxy, QAbstractSlider):
         super().resizeEvent(a0)
         self._reposition_labels()
 
+    def eventFilter(self, a0: QObject | None, a1: QEvent | None) -> bool:
+        # handle labels resize themselves (e.g. when shown, to pick up qss fonts)
+        if (
+            a1 is not None
+            and a1.type() == QEvent.Type.Resize
+            and a0 in self._handle_labels
+        ):
+            self._reposition_labels()
+        return False
+
     # putting this after methods above for the sake of mypy
     LabelPosition = LabelPosition
     EdgeLabelMode = EdgeLabelMode
@@ -528,13 +545,39 @@ class QLabeledRangeSlider(_SliderProxy, QAbstractSlider):
         horizontal = self.orientation() == Qt.Orientation.Horizontal
         labels_above = self._handle_label_position == LabelPosition.LabelsAbove
         labels_on_handle = self._handle_label_position == LabelPosition.LabelsOnHandle
+        layout_key = (
+            horizontal,
+            self._handle_label_position,
+            self.label_shift_x,
+            self.label_shift_y,
+            self._slider.pos(),
+        )
 
+        opt = self._slider._styleOption
+        moved = False
         last_edge = None
         labels: Iterable[tuple[int, SliderLabel]] = enumerate(self._handle_labels)
         if self._slider.invertedAppearance():
             labels = reversed(list(labels))
         for i, label in labels:
-            rect = self._slider._handleRect(i)
+            rect = self._slider._handleRect(i, opt)
+            # the position only depends on the handle, the label size, the previous
+            # label (overlap prevention) and the layout, so it is only recomputed
+            # when one of them changed.
+            key = (
+                rect.getRect(),
+                label.width(),
+                label.height(),
+                None if last_edge is None else (last_edge.x(), last_edge.y()),
+                layout_key,
+            )
+            cached = self._label_geometry.get(i)
+            if cached is not None and cached[0] == key:
+                last_edge = QPoint(*cached[1])
+                if label.isHidden():
+                    label.show()
+                continue
+
             dx = (-label.width() / 2) + 2
             dy = -label.height() / 2
             if labels_above:  # or on the right
@@ -560,12 +603,16 @@ class QLabeledRangeSlider(_SliderProxy, QAbstractSlider):
                     pos.setX(int(max(pos.x(), last_edge.x() + label.width() / 2 + 12)))
                 else:
                     pos.setY(int(min(pos.y(), last_edge.y() - label.height() / 2 - 4)))
-            label.move(pos)
+            self._label_geometry[i] = (key, (pos.x(), pos.y()))
             last_edge = pos
-            label.clearFocus()
-            label.raise_()
-            label.show()
-        self.update()
+            if pos != label.pos() or label.isHidden():
+                label.move(pos)
+                label.clearFocus()
+                label.raise_()
+                label.show()
+                moved = True
+        if moved:
+            self.update()
 
     def _min_label_edited(self, val: float) -> None:
         if self._edge_label_mode == EdgeLabelMode.LabelIsRange:
@@ -591,21 +638,32 @@ class QLabeledRangeSlider(_SliderProxy, QAbstractSlider):
             self._max_label.setValue(v[-1])
 
         if len(v) != len(self._handle_labels):
-            for lbl in self._handle_labels:
-                lbl.setParent(None)
-                lbl.deleteLater()
-            self._handle_labels.clear()
-            for n, val in enumerate(self._slider.value()):
-                s = SliderLabel(self._slider, parent=self, index=n)
-                s.valueEdited.connect(self._on_slider_label_edited)
-                s.editingFinished.connect(self.editingFinished)
-                s.setValue(val)
-                self._handle_labels.append(s)
-        else:
-            for val, label in zip(v, self._handle_labels, strict=False):
+            self._set_handle_label_count(len(v))
+        for val, label in zip(v, self._handle_labels, strict=False):
+            if label.value() != val:
                 label.setValue(val)
         self._reposition_labels()
 
+    def _set_handle_label_count(self, count: int) -> None:
+        """Grow or shrink the handle labels, reusing pooled labels."""
+        self._label_geometry.clear()
+        while len(self._handle_labels) > count:
+            lbl = self._handle_labels.pop()
+            lbl.hide()
+            self._label_pool.append(lbl)
+        while len(self._handle_labels) < count:
+            if self._label_pool:
+                lbl = self._label_pool.pop()
+            else:
+                lbl = SliderLabel(self._slider, parent=self)
+                lbl.valueEdited.connect(self._on_slider_label_edited)
+                lbl.editingFinished.connect(self.editingFinished)
+                lbl.installEventFilter(self)
+                if isinstance(self, QLabeledDoubleRangeSlider):
+                    lbl.setDecimals(self.decimals())
+            lbl._index = len(self._handle_labels)
+            self._handle_labels.append(lbl)
+
     def _on_slider_label_edited(self, pos: float) -> None:
         idx = getattr(self.sender(), "_index", 0)
         self._slider.setSliderPosition(pos, idx)
@@ -652,7 +710,7 @@ class QLabeledDoubleRangeSlider(QLabeledRangeSlider):
     def setDecimals(self, prec: int) -> None:
         self._min_label.setDecimals(prec)
         self._max_label.setDecimals(prec)
-        for lbl in self._handle_labels:
+        for lbl in self._handle_labels + self._label_pool:
             lbl.setDecimals(prec)
 
     def _getBarColor(self) -> QtGui.QBrush:
@@ -683,6 +741,7 @@ class SliderLabel(QLineEdit):
         self._max = slider.maximum()
         self._value = self._min
         self._decimals = -1
+        self._size_cache: tuple[tuple, QSize] | None = None
         self.setFocusPolicy(Qt.FocusPolicy.ClickFocus)
         self.setMode(EdgeLabelMode.LabelIsValue)
         self.setDecimals(0)  # calls updateText
@@ -739,41 +798,11 @@ class SliderLabel(QLineEdit):
 
     def _format_value(self, value):
         val = float(value)
-        use_scientific = (abs(val) < 0.0001 or abs(val) > 9999999.0) and val != 0.0
-        font_metrics = QFontMetrics(self.font())
-        eight_len = _fm_width(font_metrics, "8")
-
-        available_chars = self.width() // eight_len
-
-        total, _fraction = f"{val:.<f}".split(".")
-
-        if len(total) > available_chars:
-            use_scientific = True
-
-        if self._decimals < 0:
-            if use_scientific:
-                mantissa, exponent = f"{val:.{available_chars}e}".split("e")
-                mantissa = mantissa.rstrip("0").rstrip(".")
-                if len(mantissa) + len(exponent) + 1 < available_chars:
-                    text = f"{mantissa}e{exponent}"
-                else:
-                    decimals = max(available_chars - len(exponent) - 3, 2)
-                    text = f"{val:.{decimals}e}"
-
-            else:
-                decimals = max(available_chars - len(total) - 1, 2)
-                text = f"{val:.{decimals}f}"
-                text = text.rstrip("0").rstrip(".")
-        else:
-            if use_scientific:
-                mantissa, exponent = f"{val:.{self._decimals}e}".split("e")
-                mantissa = mantissa.rstrip("0").rstrip(".")
-                text = f"{mantissa}e{exponent}"
-            else:
-                text = f"{val:.{self._decimals}f}"
-        if text == "":
-            text = "0"
-        return text
+        available_chars = self.width() // _text_width(self.font(), "8")
+        if val == 0:
+            # not memoized: 0.0 and -0.0 compare (and hash) equal
+            return _format_number(val, self._decimals, available_chars)
+        return _cached_format_number(val, self._decimals, available_chars)
 
     def updateText(self) -> None:
         text = self._format_value(self._value)
@@ -818,8 +847,7 @@ class SliderLabel(QLineEdit):
             self.clearFocus()
 
     def _get_size(self):
-        # fontmetrics to measure the width of text
-        fm = QFontMetrics(self.font())
+        font = self.font()
         h = self.sizeHint().height()
         fixed_content = self.prefix() + self.suffix() + " "
 
@@ -828,20 +856,25 @@ class SliderLabel(QLineEdit):
             # with current settings to ensure spacing is correct
             mintext = self._format_value(self.minimum())[:18]
             maxtext = self._format_value(self.maximum())[:18]
-            w = max(0, _fm_width(fm, mintext + fixed_content))
-            w = max(w, _fm_width(fm, maxtext + fixed_content))
+            w = max(0, _text_width(font, mintext + fixed_content))
+            w = max(w, _text_width(font, maxtext + fixed_content))
             if self._mode & EdgeLabelMode.LabelIsRange:
                 w += 8  # it seems as thought suffix() is not enough
         else:
-            w = max(0, _fm_width(fm, self._format_value(self.value()))) + 3
+            w = max(0, _text_width(font, self._format_value(self.value()))) + 3
 
         w += 3  # cursor blinking space
-        # get the final size hint
+        # get the final size hint (only asking the style when the inputs changed)
+        key = (w, h)
+        if self._size_cache is not None and self._size_cache[0] == key:
+            return QSize(self._size_cache[1])
         opt = QStyleOption()
         # self.initStyleOption(opt)
-        return self.style().sizeFromContents(
+        size = self.style().sizeFromContents(
             QStyle.ContentsType.CT_LineEdit, opt, QSize(w, h), self
         )
+        self._size_cache = (key, QSize(size))
+        return size
 
     def _update_size(self, *_: Any) -> None:
         self.setFixedSize(self._get_size())
@@ -854,6 +887,11 @@ class SliderLabel(QLineEdit):
             return QValidator.State.Invalid, input_, len(input_)
         return super().validate(input_, pos)
 
+    def changeEvent(self, event: Any) -> None:
+        if event.type() == QEvent.Type.StyleChange:
+            self._size_cache = None
+        super().changeEvent(event)
+
     def showEvent(self, event: Any) -> None:
         # need to update size after showing
         # to handle the qss font size change
@@ -865,3 +903,70 @@ def _fm_width(fm: QFontMetrics, text: str) -> int:
     if hasattr(fm, "horizontalAdvance"):
         return fm.horizontalAdvance(text)
     return fm.width(text)
+
+
+# font metrics shared by all labels, keyed by `QFont.key()`
+_FONT_METRICS: dict[str, QFontMetrics] = {}
+_MAX_CACHED_FONTS = 64
+
+
+def _font_metrics(font: QFont) -> QFontMetrics:
+    """Return (shared) font metrics for `font`."""
+    key = font.key()
+    if (fm := _FONT_METRICS.get(key)) is None:
+        if len(_FONT_METRICS) >= _MAX_CACHED_FONTS:
+            _FONT_METRICS.clear()
+        fm = _FONT_METRICS[key] = QFontMetrics(font)
+    return fm
+
+
+@lru_cache(maxsize=4096)
+def _cached_text_width(font_key: str, text: str) -> int:
+    return _fm_width(_FONT_METRICS[font_key], text)
+
+
+def _text_width(font: QFont, text: str) -> int:
+    """Return the (memoized) horizontal advance of `text` in `font`."""
+    _font_metrics(font)  # make sure the metrics for this font are cached
+    return _cached_text_width(font.key(), text)
+
+
+def _format_number(val: float, decimals: int, available_chars: int) -> str:
+    """Format `val` for a label `available_chars` wide, with `decimals` decimals.
+
+    A negative `decimals` means "as many as fit".
+    """
+    use_scientific = (abs(val) < 0.0001 or abs(val) > 9999999.0) and val != 0.0
+
+    total, _fraction = f"{val:.<f}".split(".")
+
+    if len(total) > available_chars:
+        use_scientific = True
+
+    if decimals < 0:
+        if use_scientific:
+            mantissa, exponent = f"{val:.{available_chars}e}".split("e")
+            mantissa = mantissa.rstrip("0").rstrip(".")
+            if len(mantissa) + len(exponent) + 1 < available_chars:
+                text = f"{mantissa}e{exponent}"
+            else:
+                decimals = max(available_chars - len(exponent) - 3, 2)
+                text = f"{val:.{decimals}e}"
+
+        else:
+            decimals = max(available_chars - len(total) - 1, 2)
+            text = f"{val:.{decimals}f}"
+            text = text.rstrip("0").rstrip(".")
+    else:
+        if use_scientific:
+            mantissa, exponent = f"{val:.{decimals}e}".split("e")
+            mantissa = mantissa.rstrip("0").rstrip(".")
+            text = f"{mantissa}e{exponent}"
+        else:
+            text = f"{val:.{decimals}f}"
+    if text == "":
+        text = "0"
+    return text
+
+
+_cached_format_number = lru_cache(maxsize=4096)(_format_number)
@@ -3,7 +3,8 @@ from __future__ import annotations
 import platform
 import re
 from dataclasses import dataclass, replace
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from typing import TYPE_CHECKING, NamedTuple
 
 from qtpy.QtCore import Qt
 from qtpy.QtGui import (
@@ -60,15 +61,17 @@ class RangeSliderStyle:
         if _val is None:
             return QBrush()
 
+        alpha = None
+        if opt.tickPosition != QSlider.TickPosition.NoTicks:
+            alpha = self.tick_bar_alpha or SYSTEM_STYLE.tick_bar_alpha
+
         if isinstance(_val, str):
-            val = QColor(_val)
-            if not val.isValid():
-                val = parse_color(_val, default_attr=attr)
-        else:
-            val = _val
+            # (implicitly shared) copy of a brush shared by all sliders
+            return QBrush(_cached_brush(_val, attr, alpha))
 
-        if opt.tickPosition != QSlider.TickPosition.NoTicks:
-            val.setAlphaF(self.tick_bar_alpha or SYSTEM_STYLE.tick_bar_alpha)
+        val = _val
+        if alpha is not None:
+            val.setAlphaF(alpha)
 
         return QBrush(val)
 
@@ -84,10 +87,13 @@ class RangeSliderStyle:
             val = getattr(SYSTEM_STYLE, attr)
         if not val:
             return Qt.PenStyle.NoPen
-        if isinstance(val, str):
-            val = QColor(val)
+        alpha = None
         if opt.tickPosition != QSlider.TickPosition.NoTicks:
-            val.setAlphaF(self.tick_bar_alpha or SYSTEM_STYLE.tick_bar_alpha)
+            alpha = self.tick_bar_alpha or SYSTEM_STYLE.tick_bar_alpha
+        if isinstance(val, str):
+            return QColor(_cached_color(val, alpha))
+        if alpha is not None:
+            val.setAlphaF(alpha)
         return val
 
     def offset(self, opt: QStyleOptionSlider) -> int:
@@ -263,6 +269,58 @@ def parse_color(color: str, default_attr: str) -> QColor | QGradient:
     return QColor(getattr(SYSTEM_STYLE, default_attr))
 
 
+@lru_cache(maxsize=256)
+def _cached_brush(color: str, default_attr: str, alpha: float | None) -> QBrush:
+    """Return the brush for a color string, shared by all sliders."""
+    val = QColor(color)
+    if not val.isValid():
+        val = parse_color(color, default_attr=default_attr)
+    if alpha is not None and isinstance(val, QColor):
+        val.setAlphaF(alpha)
+    return QBrush(val)
+
+
+@lru_cache(maxsize=256)
+def _cached_color(color: str, alpha: float | None) -> QColor:
+    """Return the QColor for a color string, shared by all sliders."""
+    val = QColor(color)
+    if alpha is not None:
+        val.setAlphaF(alpha)
+    return val
+
+
+class _ParsedStyleSheet(NamedTuple):
+    macpatch: bool
+    horizontal_thickness: float | None
+    vertical_thickness: float | None
+
+
+@lru_cache(maxsize=64)
+def _parse_stylesheet(qss: str) -> _ParsedStyleSheet:
+    """Extract the range slider style from a stylesheet.
+
+    The result only depends on the stylesheet text, so it is cached for the whole
+    process: changing the application stylesheet re-parses it only once for all
+    sliders.
+    """
+    macpatch = MONTEREY_SLIDER_STYLES_FIX in qss
+    if macpatch:
+        qss = qss.replace(MONTEREY_SLIDER_STYLES_FIX, "")
+
+    # Find bar height/width
+    thicknesses: dict[str, float | None] = {"horizontal": None, "vertical": None}
+    for orient, dim in (("horizontal", "height"), ("vertical", "width")):
+        match = re.search(rf"Slider::groove:{orient}\s*{{\s*([^}}]+)}}", qss, re.S)
+        if match:
+            for line in reversed(match.groups()[0].splitlines()):
+                bgrd = re.search(rf"{dim}\s*:\s*(\d+)", line)
+                if bgrd:
+                    thicknesses[orient] = float(bgrd.groups()[-1])
+    return _ParsedStyleSheet(
+        macpatch, thicknesses["horizontal"], thicknesses["vertical"]
+    )
+
+
 def update_styles_from_stylesheet(obj: _GenericRangeSlider) -> None:
     qss: str = obj.styleSheet()
 
@@ -273,22 +331,14 @@ def update_styles_from_stylesheet(obj: _GenericRangeSlider) -> None:
     qss = QApplication.instance().styleSheet() + qss
     if not qss:
         return
-    if MONTEREY_SLIDER_STYLES_FIX in qss:
-        qss = qss.replace(MONTEREY_SLIDER_STYLES_FIX, "")
-        obj._style._macpatch = True
-    else:
-        obj._style._macpatch = False
 
-    # Find bar height/width
-    for orient, dim in (("horizontal", "height"), ("vertical", "width")):
-        match = re.search(rf"Slider::groove:{orient}\s*{{\s*([^}}]+)}}", qss, re.S)
-        if match:
-            for line in reversed(match.groups()[0].splitlines()):
-                bgrd = re.search(rf"{dim}\s*:\s*(\d+)", line)
-                if bgrd:
-                    thickness = float(bgrd.groups()[-1])
-                    setattr(obj._style, f"{orient}_thickness", thickness)
-                    obj._style.has_stylesheet = True
+    parsed = _parse_stylesheet(qss)
+    obj._style._macpatch = parsed.macpatch
+    for orient in ("horizontal", "vertical"):
+        thickness = getattr(parsed, f"{orient}_thickness")
+        if thickness is not None:
+            setattr(obj._style, f"{orient}_thickness", thickness)
+            obj._style.has_stylesheet = True
 
 
 # a fix for https://bugreports.qt.io/browse/QTBUG-98093
@@ -0,0 +1,234 @@
+"""Scales mapping slider values to (linear) positions along the groove."""
+
+from __future__ import annotations
+
+import math
+import sys
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+# smallest positive float, used to keep log scales finite at zero
+_TINY = sys.float_info.min
+# maximum number of ticks returned by `SliderScale.ticks`
+_MAX_TICKS = 1000
+
+
+def _is_array(values: Any) -> bool:
+    return hasattr(values, "__array__") and not isinstance(values, (list, tuple))
+
+
+class SliderScale:
+    """Base class for slider scales.
+
+    A scale maps slider values to a space in which the slider handle moves
+    linearly along the groove.  Subclasses implement `forward` and `inverse`, and
+    may override `forward_many` with a vectorized version.
+    """
+
+    # whether `forward` is the identity (enables the plain linear code paths)
+    linear = False
+
+    def forward(self, value: float) -> float:
+        """Map a slider value to the (linear) groove space."""
+        raise NotImplementedError
+
+    def inverse(self, value: float) -> float:
+        """Map a value in the (linear) groove space back to a slider value."""
+        raise NotImplementedError
+
+    def forward_many(self, values: Iterable[float]) -> Sequence[float]:
+        """Map many slider values to the groove space."""
+        return [self.forward(v) for v in values]
+
+    def ticks(self, vmin: float, vmax: float, interval: float) -> list[float]:
+        """Return the values at which tick marks are drawn between vmin and vmax."""
+        if interval <= 0 or vmax <= vmin:
+            return []
+        n = min(int((vmax - vmin) / interval) + 1, _MAX_TICKS)
+        return [vmin + i * interval for i in range(n)]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class LinearScale(SliderScale):
+    """Linear scale (the default)."""
+
+    linear = True
+
+    def forward(self, value: float) -> float:
+        return value
+
+    def inverse(self, value: float) -> float:
+        return value
+
+    def forward_many(self, values: Iterable[float]) -> Sequence[float]:
+        return values if _is_array(values) else list(values)  # type: ignore
+
+
+class LogScale(SliderScale):
+    """Logarithmic scale.  Slider values must be positive.
+
+    Parameters
+    ----------
+    base : float
+        Base of the logarithm, by default 10.  Tick marks are drawn at integer
+        powers of `base`.
+    """
+
+    def __init__(self, base: float = 10) -> None:
+        if base <= 0 or base == 1:
+            raise ValueError("'base' must be positive and different from 1")
+        self.base = base
+        self._log_base = math.log(base)
+
+    def forward(self, value: float) -> float:
+        return math.log(max(value, _TINY)) / self._log_base
+
+    def inverse(self, value: float) -> float:
+        return float(self.base**value)
+
+    def forward_many(self, values: Iterable[float]) -> Sequence[float]:
+        if _is_array(values):
+            import numpy as np
+
+            return np.log(np.maximum(values, _TINY)) / self._log_base  # type: ignore
+        return super().forward_many(values)
+
+    def ticks(self, vmin: float, vmax: float, interval: float) -> list[float]:
+        lo = math.ceil(self.forward(vmin) - 1e-9)
+        hi = math.floor(self.forward(vmax) + 1e-9)
+        return [self.inverse(i) for i in range(lo, min(hi, lo + _MAX_TICKS) + 1)]
+
+    def __repr__(self) -> str:
+        return f"LogScale(base={self.base!r})"
+
+
+class SymLogScale(SliderScale):
+    """Symmetric log scale: linear around zero and logarithmic further out.
+
+    Parameters
+    ----------
+    linthresh : float
+        Scale of the linear region around zero, by default 1.
+    """
+
+    def __init__(self, linthresh: float = 1) -> None:
+        if linthresh <= 0:
+            raise ValueError("'linthresh' must be positive")
+        self.linthresh = linthresh
+
+    def forward(self, value: float) -> float:
+        return math.copysign(math.log10(1 + abs(value) / self.linthresh), value)
+
+    def inverse(self, value: float) -> float:
+        return math.copysign(self.linthresh * (10 ** abs(value) - 1), value)
+
+    def forward_many(self, values: Iterable[float]) -> Sequence[float]:
+        if _is_array(values):
+            import numpy as np
+
+            arr = np.asarray(values, dtype=float)
+            return np.sign(arr) * np.log10(1 + np.abs(arr) / self.linthresh)  # type: ignore
+        return super().forward_many(values)
+
+    def __repr__(self) -> str:
+        return f"SymLogScale(linthresh={self.linthresh!r})"
+
+
+class PowerScale(SliderScale):
+    """Power scale, `sign(value) * abs(value) ** exponent`.
+
+    Parameters
+    ----------
+    exponent : float
+        Exponent of the power law, by default 2.
+    """
+
+    def __init__(self, exponent: float = 2) -> None:
+        if exponent <= 0:
+            raise ValueError("'exponent' must be positive")
+        self.exponent = exponent
+
+    def forward(self, value: float) -> float:
+        return math.copysign(abs(value) ** self.exponent, value)
+
+    def inverse(self, value: float) -> float:
+        return math.copysign(abs(value) ** (1 / self.exponent), value)
+
+    def forward_many(self, values: Iterable[float]) -> Sequence[float]:
+        if _is_array(values):
+            import numpy as np
+
+            arr = np.asarray(values, dtype=float)
+            return np.sign(arr) * np.abs(arr) ** self.exponent  # type: ignore
+        return super().forward_many(values)
+
+    def __repr__(self) -> str:
+        return f"PowerScale(exponent={self.exponent!r})"
+
+
+class FunctionScale(SliderScale):
+    """Scale defined by a user-supplied `forward` and `inverse` pair.
+
+    Both functions must be monotonically increasing and inverse of each other.
+    If `forward` also accepts arrays (e.g. it is built from numpy ufuncs), pass
+    `vectorized=True` to map many handles in a single call.
+    """
+
+    def __init__(
+        self,
+        forward: Callable[[float], float],
+        inverse: Callable[[float], float],
+        vectorized: bool = False,
+    ) -> None:
+        self._forward = forward
+        self._inverse = inverse
+        self.vectorized = vectorized
+
+    def forward(self, value: float) -> float:
+        return self._forward(value)
+
+    def inverse(self, value: float) -> float:
+        return self._inverse(value)
+
+    def forward_many(self, values: Iterable[float]) -> Sequence[float]:
+        if self.vectorized and _is_array(values):
+            return self._forward(values)  # type: ignore
+        return super().forward_many(values)
+
+    def __repr__(self) -> str:
+        return f"FunctionScale({self._forward!r}, {self._inverse!r})"
+
+
+_NAMED_SCALES: dict[str, type[SliderScale]] = {
+    "linear": LinearScale,
+    "log": LogScale,
+    "symlog": SymLogScale,
+    "power": PowerScale,
+}
+
+
+def _resolve_scale(
+    scale: str | SliderScale | tuple[Callable, Callable] | None,
+) -> SliderScale:
+    """Return a `SliderScale` for a scale name, instance or (forward, inverse)."""
+    if scale is None:
+        return LinearScale()
+    if isinstance(scale, SliderScale):
+        return scale
+    if isinstance(scale, str):
+        try:
+            return _NAMED_SCALES[scale]()
+        except KeyError:
+            raise ValueError(
+                f"Unknown scale {scale!r}. Must be one of {set(_NAMED_SCALES)}"
+            ) from None
+    if isinstance(scale, tuple) and len(scale) == 2:
+        return FunctionScale(*scale)
+    raise TypeError(
+        "scale must be a string, a SliderScale, or a (forward, inverse) tuple, "
+        f"not {type(scale).__name__}"
+    )
@@ -12,6 +12,9 @@ class _IntMixin:
     def _type_cast(self, value) -> int:
         return round(value)
 
+    def _type_cast_array(self, values):
+        return values.round().astype(int)
+
 
 class _FloatMixin:
     def __init__(self, *args, **kwargs):
@@ -22,6 +25,9 @@ class _FloatMixin:
     def _type_cast(self, value) -> float:
         return float(value)
 
+    def _type_cast_array(self, values):
+        return values.astype(float)
+
 
 class QDoubleSlider(_FloatMixin, _GenericSlider):
     pass
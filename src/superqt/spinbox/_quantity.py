@@ -1,4 +1,6 @@
-from typing import TYPE_CHECKING, TypeAlias, Union
+import threading
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeAlias, Union
+from weakref import WeakKeyDictionary
 
 try:
     from pint import Quantity, Unit, UnitRegistry
@@ -12,13 +14,16 @@ from qtpy.QtCore import Signal
 from qtpy.QtWidgets import QComboBox, QDoubleSpinBox, QHBoxLayout, QSizePolicy, QWidget
 
 from superqt.utils import signals_blocked
+from superqt.utils._util import cache_dir
 
 if TYPE_CHECKING:
     from decimal import Decimal
 
 
 Number: TypeAlias = Union[int, float, "Decimal"]
-UREG = UnitRegistry()
+# default unit registry, created on first use (see `_default_registry`)
+_UREG: UnitRegistry | None = None
+_UREG_LOCK = threading.Lock()
 NULL_OPTION = "-----"
 QOVERFLOW = 2**30
 SI_BASES = {
@@ -42,6 +47,106 @@ DEFAULT_OPTIONS = {
 }
 
 
+def _default_registry() -> UnitRegistry:
+    """Return the default unit registry, creating it on first use.
+
+    Parsing pint's definitions is slow, so the parsed registry is cached on disk (in
+    the superqt cache directory, if enabled) and shared by all processes.
+    """
+    global _UREG
+    with _UREG_LOCK:
+        if _UREG is None:
+            folder = cache_dir()
+            if folder is not None:
+                folder = folder / "pint"
+            try:
+                _UREG = UnitRegistry(cache_folder=folder)
+            except OSError:  # cache folder not writable
+                _UREG = UnitRegistry()
+    return _UREG
+
+
+class _UnitOptions(NamedTuple):
+    """Units offered in the units combo box for one dimensionality."""
+
+    labels: list[str]
+    # label -> units
+    units: dict[str, Unit]
+    # (label, label) -> conversion factor, filled on demand by `_conversion_factor`
+    factors: dict[tuple[str, str], float | None]
+
+
+# registry -> (dimensionality, abbreviate) -> unit options, shared by all widgets
+_OPTIONS: WeakKeyDictionary[UnitRegistry, dict[tuple, _UnitOptions]] = (
+    WeakKeyDictionary()
+)
+# registry -> (units, abbreviate) -> label of the units
+_LABELS: WeakKeyDictionary[UnitRegistry, dict[tuple, str]] = WeakKeyDictionary()
+
+
+def _units_label(ureg: UnitRegistry, units: Unit, abbreviate: bool = True) -> str:
+    """Return the (cached) label of `units`, as shown in the units combo box."""
+    labels = _LABELS.setdefault(ureg, {})
+    key = (units, abbreviate)
+    if key not in labels:
+        labels[key] = f"{units:~P}" if abbreviate else f"{units:}"
+    return labels[key]
+
+
+def _unit_options(
+    ureg: UnitRegistry, dimensionality: UnitsContainer, abbreviate: bool = True
+) -> _UnitOptions:
+    """Return the (cached) units offered for quantities of `dimensionality`."""
+    options = _OPTIONS.setdefault(ureg, {})
+    key = (dimensionality, abbreviate)
+    if key in options:
+        return options[key]
+
+    if not dimensionality:
+        units: dict[str, Unit] = {}
+        labels = [NULL_OPTION, *SI_BASES.values()]
+    else:
+        if len(dimensionality) > 1:
+            raise NotImplementedError(
+                "QQuantity does not currently support quantities with compound units,"
+                " e.g. `meter/second` or `Newton`."
+            )
+        dims, exp = next(iter(dimensionality.items()))
+        names = DEFAULT_OPTIONS.get(dims, [])
+        if exp != 1:
+            names = [f"({u})^{exp}" for u in names]
+        units = {}
+        for name in names:
+            unit = ureg.Unit(name)
+            units[_units_label(ureg, unit, abbreviate)] = unit
+        labels = list(units)
+    options[key] = _UnitOptions(labels, units, {})
+    return options[key]
+
+
+def _conversion_factor(
+    ureg: UnitRegistry, options: _UnitOptions, src: str, dst: str
+) -> float | None:
+    """Return the (cached) factor converting magnitudes from `src` to `dst` units.
+
+    Returns None if the conversion is not a multiplication (e.g. from °C to °F).
+    """
+    key = (src, dst)
+    if key not in options.factors:
+        src_units, dst_units = options.units[src], options.units[dst]
+        if ureg.Quantity(0, src_units).to(dst_units).magnitude != 0:
+            options.factors[key] = None
+        else:
+            options.factors[key] = ureg.Quantity(1, src_units).to(dst_units).magnitude
+    return options.factors[key]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "UREG":
+        return _default_registry()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class QQuantity(QWidget):
     """A combination QDoubleSpinBox and QComboBox for entering quantities.
 
@@ -76,7 +181,10 @@ class QQuantity(QWidget):
     ) -> None:
         super().__init__(parent=parent)
         if ureg is None:
-            ureg = value._REGISTRY if isinstance(value, Quantity) else UREG
+            if isinstance(value, Quantity):
+                ureg = value._REGISTRY
+            else:
+                ureg = _default_registry()
         else:
             if not isinstance(ureg, UnitRegistry):
                 raise TypeError(
@@ -106,44 +214,66 @@ class QQuantity(QWidget):
         self.layout().addWidget(self._units_combo)
         self.layout().setContentsMargins(6, 0, 0, 0)
 
+    @staticmethod
+    def preloadUnitRegistry() -> None:
+        """Start creating the default unit registry in a background thread.
+
+        The default registry is otherwise created (which may take a few hundred
+        milliseconds) when the first `QQuantity` without `ureg` is created.  Call this
+        e.g. once the application is shown, to create it ahead of time.
+        """
+        if _UREG is None:
+            threading.Thread(target=_default_registry, daemon=True).start()
+
     def unitRegistry(self) -> UnitRegistry:
         """Return the pint UnitRegistry used by this widget."""
         return self._ureg
 
-    def _get_unit_options(self, units: Unit) -> list[Unit]:
-        if len(units.dimensionality) > 1:
-            raise NotImplementedError(
-                "QQuantity does not currently support quantities with compound units,"
-                " e.g. `meter/second` or `Newton`."
-            )
-        dims, exp = next(iter(units.dimensionality.items()))
+    def _unit_options(self) -> _UnitOptions:
+        return _unit_options(
+            self._ureg, self._value.dimensionality, self._abbreviate_units
+        )
 
-        options = DEFAULT_OPTIONS.get(dims, [])
-        if exp != 1:
-            options = [f"({u})^{exp}" for u in options]
-        return [Unit(u) for u in options]
+    def _units_label(self) -> str:
+        return _units_label(self._ureg, self._value.units, self._abbreviate_units)
 
     def _update_units_combo_choices(self):
-        if self._value.dimensionless:
-            with signals_blocked(self._units_combo):
-                self._units_combo.clear()
-                self._units_combo.addItem(NULL_OPTION)
-                self._units_combo.addItems(
-                    [self._format_units(x) for x in SI_BASES.values()]
-                )
-                self._units_combo.setCurrentText(NULL_OPTION)
-            return
-
-        units = self._value.units
-        options = [self._format_units(u) for u in self._get_unit_options(units)]
-        current = self._format_units(units)
+        options = self._unit_options()
         with signals_blocked(self._units_combo):
             self._units_combo.clear()
-            self._units_combo.addItems(options)
+            self._units_combo.addItems(options.labels)
+        self._select_units()
+
+    def _select_units(self) -> None:
+        """Select the current units in the combo box."""
+        if self._value.dimensionless:
+            current = NULL_OPTION
+        else:
+            current = self._units_label()
+        with signals_blocked(self._units_combo):
             if self._units_combo.findText(current) == -1:
                 self._units_combo.addItem(current)
+            self._units_combo.setCurrentText(current)
+
+    def _convert(self, units: str | Unit | Quantity) -> Quantity:
+        """Return the current value converted to `units`.
 
-        self._units_combo.setCurrentText(current)
+        Conversions between the units offered in the combo box use the cached
+        conversion factors, rather than pint's (slower) conversion.
+        """
+        options = self._unit_options()
+        magnitude = self._value.magnitude
+        current = self._units_label()
+        if (
+            isinstance(units, str)
+            and isinstance(magnitude, (int, float))
+            and units in options.units
+            and current in options.units
+        ):
+            factor = _conversion_factor(self._ureg, options, current, units)
+            if factor is not None:
+                return self._ureg.Quantity(magnitude * factor, options.units[units])
+        return self._value.to(units)
 
     def value(self) -> Quantity:
         """Return the current value as a `pint.Quantity`."""
@@ -193,13 +323,15 @@ class QQuantity(QWidget):
             with signals_blocked(self._mag_spinbox):
                 self._mag_spinbox.setValue(float(self._value.magnitude))
 
+        # the units offered in the combo box only change with the dimensionality
+        if dims_changed:
+            self._update_units_combo_choices()
+        elif units_change:
+            self._select_units()
+
         if units_change:
-            with signals_blocked(self._units_combo):
-                self._units_combo.setCurrentText(self._format_units(self._value.units))
             self.unitsChanged.emit(self._value.units)
-
         if dims_changed:
-            self._update_units_combo_choices()
             self.dimensionalityChanged.emit(self._value.dimensionality)
 
         if mag_change or units_change:
@@ -220,7 +352,7 @@ class QQuantity(QWidget):
         elif self.isDimensionless():
             new_val = self._ureg.Quantity(self._value.magnitude, units)
         else:
-            new_val = self._value.to(units)
+            new_val = self._convert(units)
         self.setValue(new_val)
 
     def isDimensionless(self) -> bool:
@@ -234,8 +366,3 @@ class QQuantity(QWidget):
     def unitsComboBox(self) -> QComboBox:
         """Return the `QCombBox` widget used to edit the units."""
         return self._units_combo
-
-    def _format_units(self, u: Unit | str) -> str:
-        if isinstance(u, str):
-            return u
-        return f"{u:~P}" if self._abbreviate_units else f"{u:}"
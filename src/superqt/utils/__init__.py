@@ -1,8 +1,26 @@
+from importlib import import_module
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from superqt.cmap import draw_colormap
 
+    from ._code_syntax_highlight import CodeSyntaxHighlight
+    from ._ensure_thread import ensure_main_thread, ensure_object_thread
+    from ._errormsg_context import exceptions_as_dialog
+    from ._flow_layout import QFlowLayout
+    from ._img_utils import qimage_to_array
+    from ._message_handler import QMessageHandler
+    from ._misc import signals_blocked
+    from ._qthreading import (
+        FunctionWorker,
+        GeneratorWorker,
+        WorkerBase,
+        create_worker,
+        new_worker_qthread,
+        thread_worker,
+    )
+    from ._throttler import QSignalDebouncer, QSignalThrottler, qdebounced, qthrottled
+
 __all__ = (
     "CodeSyntaxHighlight",
     "FunctionWorker",
@@ -25,27 +43,37 @@ __all__ = (
     "thread_worker",
 )
 
-from ._code_syntax_highlight import CodeSyntaxHighlight
-from ._ensure_thread import ensure_main_thread, ensure_object_thread
-from ._errormsg_context import exceptions_as_dialog
-from ._flow_layout import QFlowLayout
-from ._img_utils import qimage_to_array
-from ._message_handler import QMessageHandler
-from ._misc import signals_blocked
-from ._qthreading import (
-    FunctionWorker,
-    GeneratorWorker,
-    WorkerBase,
-    create_worker,
-    new_worker_qthread,
-    thread_worker,
-)
-from ._throttler import QSignalDebouncer, QSignalThrottler, qdebounced, qthrottled
-
+# public name -> module providing it, imported when the name is first accessed
+_LAZY_IMPORTS = {
+    "CodeSyntaxHighlight": "._code_syntax_highlight",
+    "FunctionWorker": "._qthreading",
+    "GeneratorWorker": "._qthreading",
+    "QFlowLayout": "._flow_layout",
+    "QMessageHandler": "._message_handler",
+    "QSignalDebouncer": "._throttler",
+    "QSignalThrottler": "._throttler",
+    "WorkerBase": "._qthreading",
+    "create_worker": "._qthreading",
+    "draw_colormap": "superqt.cmap",
+    "ensure_main_thread": "._ensure_thread",
+    "ensure_object_thread": "._ensure_thread",
+    "exceptions_as_dialog": "._errormsg_context",
+    "new_worker_qthread": "._qthreading",
+    "qdebounced": "._throttler",
+    "qimage_to_array": "._img_utils",
+    "qthrottled": "._throttler",
+    "signals_blocked": "._misc",
+    "thread_worker": "._qthreading",
+}
 
-def __getattr__(name: str) -> Any:  # pragma: no cover
-    if name == "draw_colormap":
-        from superqt.cmap import draw_colormap
 
-        return draw_colormap
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
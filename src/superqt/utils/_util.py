@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import os
 from inspect import signature
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -24,3 +26,12 @@ def get_max_args(func: Callable) -> int | None:
         if param.kind in {param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD}:
             max_args += 1
     return max_args
+
+
+def cache_dir() -> Path | None:
+    """Return the directory for the on-disk caches of superqt, None if disabled.
+
+    On-disk caches are opt-in: they are only written when the `SUPERQT_CACHE_DIR`
+    environment variable is set to a (non-empty) directory.
+    """
+    return Path(env) if (env := os.getenv("SUPERQT_CACHE_DIR")) else None
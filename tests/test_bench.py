@@ -0,0 +1,157 @@
+"""Benchmarks, run with `pytest tests/test_bench.py --codspeed`.
+
+Without `--codspeed`, each benchmark is executed once as a regular test.
+"""
+
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+from qtpy.QtCore import QPoint, QRect, Qt
+from qtpy.QtGui import QIcon, QPainter, QPixmap, QPixmapCache
+from qtpy.QtWidgets import QWidget
+
+from superqt import QRangeSlider
+from superqt.fonticon import icon, setAnimationFrameCache, spin
+from superqt.fonticon._qfont_icon import QFontIconStore
+
+pytest.importorskip("pytest_codspeed")
+
+
+def _many_handle_slider(qtbot, n: int) -> QRangeSlider:
+    sld = QRangeSlider(Qt.Orientation.Horizontal)
+    qtbot.addWidget(sld)
+    sld.resize(1200, 40)
+    sld.setRange(0, n * 10)
+    sld.setValue([i * 10 for i in range(n)])
+    return sld
+
+
+@pytest.mark.parametrize("n", [10, 100, 1000])
+def test_range_slider_hit_test(benchmark, qtbot, n: int) -> None:
+    sld = _many_handle_slider(qtbot, n)
+    y = sld._handleRect(0).center().y()
+    points = [QPoint(x, y) for x in range(0, sld.width(), 7)]
+
+    @benchmark
+    def _hover() -> None:
+        for pt in points:
+            sld._getControlAtPos(pt)
+
+
+@pytest.mark.parametrize("n", [10, 100, 1000])
+def test_range_slider_paint(benchmark, qtbot, n: int) -> None:
+    sld = _many_handle_slider(qtbot, n)
+    benchmark(sld.grab)
+
+
+@pytest.mark.parametrize("array_mode", [False, True])
+def test_range_slider_set_positions(benchmark, qtbot, array_mode: bool) -> None:
+    sld = _many_handle_slider(qtbot, 1000)
+    if array_mode:
+        np = pytest.importorskip("numpy")
+        sld.setArrayMode()
+        positions = np.arange(1000) * 10 + 5
+    else:
+        positions = [i * 10 + 5 for i in range(1000)]
+
+    @benchmark
+    def _set() -> None:
+        sld.setSliderPosition(positions)
+        sld.setSliderPosition(positions[::-1], reversed=True)
+
+
+FONT_FILE = Path(__file__).parent / "test_fonticon" / "fixtures" / "fake_plugin"
+FONT_FILE = FONT_FILE / "icontest.ttf"
+
+
+@pytest.fixture
+def font_icon_store(qapp):
+    store = QFontIconStore.instance()
+    store.addFont(str(FONT_FILE), "ico", {"smiley": "\ue900"})
+    yield store
+    store.clear()
+
+
+def test_font_icon_paint(benchmark, font_icon_store) -> None:
+    engine = icon("ico.smiley", color="red")._engine
+    pixmap = QPixmap(32, 32)
+    rect = QRect(0, 0, 32, 32)
+
+    @benchmark
+    def _paint() -> None:
+        painter = QPainter(pixmap)
+        for _ in range(100):
+            engine.paint(painter, rect, QIcon.Mode.Normal, QIcon.State.Off)
+        painter.end()
+
+
+def test_font_icon_many_sizes(benchmark, font_icon_store) -> None:
+    icn = icon("ico.smiley", color="red")
+
+    @benchmark
+    def _render() -> None:
+        QPixmapCache.clear()
+        for size in range(8, 129):
+            icn.pixmap(size, size)
+
+
+@pytest.mark.parametrize("max_frames", [0, 720])
+def test_animated_font_icon_paint(
+    benchmark, qtbot, font_icon_store, max_frames: int
+) -> None:
+    widget = QWidget()
+    qtbot.addWidget(widget)
+    anim = spin(widget)
+    engine = icon("ico.smiley", color="red", animation=anim)._engine
+    pixmap = QPixmap(32, 32)
+    rect = QRect(0, 0, 32, 32)
+    setAnimationFrameCache(max_frames=max_frames)
+
+    @benchmark
+    def _paint() -> None:
+        painter = QPainter(pixmap)
+        for _ in range(100):
+            anim._angle += 45
+            painter.save()
+            engine.paint(painter, rect, QIcon.Mode.Normal, QIcon.State.Off)
+            painter.restore()
+        painter.end()
+
+    setAnimationFrameCache(max_frames=720)
+    anim.timer.stop()
+
+
+def test_quantity_widgets(benchmark, qtbot) -> None:
+    pytest.importorskip("pint")
+    from superqt import QQuantity
+
+    @benchmark
+    def _create() -> None:
+        for i in range(50):
+            w = QQuantity(i, "m")
+            w.setUnits("mm")
+            w.setValue(i, "s")
+
+
+def _superqt_modules() -> dict:
+    return {k: v for k, v in sys.modules.items() if k.split(".")[0] == "superqt"}
+
+
+@pytest.mark.parametrize("module", ["superqt", "superqt.utils"])
+def test_import(benchmark, module: str) -> None:
+    # only superqt modules are re-imported: Qt and other dependencies stay loaded
+    saved = _superqt_modules()
+
+    def _unimport(*_: str) -> None:
+        for name in _superqt_modules():
+            del sys.modules[name]
+
+    try:
+        benchmark.pedantic(
+            importlib.import_module, (module,), setup=_unimport, rounds=20
+        )
+    finally:
+        _unimport()
+        sys.modules.update(saved)
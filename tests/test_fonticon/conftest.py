@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _cache_dir(tmp_path, monkeypatch):
+    """Keep the on-disk caches (e.g. the plugin index) out of the user directory."""
+    monkeypatch.setenv("SUPERQT_CACHE_DIR", str(tmp_path / "cache"))
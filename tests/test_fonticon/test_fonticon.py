@@ -1,10 +1,33 @@
+import gc
+import os
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
-from qtpy.QtGui import QIcon, QPixmap
-from qtpy.QtWidgets import QPushButton
+from qtpy.QtCore import QRect, QSize, Qt, QTimer
+from qtpy.QtGui import (
+    QFont,
+    QIcon,
+    QImage,
+    QPainter,
+    QPixmap,
+    QPixmapCache,
+    QTransform,
+)
+from qtpy.QtWidgets import QPushButton, QWidget
 
-from superqt.fonticon import icon, pulse, setTextIcon, spin
+from superqt.fonticon import (
+    GlyphAtlas,
+    IconOpts,
+    icon,
+    iconCacheInfo,
+    icons,
+    pulse,
+    setAnimationFrameCache,
+    setTextIcon,
+    spin,
+)
 from superqt.fonticon._qfont_icon import QFontIconStore, _ensure_identifier
 
 TEST_PREFIX = "ico"
@@ -133,3 +156,434 @@ def test_ensure_identifier():
     assert _ensure_identifier("hello-world") == "hello_world"
     assert _ensure_identifier("hello_world") == "hello_world"
     assert _ensure_identifier("hello world") == "hello_world"
+
+
+def test_glyph_cache(full_store):
+    icn = icon(TEST_GLYPHKEY)
+    assert TEST_GLYPHKEY in QFontIconStore._GLYPHS
+    icn.pixmap(40, 40)
+    icn.pixmap(20, 20)
+    # the outline of the glyph is cached once, and reused for all sizes
+    assert list(QFontIconStore._PATHS) == [TEST_GLYPHKEY]
+    glyph = QFontIconStore._PATHS[TEST_GLYPHKEY]
+    assert not glyph.path.isEmpty()
+    assert QFontIconStore._glyph_path(TEST_GLYPHKEY) is glyph
+
+    # clearing the store invalidates all cached glyphs
+    full_store.clear()
+    assert not QFontIconStore._GLYPHS
+    assert not QFontIconStore._PATHS
+    with pytest.raises(KeyError):
+        QFontIconStore._glyph_path(TEST_GLYPHKEY)
+    full_store.addFont(str(FONT_FILE), TEST_PREFIX, {TEST_CHARNAME: TEST_CHAR})
+    assert QFontIconStore._glyph_path(TEST_GLYPHKEY) is not glyph
+
+
+def _alpha_centroid(image: QImage) -> tuple[float, float, float]:
+    """Return the total alpha and its centroid (x, y) in `image`."""
+    total = cx = cy = 0.0
+    for y in range(image.height()):
+        for x in range(image.width()):
+            if alpha := image.pixelColor(x, y).alpha():
+                total += alpha
+                cx += alpha * x
+                cy += alpha * y
+    return total, cx / total, cy / total
+
+
+@pytest.mark.parametrize("size", [16, 32, 100])
+def test_glyph_outline_matches_text(full_store, size):
+    """Drawing the glyph outline places it where `drawText` would draw the char."""
+    icn = icon(TEST_GLYPHKEY)
+    char, family, style = QFontIconStore.key2glyph(TEST_GLYPHKEY)
+    font = QFont()
+    font.setFamily(family)
+    if style:
+        font.setStyleName(style)
+    font.setPixelSize(round(size * 0.875))
+
+    rect = QRect(0, 0, size, size)
+    images = []
+    for draw_outline in (True, False):
+        image = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(image)
+        if draw_outline:
+            icn._engine._draw(painter, rect, icn._engine._default_opts)
+        else:
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setFont(font)
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, char)
+        painter.end()
+        images.append(_alpha_centroid(image))
+
+    (outline_alpha, outline_x, outline_y), (text_alpha, text_x, text_y) = images
+    # hinting of small text may differ slightly, but not the position of the glyph
+    assert outline_alpha == pytest.approx(text_alpha, rel=0.05)
+    assert outline_x == pytest.approx(text_x, abs=0.25)
+    assert outline_y == pytest.approx(text_y, abs=0.25)
+
+
+def test_pixmap_cache_key(full_store, qtbot):
+    size = QSize(40, 40)
+    normal = (QIcon.Mode.Normal, QIcon.State.Off)
+    key = icon(TEST_GLYPHKEY, color="red")._engine._pmcKey(size, *normal)
+    # identical icons share their cached pixmaps...
+    icn = icon(TEST_GLYPHKEY, color=(255, 0, 0))
+    assert icn._engine._pmcKey(size, *normal) == key
+    icn.pixmap(size)
+    assert QPixmapCache.find(key) is not None
+
+    # ... but any difference in rendering options gives a different key
+    keys = {
+        key,
+        icon(TEST_GLYPHKEY, color="blue")._engine._pmcKey(size, *normal),
+        icon(TEST_GLYPHKEY, color="red", opacity=0.5)._engine._pmcKey(size, *normal),
+        icon(TEST_GLYPHKEY, color="red", scale_factor=1)._engine._pmcKey(size, *normal),
+        icon(
+            TEST_GLYPHKEY, color="red", transform=QTransform().rotate(90)
+        )._engine._pmcKey(size, *normal),
+        icn._engine._pmcKey(QSize(20, 20), *normal),
+        icn._engine._pmcKey(size, *normal, dpr=2),
+        icn._engine._pmcKey(size, QIcon.Mode.Disabled, QIcon.State.Off),
+    }
+    assert len(keys) == 8
+
+    # options added to a state only change the key of that state
+    icn.addState(QIcon.State.On, color="green")
+    assert icn._engine._pmcKey(size, *normal) == key
+    assert icn._engine._pmcKey(size, QIcon.Mode.Normal, QIcon.State.On) != key
+
+    # animated icons are cached per frame
+    btn = QPushButton()
+    qtbot.addWidget(btn)
+    anim = spin(btn)
+    anim_key = icon(TEST_GLYPHKEY, animation=anim)._engine._pmcKey(size, *normal)
+    assert anim_key.endswith("_0deg")
+    assert anim_key[: -len("_0deg")] == icon(TEST_GLYPHKEY)._engine._pmcKey(
+        size, *normal
+    )
+
+
+def test_icon_interning(full_store, qtbot):
+    info = iconCacheInfo()
+    icn = icon(TEST_GLYPHKEY, color="red", states={"disabled": {"color": "gray"}})
+    same = icon(
+        TEST_GLYPHKEY, color=(255, 0, 0), states={"disabled": IconOpts(color="gray")}
+    )
+    # each call returns a new icon, sharing the engine of equivalent icons
+    assert same is not icn
+    assert same._engine is icn._engine
+    assert same.cacheKey() == icn.cacheKey()
+    assert icon(TEST_GLYPHKEY, color="blue")._engine is not icn._engine
+    assert icon(TEST_GLYPHKEY, color="red")._engine is not icn._engine
+    new_info = iconCacheInfo()
+    assert new_info.hits == info.hits + 1
+    assert new_info.misses == info.misses + 3
+
+    # modifying an icon doesn't modify the icons it shares its engine with
+    btn = QPushButton()
+    qtbot.addWidget(btn)
+    btn.setIcon(same)
+    icn.addState(QIcon.State.On, color="green")
+    assert icn._engine is not same._engine
+    assert QIcon.State.On in icn._engine._opts
+    assert QIcon.State.On not in same._engine._opts
+    assert btn.icon().cacheKey() == same.cacheKey()
+    other = icon(TEST_GLYPHKEY, color="red", states={"disabled": {"color": "gray"}})
+    assert other._engine is same._engine
+    pixmap = QPixmap(10, 10)
+    other.addPixmap(pixmap)
+    assert other.cacheKey() != same.cacheKey()
+    other.addState(QIcon.State.On, color="green")
+    assert QIcon.State.On not in same._engine._opts
+
+    # animated icons are never shared
+    anim = spin(btn)
+    icn1 = icon(TEST_GLYPHKEY, animation=anim)
+    assert icn1._engine is not icon(TEST_GLYPHKEY, animation=anim)._engine
+
+    # icons are only kept alive by their users
+    del icn, same, other, btn
+    gc.collect()
+    assert iconCacheInfo().currsize < new_info.currsize
+
+
+def test_shared_animation_clock(full_store, qtbot):
+    from superqt.fonticon._animations import _AnimationClock
+
+    clock = _AnimationClock.instance()
+    btns, timers = [], []
+    for anim_type in (spin, spin, pulse):
+        btn = QPushButton()
+        qtbot.addWidget(btn)
+        anim = anim_type(btn)
+        btn.setIcon(icon(TEST_GLYPHKEY, animation=anim))
+        btn.show()
+        btns.append(btn)
+        timers.append(anim.timer)
+    qtbot.waitUntil(lambda: all(t.isActive() for t in timers))
+    # a single timer drives all animations, at the shortest interval
+    assert clock.isActive()
+    assert set(timers) <= set(clock._running)
+    assert clock._timer.interval() == 10
+
+    # animations pause when their icons aren't painted anymore...
+    for btn in btns:
+        btn.hide()
+    qtbot.waitUntil(lambda: not any(t.isActive() for t in timers))
+    # (wait for the animations of other tests to pause as well)
+    qtbot.waitUntil(lambda: not clock.isActive(), timeout=3000)
+
+    # ...and resume when they are
+    btns[2].show()
+    qtbot.waitUntil(lambda: timers[2].isActive())
+    assert clock._timer.interval() == 200
+    btns[2].hide()
+
+
+def test_animation_timer(qtbot):
+    from superqt.fonticon._animations import _AnimationClock
+
+    clock = _AnimationClock.instance()
+    timer = spin(None).timer
+    assert isinstance(timer, QTimer)
+    assert timer.interval() == 10
+    assert not timer.isActive()
+    assert timer.remainingTime() == timer.timerId() == -1
+
+    # the timer is driven by the shared clock
+    timer.start(50)
+    assert timer.interval() == 50
+    assert timer.isActive()
+    assert timer in clock._running
+    assert timer.timerId() == clock._timer.timerId() != -1
+    assert 0 <= timer.remainingTime() <= 50
+    timer.stop()
+    assert not timer.isActive()
+    assert timer not in clock._running
+
+    timer.setSingleShot(True)
+    with qtbot.waitSignal(timer.timeout):
+        timer.start(20)
+    assert not timer.isActive()
+
+
+def test_animation_repaints_icon_rect(full_store, qtbot):
+    class Widget(QWidget):
+        def paintEvent(self, event):
+            painter = QPainter(self)
+            self.icn.paint(painter, QRect(10, 10, 20, 20))
+
+    wdg = Widget()
+    qtbot.addWidget(wdg)
+    anim = spin(wdg)
+    wdg.icn = icon(TEST_GLYPHKEY, animation=anim)
+    wdg.resize(200, 200)
+    wdg.show()
+    qtbot.waitUntil(lambda: wdg in anim._dirty)
+    (rect,) = anim._dirty[wdg]
+    assert rect.contains(QRect(10, 10, 20, 20))
+    assert rect.width() < 40
+    wdg.hide()
+
+
+def test_animation_frame_cache(full_store, qtbot):
+    from superqt.fonticon import _animations
+
+    btn = QPushButton()
+    qtbot.addWidget(btn)
+    anim = spin(btn)
+    icn = icon(TEST_GLYPHKEY, animation=anim)
+    _animations._FRAMES.clear()
+    try:
+        frame = icn.pixmap(40, 40)
+        assert icn.pixmap(40, 40).cacheKey() == frame.cacheKey()
+        anim._angle += 1
+        assert icn.pixmap(40, 40).cacheKey() != frame.cacheKey()
+        anim._angle += 359
+        assert icn.pixmap(40, 40).cacheKey() == frame.cacheKey()
+        assert anim.timer.isActive()
+
+        # frames are rotated versions of the still icon
+        still = icon(TEST_GLYPHKEY).pixmap(40, 40).toImage()
+        assert frame.toImage() == still
+        anim._angle = 90
+        assert icn.pixmap(40, 40).toImage() != still
+
+        # painting with a painter draws the cached frames as well
+        pixmap = QPixmap(40, 40)
+        painter = QPainter(pixmap)
+        icn.paint(painter, QRect(0, 0, 40, 40))
+        painter.end()
+        assert any(k.endswith("90deg_frame") for k in _animations._FRAMES)
+
+        setAnimationFrameCache(angle_step=60)
+        assert not _animations._FRAMES
+        anim._angle = 100
+        assert icn._engine._pmcKey(QSize(40, 40), QIcon.Mode.Normal, QIcon.State.Off)
+        assert anim._frame() == 120
+        setAnimationFrameCache(max_frames=1)
+        for angle in range(0, 360, 60):
+            anim._angle = angle
+            icn.pixmap(40, 40)
+        assert len(_animations._FRAMES) == 1
+
+        # frames are rendered from the font when the cache is disabled
+        setAnimationFrameCache(max_frames=0)
+        assert not _animations._FRAMES
+        assert anim._frame() is None
+        assert not icn._engine._pmcKey(
+            QSize(40, 40), QIcon.Mode.Normal, QIcon.State.Off
+        )
+        icn.pixmap(40, 40)
+        assert not _animations._FRAMES
+    finally:
+        setAnimationFrameCache(max_frames=720, angle_step=1)
+
+
+@pytest.mark.parametrize("transform", [None, QTransform().translate(30, 10)])
+def test_animation_frame_not_clipped(full_store, qtbot, transform):
+    from superqt.fonticon import _animations
+
+    btn = QPushButton()
+    qtbot.addWidget(btn)
+    anim = spin(btn)
+    icn = icon(TEST_GLYPHKEY, animation=anim, transform=transform)
+    anim._angle = 45
+
+    def _paint() -> QImage:
+        image = QImage(100, 100, QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(image)
+        icn.paint(painter, QRect(20, 20, 60, 60))
+        painter.end()
+        return image
+
+    # cached frames look like the glyph rotated (and transformed) while painting
+    _animations._FRAMES.clear()
+    try:
+        cached = _paint()
+        setAnimationFrameCache(max_frames=0)
+        assert _paint() == cached
+    finally:
+        setAnimationFrameCache(max_frames=720, angle_step=1)
+
+
+def test_glyph_atlas(full_store, tmp_path, monkeypatch):
+    atlas = GlyphAtlas.render(
+        [TEST_GLYPHKEY, f"{TEST_PREFIX}.{TEST_CHAR}"],
+        colors=[None, "red"],
+        sizes=[16, 32],
+    )
+    assert len(atlas.keys()) == 2
+    expected = icon(TEST_GLYPHKEY, color="red").pixmap(32, 32).toImage()
+    atlas.save(tmp_path / "icons.png")
+    assert (tmp_path / "icons.json").exists()
+
+    # icons are loaded back without any font
+    full_store.clear()
+    monkeypatch.setattr(QFontIconStore, "key2glyph", None)
+    loaded = GlyphAtlas.load(tmp_path / "icons.json")
+    assert loaded.keys() == atlas.keys()
+    assert loaded.pixmap().size() == atlas.pixmap().size()
+    icn = loaded.icon(TEST_GLYPHKEY, color=(255, 0, 0))
+    assert [s.width() for s in icn.availableSizes()] == [16, 32]
+    image = icn.pixmap(32, 32).toImage()
+    assert image.convertToFormat(expected.format()) == expected
+    assert not icn.pixmap(20, 20).isNull()
+    assert not icn.pixmap(20, 20, QIcon.Mode.Disabled).isNull()
+
+    with pytest.raises(KeyError, match="not in the atlas"):
+        loaded.icon(TEST_GLYPHKEY, color="blue")
+
+
+_ATLAS_HIDPI_SCRIPT = f"""
+from qtpy.QtCore import QSize
+from qtpy.QtGui import QIcon, QImage
+from qtpy.QtWidgets import QApplication
+
+from superqt.fonticon import GlyphAtlas
+from superqt.fonticon._qfont_icon import QFontIconStore
+
+app = QApplication([])
+assert app.devicePixelRatio() == 2
+QFontIconStore.instance().addFont(
+    {str(FONT_FILE)!r}, {TEST_PREFIX!r}, {{{TEST_CHARNAME!r}: {TEST_CHAR!r}}}
+)
+normal = (QIcon.Mode.Normal, QIcon.State.Off)
+for dpr in (1, 2):
+    atlas = GlyphAtlas.render([{TEST_GLYPHKEY!r}], sizes=[32], device_pixel_ratio=dpr)
+    rect = atlas._glyphs[{TEST_GLYPHKEY!r}][""][32]
+    assert rect.size() == QSize(32 * dpr, 32 * dpr), rect
+    # the cell holds the glyph rendered at full size
+    engine = QFontIconStore.instance().icon({TEST_GLYPHKEY!r})._engine
+    expected = engine.scaledPixmap(QSize(32, 32), *normal, dpr).toImage()
+    cell = atlas.pixmap().toImage().copy(rect)
+    assert cell == expected.convertToFormat(cell.format())
+
+# icons of the atlas are drawn at the device pixel ratio of the application
+pixmap = atlas.icon({TEST_GLYPHKEY!r}).pixmap(32, 32)
+assert pixmap.devicePixelRatio() == 2
+assert pixmap.toImage().convertToFormat(cell.format()) == cell
+print("ok")
+"""
+
+
+def test_glyph_atlas_hidpi(tmp_path):
+    env = {**os.environ, "QT_SCALE_FACTOR": "2", "QT_QPA_PLATFORM": "offscreen"}
+    result = subprocess.run(
+        [sys.executable, "-c", _ATLAS_HIDPI_SCRIPT],
+        env=env,
+        capture_output=True,
+        text=True,
+        cwd=tmp_path,
+    )
+    assert result.stdout.strip() == "ok", result.stderr
+
+
+def test_icons(full_store):
+    keys = [TEST_GLYPHKEY, f"{TEST_PREFIX}.{TEST_CHAR}", TEST_GLYPHKEY]
+    states = {"disabled": IconOpts(color="gray"), "on": {"opacity": 0.5}}
+    icns = icons(keys, color="red", states=states, sizes=[16, 24])
+    assert len(icns) == 3
+    assert icns[0]._engine is icns[2]._engine
+    assert icns[0]._engine is icon(TEST_GLYPHKEY, color="red", states=states)._engine
+    opts = icns[1]._engine._opts
+    assert opts[QIcon.State.Off][QIcon.Mode.Disabled].color == "gray"
+    assert opts[QIcon.State.On][QIcon.Mode.Normal].opacity == 0.5
+    assert opts[QIcon.State.On][QIcon.Mode.Normal].color == "red"
+
+    # pixmaps are rendered in advance
+    engine = icns[1]._engine
+    for size in (16, 24):
+        key = engine._pmcKey(QSize(size, size), QIcon.Mode.Normal, QIcon.State.Off)
+        assert QPixmapCache.find(key) is not None
+
+    # all keys are checked before creating any icon
+    info = iconCacheInfo()
+    with pytest.raises(ValueError):
+        icons([f"{TEST_PREFIX}.{TEST_CHAR}", f"{TEST_PREFIX}.smelly"], color="blue")
+    assert iconCacheInfo() == info
+
+
+def test_hidpi_pixmap(full_store):
+    icn = icon(TEST_GLYPHKEY, color="red")
+    normal = (QIcon.Mode.Normal, QIcon.State.Off)
+    pm1 = icn.pixmap(QSize(20, 20), 1.0)
+    pm2 = icn.pixmap(QSize(20, 20), 2.0)
+    assert pm1.size() == QSize(20, 20)
+    assert pm2.size() == QSize(40, 40)
+    assert pm2.devicePixelRatio() == 2
+    # rendered at full resolution, not upscaled
+    upscaled = pm1.scaled(40, 40).toImage()
+    assert pm2.toImage().convertToFormat(upscaled.format()) != upscaled
+
+    # each device pixel ratio is cached separately
+    engine = icn._engine
+    key1 = engine._pmcKey(QSize(20, 20), *normal, 1.0)
+    key2 = engine._pmcKey(QSize(20, 20), *normal, 2.0)
+    assert key1 != key2
+    assert QPixmapCache.find(key1).devicePixelRatio() == 1
+    assert QPixmapCache.find(key2).devicePixelRatio() == 2
+    assert icn.pixmap(QSize(20, 20), 2.0).cacheKey() == pm2.cacheKey()
@@ -1,3 +1,4 @@
+import json
 import sys
 from pathlib import Path
 
@@ -6,6 +7,7 @@ from qtpy.QtGui import QIcon, QPixmap
 
 from superqt.fonticon import _plugins, icon
 from superqt.fonticon._qfont_icon import QFontIconStore
+from superqt.utils._util import cache_dir
 
 FIXTURES = Path(__file__).parent / "fixtures"
 
@@ -26,3 +28,73 @@ def test_plugin(plugin_store):
     assert _plugins.loaded() == {"ico": ["smiley"]}
     assert isinstance(icn, QIcon)
     assert isinstance(icn.pixmap(40, 40), QPixmap)
+
+
+@pytest.fixture
+def clean_manager():
+    mgr = _plugins.FontIconManager
+    yield mgr
+    mgr._PLUGINS.clear()
+    mgr._LOADED.clear()
+    mgr._NAMESPACES.clear()
+    mgr._FONT_FILES.clear()
+    mgr._INDEX_READ = False
+
+
+def _new_process(mgr):
+    """Reset the plugin manager (and the store) as if it was a new process."""
+    QFontIconStore.clear()
+    mgr._PLUGINS.clear()
+    mgr._LOADED.clear()
+    mgr._NAMESPACES.clear()
+    mgr._FONT_FILES.clear()
+    mgr._INDEX_READ = False
+
+
+def test_plugin_index(plugin_store, clean_manager, monkeypatch):
+    _new_process(clean_manager)
+    icon("ico.smiley")
+    index = json.loads((cache_dir() / _plugins._INDEX_FILE).read_text())
+    assert index["plugins"] == {"ico": "fake_plugin:ICO"}
+    assert index["font_files"] == {
+        "ico": str(FIXTURES / "fake_plugin" / "icontest.ttf")
+    }
+
+    # a new process finds plugins and their font files without scanning entry points,
+    # and only loads the plugin when a glyph is first looked up by name
+    _new_process(clean_manager)
+    with monkeypatch.context() as m:
+        m.setattr(_plugins, "entry_points", None)
+        icn = icon("ico.")
+        assert isinstance(icn.pixmap(40, 40), QPixmap)
+        assert not _plugins.loaded()
+        icon("ico.smiley")
+        # glyphs are looked up without converting the plugin to an IconFont
+        assert "ico" in clean_manager._NAMESPACES
+        assert "ico" not in clean_manager._LOADED
+        assert _plugins.loaded() == {"ico": ["smiley"]}
+
+    # the index is not used after distributions are installed or removed
+    _new_process(clean_manager)
+    monkeypatch.setattr(_plugins, "_environment_key", lambda: [])
+    with monkeypatch.context() as m:
+        m.setattr(_plugins, "entry_points", None)
+        with pytest.raises(TypeError):  # tried to scan entry points
+            icon("ico.smiley")
+    icon("ico.smiley")
+    assert (
+        json.loads((cache_dir() / _plugins._INDEX_FILE).read_text())["environment"]
+        == []
+    )
+
+
+def test_plugin_index_opt_in(plugin_store, clean_manager, monkeypatch, tmp_path):
+    # the index is only written to the cache directory set by SUPERQT_CACHE_DIR
+    monkeypatch.delenv("SUPERQT_CACHE_DIR")
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    _new_process(clean_manager)
+    assert cache_dir() is None
+    icon("ico.smiley")
+    _plugins.discover()
+    assert not list(tmp_path.rglob(_plugins._INDEX_FILE))
@@ -1,8 +1,11 @@
+import threading
 from typing import TYPE_CHECKING
+from unittest.mock import patch
 
 import pytest
-from qtpy.QtGui import QIcon
-from qtpy.QtWidgets import QPushButton
+from qtpy.QtCore import QRect, QSize
+from qtpy.QtGui import QIcon, QPainter
+from qtpy.QtWidgets import QPushButton, QWidget
 
 from superqt import QIconifyIcon
 
@@ -21,3 +24,141 @@ def test_qiconify(qtbot: "QtBot", monkeypatch: "pytest.MonkeyPatch") -> None:
     qtbot.addWidget(btn)
     btn.setIcon(icon)
     btn.show()
+
+
+SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="16" height="16">'
+    '<rect width="16" height="16" fill="{}"/></svg>'
+)
+
+
+@pytest.fixture
+def fake_svg_path(monkeypatch: "pytest.MonkeyPatch", tmp_path):
+    """Local stand-in for `pyconify.svg_path`, blocking until `release` is set."""
+    import superqt.iconify
+
+    release = threading.Event()
+    fetched = []
+
+    def svg_path(*key, color=None, flip=None, rotate=None, dir=None):
+        release.wait(5)
+        if key == ("bad:key",):
+            raise OSError("not found")
+        fetched.append((key, threading.current_thread()))
+        path = tmp_path / f"{'-'.join(key).replace(':', '-')}-{color}.svg"
+        path.write_text(SVG.format(color or "black"))
+        return path
+
+    monkeypatch.setattr(superqt.iconify, "svg_path", svg_path)
+    monkeypatch.setattr(superqt.iconify, "_REQUESTS", {})
+    svg_path.release = release
+    svg_path.fetched = fetched
+    return svg_path
+
+
+def test_qiconify_async(qtbot: "QtBot", fake_svg_path) -> None:
+    from superqt.iconify import _REQUESTS
+
+    # returns immediately, with an empty placeholder
+    icon = QIconifyIcon("bi:alarm-fill", color="red", asynchronous=True)
+    icon.addKey("bi:alarm", color="blue", state=QIcon.State.On, asynchronous=True)
+    assert not icon.isNull()
+    img = icon.pixmap(16, 16).toImage()
+    assert img.pixelColor(8, 8).alpha() == 0
+
+    btn = QPushButton()
+    qtbot.addWidget(btn)
+    btn.setIcon(icon)
+    btn.show()
+
+    fake_svg_path.release.set()
+    qtbot.waitUntil(lambda: all(r.done for r in _REQUESTS.values()))
+    # SVGs were fetched in a worker thread
+    assert {key for key, _ in fake_svg_path.fetched} == {
+        ("bi:alarm-fill",),
+        ("bi:alarm",),
+    }
+    assert all(t is not threading.main_thread() for _, t in fake_svg_path.fetched)
+    # ... and are drawn by the icon (and its copies)
+    for icn in (icon, btn.icon()):
+        img = icn.pixmap(16, 16).toImage()
+        assert img.pixelColor(8, 8).name() == "#ff0000"
+        img = icn.pixmap(QSize(16, 16), QIcon.Mode.Normal, QIcon.State.On).toImage()
+        assert img.pixelColor(8, 8).name() == "#0000ff"
+
+    # the same icon is only fetched once
+    QIconifyIcon("bi:alarm-fill", color="red", asynchronous=True)
+    qtbot.wait(10)
+    assert len(fake_svg_path.fetched) == 2
+
+
+def test_qiconify_async_copies(qtbot: "QtBot", fake_svg_path) -> None:
+    from superqt.iconify import _REQUESTS
+
+    icon = QIconifyIcon("bi:alarm-fill", color="red", asynchronous=True)
+    copy = QIcon(icon)
+    # keys added later only affect this icon, not the copies made before
+    icon.addKey("bi:alarm", color="blue", state=QIcon.State.On, asynchronous=True)
+    assert icon.cacheKey() != copy.cacheKey()
+
+    fake_svg_path.release.set()
+    qtbot.waitUntil(lambda: len(_REQUESTS) == 2)
+    qtbot.waitUntil(lambda: all(r.done for r in _REQUESTS.values()))
+    on = (QSize(16, 16), QIcon.Mode.Normal, QIcon.State.On)
+    assert icon.pixmap(*on).toImage().pixelColor(8, 8).name() == "#0000ff"
+    assert copy.pixmap(*on).toImage().pixelColor(8, 8).name() == "#ff0000"
+
+
+def test_qiconify_async_repaint(qtbot: "QtBot", fake_svg_path) -> None:
+    from superqt.iconify import _REQUESTS
+
+    class Widget(QWidget):
+        def paintEvent(self, event):
+            self.icon.paint(QPainter(self), QRect(0, 0, 16, 16))
+
+    btn, other_btn = QPushButton(), QPushButton("other")
+    btn.setIcon(QIconifyIcon("bi:alarm", asynchronous=True))
+    wdg = Widget()
+    wdg.icon = QIconifyIcon("bi:alarm-fill", asynchronous=True)
+    for widget in (btn, other_btn, wdg):
+        qtbot.addWidget(widget)
+        widget.show()
+        qtbot.waitExposed(widget)
+
+    # only the widgets that drew placeholders are repainted
+    with (
+        patch.object(QPushButton, "update") as btn_update,
+        patch.object(Widget, "update") as wdg_update,
+    ):
+        fake_svg_path.release.set()
+        qtbot.waitUntil(lambda: all(r.done for r in _REQUESTS.values()))
+        qtbot.waitUntil(lambda: btn_update.called and wdg_update.called)
+    assert btn_update.call_count == 1
+    assert wdg_update.call_count == 1
+
+
+def test_qiconify_async_error(qtbot: "QtBot", fake_svg_path) -> None:
+    from superqt.iconify import _REQUESTS
+
+    fake_svg_path.release.set()
+    icon = QIconifyIcon("bad:key", asynchronous=True)
+    with pytest.warns(UserWarning, match="Error fetching icon"):
+        # failed requests are dropped, so that they are retried next time
+        qtbot.waitUntil(lambda: not _REQUESTS)
+    # the fallback icon is drawn instead
+    assert icon.availableSizes()
+
+
+def test_qiconify_prefetch(qtbot: "QtBot", fake_svg_path) -> None:
+    from superqt.iconify import _REQUESTS, prefetch
+
+    fake_svg_path.release.set()
+    prefetch(["bi:alarm", ("bi", "bell")], color="red")
+    qtbot.waitUntil(lambda: len(fake_svg_path.fetched) == 2)
+    qtbot.waitUntil(lambda: all(r.done for r in _REQUESTS.values()))
+
+    # prefetched icons are drawn right away
+    icon = QIconifyIcon("bi:alarm", color="red", asynchronous=True)
+    img = icon.pixmap(16, 16).toImage()
+    assert img.pixelColor(8, 8).name() == "#ff0000"
+    assert len(fake_svg_path.fetched) == 2
@@ -1,7 +1,10 @@
+from unittest.mock import patch
+
 import pytest
 from pint import Quantity
 
 from superqt import QQuantity
+from superqt.spinbox import _quantity
 
 
 def test_qquantity(qtbot):
@@ -63,3 +66,48 @@ def test_change_qquantity_value(qtbot):
     assert w.value() == Quantity(0)
     w.setValue(Quantity("1 meter"))
     assert w.value() == Quantity("1 meter")
+
+
+def test_default_registry(qtbot, monkeypatch, tmp_path):
+    monkeypatch.setenv("SUPERQT_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(_quantity, "_UREG", None)
+    QQuantity.preloadUnitRegistry()
+    ureg = _quantity._default_registry()
+    assert _quantity.UREG is ureg
+    # the parsed definitions are cached on disk
+    assert any((tmp_path / "pint").iterdir())
+
+    w = QQuantity(1, "m")
+    qtbot.addWidget(w)
+    assert w.unitRegistry() is ureg
+    assert w.units() == ureg.meter
+
+
+def test_unit_options_cache(qtbot):
+    w1 = QQuantity(1, "m")
+    w2 = QQuantity(2, "km")
+    qtbot.addWidget(w1)
+    qtbot.addWidget(w2)
+    # unit options of the same dimensionality are shared
+    assert w1._unit_options() is w2._unit_options()
+
+    combo = w1.unitsComboBox()
+    with patch.object(
+        w1, "_update_units_combo_choices", wraps=w1._update_units_combo_choices
+    ) as update:
+        # the combo box is only refilled when the dimensionality changes
+        combo.setCurrentText("mm")
+        assert w1.magnitude() == 1000
+        assert w1.units() == w1.unitRegistry().millimeter
+        w1.setValue(3, "km")
+        assert combo.currentText() == "km"
+        update.assert_not_called()
+
+        w1.setValue(3, "s")
+        update.assert_called_once()
+        assert combo.currentText() == "s"
+
+    # conversions with an offset are done by pint
+    w1.setValue(0, "degC")
+    w1.setUnits("°F")
+    assert w1.magnitude() == pytest.approx(32)
@@ -1,4 +1,5 @@
 import os
+import subprocess
 import sys
 from unittest.mock import Mock
 
@@ -172,3 +173,30 @@ def test_exception_context(qtbot, qapp: QApplication) -> None:
     assert isinstance(ctx.dialog, QMessageBox)
     assert ctx.dialog.result() == QMessageBox.StandardButton.Ok
     assert ctx.exception is exc
+
+
+@pytest.mark.parametrize("module", ["superqt", "superqt.utils"])
+def test_lazy_imports(module):
+    """Importing the top-level packages should not import any widget (or Qt)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # lines look like "import time:  self [us] | cumulative | imported package"
+    imported = {
+        line.rsplit("|", 1)[-1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+    assert module in imported
+    for name in ("qtpy", "pygments", "superqt.sliders", "superqt.utils._qthreading"):
+        assert name not in imported
+
+    # ... but all public names are still available
+    mod = __import__(module, fromlist=["__all__"])
+    for name in mod.__all__:
+        if name not in ("QColormapComboBox", "QIconifyIcon", "QQuantity"):
+            assert getattr(mod, name) is not None
+    assert set(mod.__all__) <= set(dir(mod))
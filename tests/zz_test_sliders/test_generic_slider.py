@@ -1,11 +1,29 @@
 import math
 import platform
+import threading
+from unittest.mock import patch
 
 import pytest
 from qtpy.QtCore import QEvent, QPoint, QPointF, Qt
+from qtpy.QtGui import QMouseEvent
 from qtpy.QtWidgets import QStyle, QStyleOptionSlider
 
-from superqt.sliders._generic_slider import _GenericSlider, _sliderValueFromPosition
+from superqt.sliders import (
+    FunctionScale,
+    LinearScale,
+    LogScale,
+    PowerScale,
+    SliderScale,
+    SymLogScale,
+    _generic_slider,
+)
+from superqt.sliders._generic_slider import (
+    SC_HANDLE,
+    _compute_histogram,
+    _GenericSlider,
+    _sliderValueFromPosition,
+)
+from superqt.sliders._scales import _resolve_scale
 
 from ._testutil import _hover_event, _mouse_event, _wheel_event, skip_on_linux_qt6
 
@@ -185,3 +203,210 @@ def test_steps(gslider: _GenericSlider, qtbot):
 )
 def test_slider_value_from_position(args, result):
     assert math.isclose(_sliderValueFromPosition(*args), result)
+
+
+def test_histogram(gslider: _GenericSlider, qtbot):
+    assert gslider.histogram() is None
+    with pytest.raises(ValueError, match="must have length"):
+        gslider.setHistogram([1, 2], [0, 1])
+
+    gslider.setHistogram([1, 3, 2], [0, 33, 66, 99])
+    assert gslider.histogram() == ((1, 3, 2), (0, 33, 66, 99))
+    gslider.grab()
+    cache = gslider._histogram_pixmap_cache
+    assert cache is not None
+
+    # the cached pixmap is reused until the size, range or data change
+    gslider.grab()
+    assert gslider._histogram_pixmap_cache is cache
+    gslider.setRange(10, 50)
+    gslider.grab()
+    assert gslider._histogram_pixmap_cache is not cache
+
+    gslider.clearHistogram()
+    assert gslider.histogram() is None
+    gslider.grab()
+
+
+def test_histogram_data(gslider: _GenericSlider, qtbot):
+    np = pytest.importorskip("numpy")
+    data = np.random.default_rng(0).normal(50, 10, (100, 100))
+    expected, edges = np.histogram(data, bins=16)
+
+    assert gslider.setHistogramData(data, bins=16) is None
+    assert gslider.histogram() == (tuple(expected), tuple(edges))
+
+    gslider.clearHistogram()
+    assert gslider.setHistogramData(data, bins=16, threaded=True) is not None
+    qtbot.waitUntil(lambda: gslider.histogram() is not None)
+    assert gslider.histogram() == (tuple(expected), tuple(edges))
+
+
+def test_histogram_data_deleted_slider(qtbot):
+    np = pytest.importorskip("numpy")
+    slider = _GenericSlider()
+    binning = threading.Event()
+
+    def _slow_histogram(*args):
+        binning.wait(5)
+        return _compute_histogram(*args)
+
+    # results returned after the slider was deleted are dropped
+    with patch.object(_generic_slider, "_compute_histogram", _slow_histogram):
+        worker = slider.setHistogramData(np.arange(100), threaded=True)
+        with qtbot.waitSignal(slider.destroyed):
+            slider.deleteLater()
+        with qtbot.waitSignal(worker.returned):
+            binning.set()
+
+
+def test_allowed_values(gslider: _GenericSlider, qtbot):
+    allowed = [0.5, 1, 1.5, 4, 10, 50, 51]
+    gslider.setAllowedValues(allowed)
+    assert gslider.allowedValues() is allowed
+    assert gslider.minimum() == 0.5
+    assert gslider.maximum() == 51
+
+    gslider.setValue(3)
+    assert gslider.value() == 4
+    gslider.setValue(1.2)
+    assert gslider.value() == 1
+    gslider.setValue(100)
+    assert gslider.value() == 51
+
+    # dragging snaps to the nearest allowed value
+    gslider.setSliderPosition(31)
+    assert gslider.sliderPosition() == 50
+
+    # scrolling moves by index
+    gslider.setValue(1.5)
+    with qtbot.waitSignal(gslider.valueChanged):
+        gslider.wheelEvent(_wheel_event(-120))
+    assert gslider.value() in allowed
+    assert gslider.value() != 1.5
+
+    with pytest.raises(ValueError):
+        gslider.setAllowedValues([])
+
+    gslider.setAllowedValues(None)
+    assert gslider.allowedValues() is None
+    gslider.setValue(3)
+    assert gslider.value() == 3
+
+
+def test_allowed_values_numpy(gslider: _GenericSlider, qtbot):
+    np = pytest.importorskip("numpy")
+    allowed = np.sort(np.random.default_rng(0).uniform(0, 1000, 1_000_000))
+    gslider.setAllowedValues(allowed)
+    gslider.setValue(500)
+    assert gslider.value() in allowed
+    assert abs(gslider.value() - 500) < 0.1
+    assert isinstance(gslider.value(), float)
+
+
+@pytest.mark.parametrize(
+    "scale",
+    [
+        LinearScale(),
+        LogScale(),
+        LogScale(base=2),
+        SymLogScale(linthresh=0.5),
+        PowerScale(0.5),
+        FunctionScale(math.sqrt, lambda x: x**2),
+    ],
+)
+def test_scale_round_trip(scale: SliderScale):
+    values = [0.5, 1, 3, 10, 250.5, 1000]
+    for v in values:
+        assert math.isclose(scale.inverse(scale.forward(v)), v)
+    assert list(scale.forward_many(values)) == [scale.forward(v) for v in values]
+
+
+def test_scale_forward_many_numpy():
+    np = pytest.importorskip("numpy")
+    values = np.array([0.5, 1, 3, 10, 250.5, 1000])
+    for scale in (LogScale(), SymLogScale(), PowerScale(3)):
+        expected = [scale.forward(v) for v in values]
+        np.testing.assert_allclose(scale.forward_many(values), expected)
+    vectorized = FunctionScale(np.log, np.exp, vectorized=True)
+    np.testing.assert_allclose(vectorized.forward_many(values), np.log(values))
+
+
+def test_resolve_scale():
+    assert isinstance(_resolve_scale(None), LinearScale)
+    assert isinstance(_resolve_scale("log"), LogScale)
+    assert isinstance(_resolve_scale("power"), PowerScale)
+    assert isinstance(_resolve_scale((math.exp, math.log)), FunctionScale)
+    with pytest.raises(ValueError, match="Unknown scale"):
+        _resolve_scale("nope")
+    with pytest.raises(TypeError):
+        _resolve_scale(1)  # type: ignore
+    assert LogScale().ticks(0.5, 2000, 1) == [1, 10, 100, 1000]
+
+
+def test_log_scale_slider(gslider: _GenericSlider, qtbot):
+    gslider.setRange(1, 1000)
+    gslider.setScale("log")
+    assert isinstance(gslider.scale(), LogScale)
+
+    # a decade is a third of the groove
+    third = gslider.MAX_DISPLAY / 3
+    assert abs(gslider._to_qinteger_position(10) - third) <= 1
+    assert abs(gslider._to_qinteger_position(100) - 2 * third) <= 1
+
+    # pixels map back through the inverse transform
+    opt = gslider._styleOption
+    style = gslider.style()
+    opt.sliderPosition = 0
+    r0 = style.subControlRect(QStyle.ComplexControl.CC_Slider, opt, SC_HANDLE)
+    opt.sliderPosition = opt.maximum
+    r1 = style.subControlRect(QStyle.ComplexControl.CC_Slider, opt, SC_HANDLE)
+    horizontal = gslider.orientation() == Qt.Orientation.Horizontal
+    mid = (r0.topLeft() + r1.topLeft()) / 2
+    value = gslider._pixelPosToRangeValue(mid.x() if horizontal else mid.y())
+    assert 20 < value < 50  # ~31.6, depending on pixel rounding
+
+    # ticks and histogram follow the scale
+    gslider.setTickPosition(gslider.TickPosition.TicksBelow)
+    gslider.setHistogram([1, 2, 3], [1, 10, 100, 1000])
+    gslider.grab()
+
+    gslider.setScale("linear")
+    assert gslider.scale().linear
+    assert gslider._to_qinteger_position(10) == gslider._to_qinteger_space(9)
+
+
+def test_drag_emission_interval(gslider: _GenericSlider, qtbot):
+    assert gslider.dragEmissionInterval() is None
+    gslider.setDragEmissionInterval(10_000)
+    assert gslider.dragEmissionInterval() == 10_000
+
+    values = []
+    gslider.valueChanged.connect(values.append)
+    gslider._pressedControl = SC_HANDLE
+    gslider.setSliderDown(True)
+    for pos in range(1, 50):
+        gslider.setSliderPosition(pos)
+    # the first move is applied immediately, later ones are coalesced
+    assert values == [1]
+    assert gslider.sliderPosition() == 49
+
+    release = QMouseEvent(
+        QEvent.Type.MouseButtonRelease,
+        QPointF(),
+        QPointF(),
+        Qt.MouseButton.LeftButton,
+        Qt.MouseButton.NoButton,
+        Qt.KeyboardModifier.NoModifier,
+    )
+    gslider.mouseReleaseEvent(release)
+    # the final value is always applied on release
+    assert values == [1, 49]
+    assert gslider.value() == 49
+
+    # outside of a drag, values are applied immediately
+    gslider.setSliderPosition(60)
+    assert values == [1, 49, 60]
+
+    gslider.setDragEmissionInterval(None)
+    assert gslider.dragEmissionInterval() is None
@@ -1,6 +1,6 @@
 from collections.abc import Iterable
 from typing import Any
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -148,3 +148,60 @@ def test_qlabeled_range_slider_large_range_does_not_typeerror(qtbot):
     v = sld.value()
     assert v[0] == 20
     assert v[1] == 60 * 10**9
+
+
+def test_range_slider_labels_reposition_incrementally(qtbot):
+    slider = QLabeledRangeSlider()
+    qtbot.addWidget(slider)
+    slider.resize(400, 60)
+    slider.setRange(0, 100)
+    slider.setValue((10, 50, 90))
+    slider.show()
+    qtbot.waitExposed(slider)
+
+    labels = list(slider._handle_labels)
+    first, last = labels[0].pos(), labels[2].pos()
+    moves = [patch.object(lbl, "move", wraps=lbl.move) for lbl in labels]
+    spies = [m.start() for m in moves]
+    try:
+        slider.setValue((10, 60, 90))
+    finally:
+        for m in moves:
+            m.stop()
+    # only the middle label is moved to follow its handle
+    assert spies[0].call_count == 0
+    assert spies[1].call_count > 0
+    assert spies[2].call_count == 0
+    assert labels[0].pos() == first
+    assert labels[2].pos() == last
+    assert labels[1].value() == 60
+
+    # labels are pooled and reused when the number of handles changes
+    slider.setValue((10, 90))
+    assert slider._handle_labels == labels[:2]
+    assert labels[2].isHidden()
+    slider.setValue((10, 50, 90))
+    assert slider._handle_labels == labels
+    assert labels[2].isVisible()
+    assert [lbl._index for lbl in labels] == [0, 1, 2]
+
+
+def test_slider_label_text_measurement_cache(qtbot):
+    from superqt.sliders._labeled import _cached_format_number, _font_metrics
+
+    sliders = [QLabeledDoubleSlider() for _ in range(3)]
+    for sld in sliders:
+        qtbot.addWidget(sld)
+    labels = [sld._label for sld in sliders]
+    assert _font_metrics(labels[0].font()) is _font_metrics(labels[1].font())
+
+    hits = _cached_format_number.cache_info().hits
+    for sld in sliders:
+        sld.setValue(3.14159)
+    assert _cached_format_number.cache_info().hits > hits
+    assert {lbl.text() for lbl in labels} == {"3.14"}
+    assert all(lbl.size() == labels[0].size() for lbl in labels)
+
+    # zero is formatted with its sign, bypassing the cache
+    assert labels[0]._format_value(-0.0) == "-0.00"
+    assert labels[0]._format_value(0.0) == "0.00"
@@ -2,11 +2,18 @@ import math
 from collections.abc import Iterable
 from itertools import product
 from typing import Any
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 from qtpy.QtCore import QEvent, QPoint, QPointF, Qt
-from qtpy.QtWidgets import QStyle, QStyleOptionSlider
+from qtpy.QtGui import QImage, QPainter
+from qtpy.QtWidgets import (
+    QStyle,
+    QStyleFactory,
+    QStyleOptionSlider,
+    QVBoxLayout,
+    QWidget,
+)
 
 from superqt import QDoubleRangeSlider, QLabeledRangeSlider, QRangeSlider
 
@@ -304,3 +311,202 @@ def test_qrange_slider_large_range_does_not_typeerror(qtbot):
         sld.setRange(0, big)
     assert sld.minimum() == 0
     assert sld.maximum() == big
+
+
+@pytest.mark.parametrize("inverted", [False, True])
+@pytest.mark.parametrize(
+    "orientation", [Qt.Orientation.Horizontal, Qt.Orientation.Vertical]
+)
+def test_many_handles_geometry(orientation, inverted, qtbot):
+    sld = QDoubleRangeSlider(orientation)
+    qtbot.addWidget(sld)
+    sld.resize(300, 300)
+    sld.setInvertedAppearance(inverted)
+    sld.setValue(list(_linspace(0, 99, 40)))
+
+    # handle rects are computed arithmetically, they must match the style
+    opt = sld._styleOption
+    style = sld.style()
+    for i, pos in enumerate(sld._optSliderPositions):
+        opt.sliderPosition = pos
+        expected = style.subControlRect(
+            QStyle.ComplexControl.CC_Slider, opt, QStyle.SubControl.SC_SliderHandle
+        )
+        assert sld._handleRect(i) == expected
+
+    # the bisection hit-test must match a linear scan over all handle rects
+    rects = [sld._handleRect(i) for i in range(len(sld.value()))]
+    horizontal = orientation == Qt.Orientation.Horizontal
+    center = rects[0].center()
+    for px in range(-5, 305):
+        pos = QPoint(px, center.y()) if horizontal else QPoint(center.x(), px)
+        expected = next((i for i, r in enumerate(rects) if r.contains(pos)), None)
+        assert sld._handleIndexAtPos(pos, opt) == expected
+
+    # paints idle handles from the cached pixmap
+    assert len(sld.value()) > sld._HANDLE_PIXMAP_THRESHOLD
+    sld.grab()
+    assert sld._handle_pixmap_cache is not None
+
+
+@pytest.mark.parametrize("style", ["Fusion", "Windows"])
+@pytest.mark.parametrize("orientation", ["Horizontal", "Vertical"])
+def test_handle_pixmap_matches_handles(qtbot, orientation, style):
+    sld = QRangeSlider(getattr(Qt.Orientation, orientation))
+    qtbot.addWidget(sld)
+    qstyle = QStyleFactory.create(style)
+    qstyle.setParent(sld)  # widgets don't own their style
+    sld.setStyle(qstyle)
+    sld.resize(300, 300)
+    sld.setValue(list(range(10, 100, 10)))
+    assert len(sld.value()) > sld._HANDLE_PIXMAP_THRESHOLD
+    # a focused slider, with one handle pressed and another hovered
+    sld._pressedControl, sld._pressedIndex = QStyle.SubControl.SC_SliderHandle, 3
+    sld._hoverControl, sld._hoverIndex = QStyle.SubControl.SC_SliderHandle, 5
+
+    def _render() -> QImage:
+        opt = sld._styleOption
+        # focused by keyboard (which decorates handles with a focus frame)
+        opt.state |= (
+            QStyle.StateFlag.State_HasFocus | QStyle.StateFlag.State_KeyboardFocusChange
+        )
+        image = QImage(sld.size(), QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(image)
+        sld._paint(painter, opt)
+        painter.end()
+        return image
+
+    # idle handles blitted from the pixmap look like handles drawn one by one
+    with_pixmap = _render()
+    assert sld._handle_pixmap_cache is not None
+    sld._HANDLE_PIXMAP_THRESHOLD = len(sld.value())
+    assert _render() == with_pixmap
+
+
+def test_positions_sorted_flag(qtbot):
+    sld = QRangeSlider(Qt.Orientation.Horizontal)
+    qtbot.addWidget(sld)
+    sld.setValue([10, 20, 30])
+    assert sld._positions_sorted
+
+    # hit-testing uses the flag, rather than checking the positions each time
+    with patch("superqt.sliders._generic_range_slider._is_sorted") as is_sorted:
+        sld._getControlAtPos(QPoint(5, 5))
+    is_sorted.assert_not_called()
+
+    sld._setPosition([30, 10, 20])
+    assert not sld._positions_sorted
+    assert sld._getControlAtPos(QPoint(0, 5)) == (QStyle.SubControl.SC_SliderHandle, 0)
+    sld._setPosition([10, 20, 30])
+    assert sld._positions_sorted
+    sld.setSliderPosition(25, 0)
+    assert sld._positions_sorted
+
+
+def test_range_slider_allowed_values(qtbot):
+    sld = QDoubleRangeSlider()
+    qtbot.addWidget(sld)
+    allowed = [0, 1, 2, 3, 5, 8, 13, 21]
+    sld.setAllowedValues(allowed)
+    sld.setValue((2.6, 12))
+    assert sld.value() == (3, 13)
+
+    # handles cannot share an allowed value
+    sld.setSliderPosition(20, 0)
+    assert sld.sliderPosition() == (8, 13)
+
+    # scrolling moves all handles by whole indices, keeping them in bounds
+    sld._offsetAllIndices(5)
+    assert sld.sliderPosition() == (13, 21)
+    sld._offsetAllIndices(-1)
+    assert sld.sliderPosition() == (8, 13)
+
+
+def test_range_slider_array_mode(qtbot):
+    np = pytest.importorskip("numpy")
+
+    sld = QRangeSlider()
+    qtbot.addWidget(sld)
+    sld.setRange(0, 100)
+    sld.setArrayMode()
+    assert sld.arrayMode()
+    mock = Mock()
+    sld.valueChanged.connect(mock)
+
+    sld.setValue(np.array([5.4, 50, 300]))
+    assert isinstance(sld.value(), np.ndarray)
+    np.testing.assert_array_equal(sld.value(), [5, 50, 100])
+    # signals keep emitting tuples
+    mock.assert_called_once_with((5, 50, 100))
+
+    # setting all positions keeps the handles in order, one step apart
+    sld.setSliderPosition([60, 10, 120])
+    np.testing.assert_array_equal(sld.sliderPosition(), [60, 61, 100])
+    sld.setSliderPosition([99, 99, 99])
+    np.testing.assert_array_equal(sld.sliderPosition(), [98, 99, 100])
+
+    sld.setAllowedValues(np.arange(0, 101, 10))
+    sld.setSliderPosition([33, 33, 33])
+    np.testing.assert_array_equal(sld.value(), [30, 40, 50])
+
+    sld._offsetAllPositions(100)
+    np.testing.assert_array_equal(sld.value(), [80, 90, 100])
+
+    sld.setArrayMode(False)
+    assert sld.value() == (80, 90, 100)
+
+
+@pytest.mark.parametrize("array_mode", [True, False])
+def test_range_slider_batch_updates(qtbot, array_mode):
+    sld = QRangeSlider()
+    qtbot.addWidget(sld)
+    sld.setRange(0, 100)
+    sld.setValue([10, 20, 30, 40])
+    if array_mode:
+        pytest.importorskip("numpy")
+        sld.setArrayMode()
+    mock = Mock()
+    sld.valueChanged.connect(mock)
+
+    with sld.batchUpdates():
+        for i, val in enumerate((15, 25, 35, 45)):
+            sld.setSliderPosition(val, i)
+        mock.assert_not_called()
+    mock.assert_called_once_with((15, 25, 35, 45))
+
+    mock.reset_mock()
+    with sld.batchUpdates():
+        sld.setValue([15, 25, 35, 45])
+    mock.assert_not_called()
+
+
+def test_range_slider_stylesheet_cache(qtbot):
+    from superqt.sliders._range_style import _cached_brush, _parse_stylesheet
+
+    parent = QWidget()
+    qtbot.addWidget(parent)
+    layout = QVBoxLayout(parent)
+    sliders = [QRangeSlider(Qt.Orientation.Horizontal) for _ in range(3)]
+    for sld in sliders:
+        layout.addWidget(sld)
+    parent.show()
+
+    misses = _parse_stylesheet.cache_info().misses
+    parent.setStyleSheet("QSlider::groove:horizontal {height: 7px;}")
+    for sld in sliders:
+        assert sld._style.horizontal_thickness == 7
+        assert sld._style.has_stylesheet
+    # all sliders share the same stylesheet text, which is parsed once
+    assert _parse_stylesheet.cache_info().misses == misses + 1
+
+    sld = sliders[0]
+    sld._style.brush_active = sld._style.brush_inactive = "rgb(10, 20, 30)"
+    brush = sld._style.brush(sld._styleOption)
+    assert brush.color().getRgb()[:3] == (10, 20, 30)
+    hits = _cached_brush.cache_info().hits
+    assert sld._style.brush(sld._styleOption) == brush
+    assert _cached_brush.cache_info().hits == hits + 1
+    # the returned brush is a copy: modifying it doesn't affect the cache
+    brush.setColor(Qt.GlobalColor.red)
+    assert sld._style.brush(sld._styleOption).color().getRgb()[:3] == (10, 20, 30)
@@ -0,0 +1,94 @@
+from unittest.mock import patch
+
+from qtpy.QtCore import Qt
+from qtpy.QtGui import QStandardItem, QStandardItemModel
+from qtpy.QtWidgets import QTableView
+
+from superqt import QRangeSliderItemDelegate, QSliderItemDelegate
+from superqt.sliders import QDoubleRangeSlider, QDoubleSlider
+
+
+def _view(qtbot) -> QTableView:
+    model = QStandardItemModel(100, 2)
+    for row in range(100):
+        value, low_high = QStandardItem(), QStandardItem()
+        value.setData(row, Qt.ItemDataRole.EditRole)
+        low_high.setData((row / 2, row), Qt.ItemDataRole.EditRole)
+        model.setItem(row, 0, value)
+        model.setItem(row, 1, low_high)
+    view = QTableView()
+    qtbot.addWidget(view)
+    view.setModel(model)
+    view.setItemDelegateForColumn(0, QSliderItemDelegate(view))
+    view.setItemDelegateForColumn(1, QRangeSliderItemDelegate(view))
+    view.resize(400, 300)
+    return view
+
+
+def test_slider_delegate_paint(qtbot):
+    view = _view(qtbot)
+    view.show()
+    qtbot.waitExposed(view)
+    view.grab()
+
+    # painting doesn't create any slider widget in the view
+    assert not view.findChildren(QDoubleSlider)
+    assert not view.findChildren(QDoubleRangeSlider)
+    for col in range(2):
+        delegate = view.itemDelegateForColumn(col)
+        assert delegate._template is not None
+        assert not delegate._template.isVisible()
+
+
+def test_slider_delegate_paint_no_render(qtbot):
+    view = _view(qtbot)
+    view.show()
+    qtbot.waitExposed(view)
+    empty = view.grab().toImage()
+
+    # cells are drawn with the view's painter, the template is never rendered
+    with (
+        patch.object(QDoubleSlider, "render") as render,
+        patch.object(QDoubleSlider, "setPalette") as set_palette,
+        patch.object(QDoubleRangeSlider, "render") as range_render,
+    ):
+        image = view.grab().toImage()
+    render.assert_not_called()
+    set_palette.assert_not_called()
+    range_render.assert_not_called()
+    assert image == empty
+
+    # the slider of a cell is redrawn when its value changes
+    view.model().setData(view.model().index(0, 0), 99, Qt.ItemDataRole.EditRole)
+    assert view.grab().toImage() != empty
+
+
+def test_slider_delegate_edit(qtbot):
+    view = _view(qtbot)
+    view.show()
+    model = view.model()
+
+    index = model.index(3, 0)
+    view.edit(index)
+    (editor,) = view.findChildren(QDoubleSlider)
+    assert editor.value() == 3
+    editor.setValue(42.4)
+    # int model data stays int
+    assert model.data(index, Qt.ItemDataRole.EditRole) == 42
+    # ... and is rounded rather than truncated
+    editor.setValue(42.7)
+    assert model.data(index, Qt.ItemDataRole.EditRole) == 43
+    view.closeEditor(editor, QSliderItemDelegate.EndEditHint.NoHint)
+
+    index = model.index(3, 1)
+    view.edit(index)
+    (editor,) = view.findChildren(QDoubleRangeSlider)
+    assert editor.value() == (1.5, 3)
+    editor.setValue((10.5, 20.6))
+    assert model.data(index, Qt.ItemDataRole.EditRole) == (10.5, 21)
+
+    delegate = view.itemDelegateForColumn(0)
+    delegate.setRange(10, 50)
+    assert (delegate.minimum(), delegate.maximum()) == (10, 50)
+    delegate.setOrientation(Qt.Orientation.Vertical)
+    assert delegate.orientation() == Qt.Orientation.Vertical